@@ -19,6 +19,8 @@
                                                         |::.|     CrowdStrike Falcon      |::.|
                                                         `---' OAuth2 API SDK for Python 3 `---'
 """
+from importlib import import_module
+from typing import Any, Dict, List, TYPE_CHECKING
 from ._version import _VERSION, _MAINTAINER, _AUTHOR, _AUTHOR_EMAIL
 from ._version import _CREDITS, _DESCRIPTION, _TITLE, _PROJECT_URL
 from ._version import _DOCS_URL, _KEYWORDS, version
@@ -27,10 +29,31 @@ from ._auth_object import (
     BearerToken,
     FalconInterface,
     UberInterface,
-    InterfaceConfiguration
+    InterfaceConfiguration,
+    ConnectionPool,
+    RateLimiter,
+    RetryPolicy,
+    ResponseCache,
+    TokenRefresher,
+    SharedToken,
+    TokenRegistry,
+    TOKEN_REGISTRY
     )
-from ._service_class import BaseServiceClass, ServiceClass
-from ._util import confirm_base_region, confirm_base_url
+from ._service_class import (
+    BaseServiceClass,
+    ServiceClass,
+    AsyncServiceClass,
+    Paginator,
+    ParallelPaginator,
+    DetailsPipeline,
+    BulkDispatcher,
+    BulkResult,
+    ShardedScan,
+    PageSizeTuner,
+    FileDownloader,
+    DownloadResult
+    )
+from ._util import confirm_base_region, confirm_base_url, JSONCodec, set_json_codec
 from ._constant import (
     MAX_DEBUG_RECORDS,
     ALLOWED_METHODS,
@@ -79,6 +102,7 @@ from ._error import (
 from ._result import (
     Result,
     ExpandedResult,
+    StreamedResult,
     BaseDictionary,
     BaseResource,
     Resources,
@@ -105,121 +129,266 @@ from ._ngsiem import (
     SessionManager
 )
 from ._helper import random_string, Indicator, Color, find_operation
-from .admission_control_policies import AdmissionControlPolicies
-from .alerts import Alerts
-from .api_integrations import APIIntegrations
-from .api_complete import APIHarness, APIHarnessV2
-from .aspm import ASPM
-from .cao_hunting import CAOHunting
-from .case_management import CaseManagement
-from .certificate_based_exclusions import CertificateBasedExclusions
-from .cloud_aws_registration import CloudAWSRegistration
-from .cloud_azure_registration import CloudAzureRegistration
-from .cloud_google_cloud_registration import CloudGoogleCloudRegistration
-from .cloud_oci_registration import CloudOCIRegistration
-from .cloud_policies import CloudPolicies
-from .cloud_security import CloudSecurity
-from .cloud_security_assets import CloudSecurityAssets
-from .cloud_security_compliance import CloudSecurityCompliance
-from .cloud_security_detections import CloudSecurityDetections
-from .cloud_snapshots import CloudSnapshots
-from .container_image_compliance import ContainerImageCompliance, ComplianceAssessments
-from .configuration_assessment_evaluation_logic import ConfigurationAssessmentEvaluationLogic
-from .configuration_assessment import ConfigurationAssessment
-from .container_alerts import ContainerAlerts
-from .container_detections import ContainerDetections
-from .container_images import ContainerImages
-from .container_packages import ContainerPackages
-from .container_vulnerabilities import ContainerVulnerabilities
-from .correlation_rules import CorrelationRules
-from .correlation_rules_admin import CorrelationRulesAdmin
-from .cloud_connect_aws import CloudConnectAWS
-from .content_update_policies import ContentUpdatePolicies
-from .cspm_registration import CSPMRegistration
-from .custom_ioa import CustomIOA
-from .custom_storage import CustomStorage
-from .d4c_registration import D4CRegistration
-from .data_protection_configuration import DataProtectionConfiguration
-from .delivery_settings import DeliverySettings
-from .deployments import Deployments
-from .detects import Detects
-from .device_content import DeviceContent
-from .device_control_policies import DeviceControlPolicies
-from .discover import Discover
-from .downloads import Downloads
-from .drift_indicators import DriftIndicators
-from .event_streams import EventStreams
-from .exposure_management import ExposureManagement
-from .faas_execution import FaaSExecution
-from .falcon_complete_dashboard import CompleteDashboard
-from .falcon_container import FalconContainer
-from .falconx_sandbox import FalconXSandbox
-from .fdr import FDR
-from .filevantage import FileVantage
-from .firewall_management import FirewallManagement
-from .firewall_policies import FirewallPolicies
-from .foundry_logscale import FoundryLogScale
-from .host_group import HostGroup
-from .hosts import Hosts
-from .host_migration import HostMigration
-from .identity_protection import IdentityProtection
-from .image_assessment_policies import ImageAssessmentPolicies
-from .incidents import Incidents
-from .intelligence_indicator_graph import IntelligenceIndicatorGraph
-from .installation_tokens import InstallationTokens
-from .intel import Intel
-from .intelligence_feeds import IntelligenceFeeds
-from .ioa_exclusions import IOAExclusions
-from .ioc import IOC
-from .iocs import Iocs
-from .it_automation import ITAutomation, F4IT
-from .kubernetes_container_compliance import KubernetesContainerCompliance
-from .kubernetes_protection import KubernetesProtection
-from .malquery import MalQuery
-from .message_center import MessageCenter
-from .ml_exclusions import MLExclusions
-from .mobile_enrollment import MobileEnrollment
-from .mssp import FlightControl
-from .network_scan_global_configs import NetworkScanGlobalConfigs
-from .network_scan_networks import NetworkScanNetworks
-from .network_scan_scan_run_reports import NetworkScanScanRunReports
-from .network_scan_scan_runs import NetworkScanScanRuns
-from .network_scan_scanners import NetworkScanScanners
-from .network_scan_scans import NetworkScanScans
-from .network_scan_templates import NetworkScanTemplates
-from .network_scan_zones import NetworkScanZones
-from .network_scan import NetworkScan
-from .ngsiem import NGSIEM
-from .oauth2 import OAuth2
-from .ods import ODS
-from .prevention_policy import PreventionPolicy, PreventionPolicies
-from .quarantine import Quarantine
-from .quick_scan import QuickScan
-from .quick_scan_pro import QuickScanPro
-from .real_time_response_admin import RealTimeResponseAdmin
-from .real_time_response_audit import RealTimeResponseAudit
-from .real_time_response import RealTimeResponse
-from .recon import Recon
-from .report_executions import ReportExecutions
-from .response_policies import ResponsePolicies
-from .saas_security import SaasSecurity
-from .sample_uploads import SampleUploads
-from .scheduled_reports import ScheduledReports
-from .sensor_download import SensorDownload
-from .sensor_update_policy import SensorUpdatePolicy, SensorUpdatePolicies
-from .sensor_usage import SensorUsage
-from .sensor_visibility_exclusions import SensorVisibilityExclusions
-from .serverless_exports import ServerlessExports
-from .serverless_vulnerabilities import ServerlessVulnerabilities
-from .spotlight_vulnerabilities import SpotlightVulnerabilities
-from .spotlight_vulnerability_metadata import SpotlightVulnerabilityMetadata
-from .spotlight_evaluation_logic import SpotlightEvaluationLogic
-from .tailored_intelligence import TailoredIntelligence
-from .threatgraph import ThreatGraph
-from .unidentified_containers import UnidentifiedContainers
-from .user_management import UserManagement
-from .workflows import Workflows
-from .zero_trust_assessment import ZeroTrustAssessment
+if TYPE_CHECKING:
+    # Service Classes are imported directly for static analysis tools.
+    from .admission_control_policies import AdmissionControlPolicies
+    from .alerts import Alerts
+    from .api_integrations import APIIntegrations
+    from .api_complete import APIHarness, APIHarnessV2
+    from .aspm import ASPM
+    from .cao_hunting import CAOHunting
+    from .case_management import CaseManagement
+    from .certificate_based_exclusions import CertificateBasedExclusions
+    from .cloud_aws_registration import CloudAWSRegistration
+    from .cloud_azure_registration import CloudAzureRegistration
+    from .cloud_google_cloud_registration import CloudGoogleCloudRegistration
+    from .cloud_oci_registration import CloudOCIRegistration
+    from .cloud_policies import CloudPolicies
+    from .cloud_security import CloudSecurity
+    from .cloud_security_assets import CloudSecurityAssets
+    from .cloud_security_compliance import CloudSecurityCompliance
+    from .cloud_security_detections import CloudSecurityDetections
+    from .cloud_snapshots import CloudSnapshots
+    from .container_image_compliance import ContainerImageCompliance, ComplianceAssessments
+    from .configuration_assessment_evaluation_logic import ConfigurationAssessmentEvaluationLogic
+    from .configuration_assessment import ConfigurationAssessment
+    from .container_alerts import ContainerAlerts
+    from .container_detections import ContainerDetections
+    from .container_images import ContainerImages
+    from .container_packages import ContainerPackages
+    from .container_vulnerabilities import ContainerVulnerabilities
+    from .correlation_rules import CorrelationRules
+    from .correlation_rules_admin import CorrelationRulesAdmin
+    from .cloud_connect_aws import CloudConnectAWS
+    from .content_update_policies import ContentUpdatePolicies
+    from .cspm_registration import CSPMRegistration
+    from .custom_ioa import CustomIOA
+    from .custom_storage import CustomStorage
+    from .d4c_registration import D4CRegistration
+    from .data_protection_configuration import DataProtectionConfiguration
+    from .delivery_settings import DeliverySettings
+    from .deployments import Deployments
+    from .detects import Detects
+    from .device_content import DeviceContent
+    from .device_control_policies import DeviceControlPolicies
+    from .discover import Discover
+    from .downloads import Downloads
+    from .drift_indicators import DriftIndicators
+    from .event_streams import EventStreams
+    from .exposure_management import ExposureManagement
+    from .faas_execution import FaaSExecution
+    from .falcon_complete_dashboard import CompleteDashboard
+    from .falcon_container import FalconContainer
+    from .falconx_sandbox import FalconXSandbox
+    from .fdr import FDR
+    from .filevantage import FileVantage
+    from .firewall_management import FirewallManagement
+    from .firewall_policies import FirewallPolicies
+    from .foundry_logscale import FoundryLogScale
+    from .host_group import HostGroup
+    from .hosts import Hosts
+    from .host_migration import HostMigration
+    from .identity_protection import IdentityProtection
+    from .image_assessment_policies import ImageAssessmentPolicies
+    from .incidents import Incidents
+    from .intelligence_indicator_graph import IntelligenceIndicatorGraph
+    from .installation_tokens import InstallationTokens
+    from .intel import Intel
+    from .intelligence_feeds import IntelligenceFeeds
+    from .ioa_exclusions import IOAExclusions
+    from .ioc import IOC
+    from .iocs import Iocs
+    from .it_automation import ITAutomation, F4IT
+    from .kubernetes_container_compliance import KubernetesContainerCompliance
+    from .kubernetes_protection import KubernetesProtection
+    from .malquery import MalQuery
+    from .message_center import MessageCenter
+    from .ml_exclusions import MLExclusions
+    from .mobile_enrollment import MobileEnrollment
+    from .mssp import FlightControl
+    from .network_scan_global_configs import NetworkScanGlobalConfigs
+    from .network_scan_networks import NetworkScanNetworks
+    from .network_scan_scan_run_reports import NetworkScanScanRunReports
+    from .network_scan_scan_runs import NetworkScanScanRuns
+    from .network_scan_scanners import NetworkScanScanners
+    from .network_scan_scans import NetworkScanScans
+    from .network_scan_templates import NetworkScanTemplates
+    from .network_scan_zones import NetworkScanZones
+    from .network_scan import NetworkScan
+    from .ngsiem import NGSIEM
+    from .oauth2 import OAuth2
+    from .ods import ODS
+    from .prevention_policy import PreventionPolicy, PreventionPolicies
+    from .quarantine import Quarantine
+    from .quick_scan import QuickScan
+    from .quick_scan_pro import QuickScanPro
+    from .real_time_response_admin import RealTimeResponseAdmin
+    from .real_time_response_audit import RealTimeResponseAudit
+    from .real_time_response import RealTimeResponse
+    from .recon import Recon
+    from .report_executions import ReportExecutions
+    from .response_policies import ResponsePolicies
+    from .saas_security import SaasSecurity
+    from .sample_uploads import SampleUploads
+    from .scheduled_reports import ScheduledReports
+    from .sensor_download import SensorDownload
+    from .sensor_update_policy import SensorUpdatePolicy, SensorUpdatePolicies
+    from .sensor_usage import SensorUsage
+    from .sensor_visibility_exclusions import SensorVisibilityExclusions
+    from .serverless_exports import ServerlessExports
+    from .serverless_vulnerabilities import ServerlessVulnerabilities
+    from .spotlight_vulnerabilities import SpotlightVulnerabilities
+    from .spotlight_vulnerability_metadata import SpotlightVulnerabilityMetadata
+    from .spotlight_evaluation_logic import SpotlightEvaluationLogic
+    from .tailored_intelligence import TailoredIntelligence
+    from .threatgraph import ThreatGraph
+    from .unidentified_containers import UnidentifiedContainers
+    from .user_management import UserManagement
+    from .workflows import Workflows
+    from .zero_trust_assessment import ZeroTrustAssessment
+
+# Service Classes (and the Uber Class) are loaded on first reference (PEP 562).
+# Importing the package only loads the core SDK, each Service Class module along with
+# the endpoint module for that service collection is imported when the class is requested.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "AdmissionControlPolicies": "admission_control_policies",
+    "Alerts": "alerts",
+    "APIIntegrations": "api_integrations",
+    "APIHarness": "api_complete",
+    "APIHarnessV2": "api_complete",
+    "ASPM": "aspm",
+    "CAOHunting": "cao_hunting",
+    "CaseManagement": "case_management",
+    "CertificateBasedExclusions": "certificate_based_exclusions",
+    "CloudAWSRegistration": "cloud_aws_registration",
+    "CloudAzureRegistration": "cloud_azure_registration",
+    "CloudGoogleCloudRegistration": "cloud_google_cloud_registration",
+    "CloudOCIRegistration": "cloud_oci_registration",
+    "CloudPolicies": "cloud_policies",
+    "CloudSecurity": "cloud_security",
+    "CloudSecurityAssets": "cloud_security_assets",
+    "CloudSecurityCompliance": "cloud_security_compliance",
+    "CloudSecurityDetections": "cloud_security_detections",
+    "CloudSnapshots": "cloud_snapshots",
+    "ContainerImageCompliance": "container_image_compliance",
+    "ComplianceAssessments": "container_image_compliance",
+    "ConfigurationAssessmentEvaluationLogic": "configuration_assessment_evaluation_logic",
+    "ConfigurationAssessment": "configuration_assessment",
+    "ContainerAlerts": "container_alerts",
+    "ContainerDetections": "container_detections",
+    "ContainerImages": "container_images",
+    "ContainerPackages": "container_packages",
+    "ContainerVulnerabilities": "container_vulnerabilities",
+    "CorrelationRules": "correlation_rules",
+    "CorrelationRulesAdmin": "correlation_rules_admin",
+    "CloudConnectAWS": "cloud_connect_aws",
+    "ContentUpdatePolicies": "content_update_policies",
+    "CSPMRegistration": "cspm_registration",
+    "CustomIOA": "custom_ioa",
+    "CustomStorage": "custom_storage",
+    "D4CRegistration": "d4c_registration",
+    "DataProtectionConfiguration": "data_protection_configuration",
+    "DeliverySettings": "delivery_settings",
+    "Deployments": "deployments",
+    "Detects": "detects",
+    "DeviceContent": "device_content",
+    "DeviceControlPolicies": "device_control_policies",
+    "Discover": "discover",
+    "Downloads": "downloads",
+    "DriftIndicators": "drift_indicators",
+    "EventStreams": "event_streams",
+    "ExposureManagement": "exposure_management",
+    "FaaSExecution": "faas_execution",
+    "CompleteDashboard": "falcon_complete_dashboard",
+    "FalconContainer": "falcon_container",
+    "FalconXSandbox": "falconx_sandbox",
+    "FDR": "fdr",
+    "FileVantage": "filevantage",
+    "FirewallManagement": "firewall_management",
+    "FirewallPolicies": "firewall_policies",
+    "FoundryLogScale": "foundry_logscale",
+    "HostGroup": "host_group",
+    "Hosts": "hosts",
+    "HostMigration": "host_migration",
+    "IdentityProtection": "identity_protection",
+    "ImageAssessmentPolicies": "image_assessment_policies",
+    "Incidents": "incidents",
+    "IntelligenceIndicatorGraph": "intelligence_indicator_graph",
+    "InstallationTokens": "installation_tokens",
+    "Intel": "intel",
+    "IntelligenceFeeds": "intelligence_feeds",
+    "IOAExclusions": "ioa_exclusions",
+    "IOC": "ioc",
+    "Iocs": "iocs",
+    "ITAutomation": "it_automation",
+    "F4IT": "it_automation",
+    "KubernetesContainerCompliance": "kubernetes_container_compliance",
+    "KubernetesProtection": "kubernetes_protection",
+    "MalQuery": "malquery",
+    "MessageCenter": "message_center",
+    "MLExclusions": "ml_exclusions",
+    "MobileEnrollment": "mobile_enrollment",
+    "FlightControl": "mssp",
+    "NetworkScanGlobalConfigs": "network_scan_global_configs",
+    "NetworkScanNetworks": "network_scan_networks",
+    "NetworkScanScanRunReports": "network_scan_scan_run_reports",
+    "NetworkScanScanRuns": "network_scan_scan_runs",
+    "NetworkScanScanners": "network_scan_scanners",
+    "NetworkScanScans": "network_scan_scans",
+    "NetworkScanTemplates": "network_scan_templates",
+    "NetworkScanZones": "network_scan_zones",
+    "NetworkScan": "network_scan",
+    "NGSIEM": "ngsiem",
+    "OAuth2": "oauth2",
+    "ODS": "ods",
+    "PreventionPolicy": "prevention_policy",
+    "PreventionPolicies": "prevention_policy",
+    "Quarantine": "quarantine",
+    "QuickScan": "quick_scan",
+    "QuickScanPro": "quick_scan_pro",
+    "RealTimeResponseAdmin": "real_time_response_admin",
+    "RealTimeResponseAudit": "real_time_response_audit",
+    "RealTimeResponse": "real_time_response",
+    "Recon": "recon",
+    "ReportExecutions": "report_executions",
+    "ResponsePolicies": "response_policies",
+    "SaasSecurity": "saas_security",
+    "SampleUploads": "sample_uploads",
+    "ScheduledReports": "scheduled_reports",
+    "SensorDownload": "sensor_download",
+    "SensorUpdatePolicy": "sensor_update_policy",
+    "SensorUpdatePolicies": "sensor_update_policy",
+    "SensorUsage": "sensor_usage",
+    "SensorVisibilityExclusions": "sensor_visibility_exclusions",
+    "ServerlessExports": "serverless_exports",
+    "ServerlessVulnerabilities": "serverless_vulnerabilities",
+    "SpotlightVulnerabilities": "spotlight_vulnerabilities",
+    "SpotlightVulnerabilityMetadata": "spotlight_vulnerability_metadata",
+    "SpotlightEvaluationLogic": "spotlight_evaluation_logic",
+    "TailoredIntelligence": "tailored_intelligence",
+    "ThreatGraph": "threatgraph",
+    "UnidentifiedContainers": "unidentified_containers",
+    "UserManagement": "user_management",
+    "Workflows": "workflows",
+    "ZeroTrustAssessment": "zero_trust_assessment"
+    }
+
+
+def __getattr__(name: str) -> Any:
+    """Import Service Classes on first reference."""
+    if name in _LAZY_IMPORTS:
+        returned = getattr(import_module(f".{_LAZY_IMPORTS[name]}", __name__), name)
+        # Cache the class so subsequent references bypass this handler.
+        globals()[name] = returned
+        return returned
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """List the attributes of this module, including Service Classes that are not yet loaded."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __version__ = _VERSION
 __maintainer__ = _MAINTAINER
@@ -233,8 +402,8 @@ __docs_url__ = _DOCS_URL
 __keywords__ = _KEYWORDS
 __all__ = [
     "confirm_base_url", "confirm_base_region", "BaseURL", "ServiceClass", "Alerts",
-    "BaseServiceClass", "BaseFalconAuth", "FalconInterface", "UberInterface", "TokenFailReason",
-    "APIHarness", "CloudConnectAWS", "CSPMRegistration", "CustomIOA", "D4CRegistration",
+    "BaseServiceClass", "AsyncServiceClass", "Paginator", "ParallelPaginator", "BaseFalconAuth", "FalconInterface",
+    "UberInterface", "TokenFailReason", "APIHarness", "CloudConnectAWS", "CSPMRegistration", "CustomIOA", "D4CRegistration",
     "Detects", "DeviceControlPolicies", "Discover", "EventStreams", "CompleteDashboard",
     "FalconContainer", "FalconXSandbox", "FirewallManagement", "FirewallPolicies", "HostGroup",
     "Hosts", "IdentityProtection", "Incidents", "InstallationTokens", "Intel", "IOAExclusions",
@@ -248,10 +417,14 @@ __all__ = [
     "Result", "APIError", "SDKError", "SDKWarning", "NoContentWarning", "SSLDisabledWarning",
     "RegionSelectError", "InvalidCredentials", "InvalidMethod", "InvalidOperation",
     "TokenNotSpecified", "KeywordsOnly", "ALLOWED_METHODS", "USER_AGENT", "APIRequest",
-    "ExpandedResult", "CannotRevokeToken", "Headers", "Meta", "Resources",
+    "ExpandedResult", "StreamedResult", "CannotRevokeToken", "Headers", "Meta", "Resources",
     "ResponseComponent", "BaseDictionary", "Errors", "BaseResource", "RawBody", "BinaryFile",
     "FunctionalityNotImplemented", "BearerToken", "LogFacility", "InvalidBaseURL",
-    "InterfaceConfiguration", "RequestBehavior", "RequestConnection", "RequestMeta",
+    "InterfaceConfiguration", "ConnectionPool", "RateLimiter", "RetryPolicy", "RequestBehavior",
+    "RequestConnection", "RequestMeta", "ResponseCache", "TokenRefresher",
+    "SharedToken", "TokenRegistry", "TOKEN_REGISTRY", "DetailsPipeline",
+    "BulkDispatcher", "BulkResult", "ShardedScan", "PageSizeTuner", "JSONCodec", "set_json_codec",
+    "FileDownloader", "DownloadResult",
     "RequestPayloads", "RequestValidator", "PayloadValidationError", "MIN_TOKEN_RENEW_WINDOW",
     "MAX_TOKEN_RENEW_WINDOW", "GLOBAL_API_MAX_RETURN", "MOCK_OPERATIONS", "CloudSnapshots",
     "NoAuthenticationMechanism", "InvalidIndex", "version", "InvalidCredentialFormat",
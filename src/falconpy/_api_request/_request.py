@@ -35,16 +35,19 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-from typing import Union, Dict, Optional, List, Any
+from typing import Union, Dict, Optional, List, Any, TYPE_CHECKING
 from logging import Logger
+from requests import Session
 from ._request_behavior import RequestBehavior
 from ._request_connection import RequestConnection
 from ._request_meta import RequestMeta
 from ._request_payloads import RequestPayloads
 from .._log import LogFacility
+if TYPE_CHECKING:  # pragma: no cover
+    from .._auth_object import RateLimiter, ResponseCache, RetryPolicy
 
 
-class APIRequest:
+class APIRequest:  # pylint: disable=R0904
     """This class represents a request made to the CrowdStrike API."""
 
     # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
@@ -58,7 +61,7 @@ class APIRequest:
         """Construct an instance of the APIRequest class."""
         if initializer:
             # Key metadata regarding this API request
-            self._meta = RequestMeta(endpoint, initializer.get("method", "GET"))
+            self._meta = RequestMeta(endpoint, initializer.get("method", "GET"), initializer.get("operation_id", None))
             # Payloads for the request
             self._payloads = RequestPayloads(params=initializer.get("params", None),
                                              body=initializer.get("body", None),
@@ -69,7 +72,12 @@ class APIRequest:
             self._connection = RequestConnection(user_agent=initializer.get("user_agent", None),
                                                  proxy=initializer.get("proxy", {}),
                                                  timeout=initializer.get("timeout", None),
-                                                 verify=initializer.get("verify", True)
+                                                 verify=initializer.get("verify", True),
+                                                 session=initializer.get("session", None),
+                                                 rate_limiter=initializer.get("rate_limiter", None),
+                                                 retry_policy=initializer.get("retry_policy", None),
+                                                 response_cache=initializer.get("response_cache", None),
+                                                 cache_scope=initializer.get("cache_scope", None)
                                                  )
             # Behavioral flags that alter the behavior of request processing
             self._behavior = RequestBehavior(expand_result=initializer.get("expand_result", False),
@@ -134,6 +142,11 @@ class APIRequest:
         """Return the method attribute."""
         return self.meta.method
 
+    @property
+    def operation_id(self) -> Optional[str]:
+        """Return the operation ID attribute."""
+        return self.meta.operation_id
+
     @property
     def debug_headers(self) -> Optional[Dict[str, Optional[Union[str, int, float]]]]:
         """Return the debug headers."""
@@ -274,3 +287,28 @@ class APIRequest:
     def verify(self) -> bool:
         """Return the SSL verification setting."""
         return self.connection.verify
+
+    @property
+    def session(self) -> Optional[Session]:
+        """Return the pooled session to use for this request (if available)."""
+        return self.connection.session
+
+    @property
+    def rate_limiter(self) -> Optional["RateLimiter"]:
+        """Return the rate limiter used to pace this request (if available)."""
+        return self.connection.rate_limiter
+
+    @property
+    def retry_policy(self) -> Optional["RetryPolicy"]:
+        """Return the policy used to retry this request (if available)."""
+        return self.connection.retry_policy
+
+    @property
+    def response_cache(self) -> Optional["ResponseCache"]:
+        """Return the cache used for the response to this request (if available)."""
+        return self.connection.response_cache
+
+    @property
+    def cache_scope(self) -> Optional[str]:
+        """Return the credential identity used to separate cached responses."""
+        return self.connection.cache_scope
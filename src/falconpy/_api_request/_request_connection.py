@@ -36,7 +36,10 @@ OTHER DEALINGS IN THE SOFTWARE.
 For more information, please refer to <https://unlicense.org>
 """
 from dataclasses import dataclass
-from typing import Optional, Dict, Union
+from typing import Optional, Dict, Union, TYPE_CHECKING
+from requests import Session
+if TYPE_CHECKING:  # pragma: no cover
+    from .._auth_object import RateLimiter, ResponseCache, RetryPolicy
 
 
 @dataclass
@@ -51,3 +54,8 @@ class RequestConnection:
     verify: bool = True
     timeout: Optional[Union[int, tuple]] = None
     proxy: Optional[Dict[str, str]] = None
+    session: Optional[Session] = None
+    rate_limiter: Optional["RateLimiter"] = None
+    retry_policy: Optional["RetryPolicy"] = None
+    response_cache: Optional["ResponseCache"] = None
+    cache_scope: Optional[str] = None
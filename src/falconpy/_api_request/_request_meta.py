@@ -48,11 +48,13 @@ class RequestMeta:
     def __init__(self,
                  endpoint: Optional[str] = None,
                  method: str = "GET",
+                 operation_id: Optional[str] = None,
                  debug_headers: Optional[Dict[str, Optional[Union[str, int, float]]]] = None
                  ):
         """Construct an instance of RequestMeta class."""
         self._endpoint: Optional[str] = endpoint
         self._method: str = method
+        self._operation_id: Optional[str] = operation_id
 
         self._debug_headers: Optional[Dict[str, Optional[Union[str, int, float]]]] = debug_headers
         if debug_headers is None:
@@ -82,6 +84,16 @@ class RequestMeta:
         """Set the method attribute."""
         self._method = value
 
+    @property
+    def operation_id(self) -> Optional[str]:
+        """Return the operation ID attribute."""
+        return self._operation_id
+
+    @operation_id.setter
+    def operation_id(self, value: Optional[str]):
+        """Set the operation ID attribute."""
+        self._operation_id = value
+
     @property
     def debug_headers(self) -> Optional[Dict[str, Optional[Union[str, int, float]]]]:
         """Return the debug headers."""
@@ -40,7 +40,15 @@ from ._falcon_interface import FalconInterface
 from ._uber_interface import UberInterface
 from ._bearer_token import BearerToken
 from ._interface_config import InterfaceConfiguration
+from ._connection_pool import ConnectionPool
+from ._rate_limiter import RateLimiter
+from ._retry_policy import RetryPolicy
+from ._response_cache import ResponseCache
+from ._token_refresher import TokenRefresher
+from ._token_registry import SharedToken, TokenRegistry, TOKEN_REGISTRY
 
 __all__ = ["BaseFalconAuth", "FalconInterface", "UberInterface",
-           "BearerToken", "InterfaceConfiguration"
+           "BearerToken", "InterfaceConfiguration", "ConnectionPool",
+           "RateLimiter", "RetryPolicy", "ResponseCache", "TokenRefresher",
+           "SharedToken", "TokenRegistry", "TOKEN_REGISTRY"
            ]
@@ -0,0 +1,270 @@
+"""Connection Pool class.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from asyncio import AbstractEventLoop, get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+from requests import Session
+from requests.adapters import HTTPAdapter
+from .._util._executor import in_worker
+try:
+    import httpx
+except (ImportError, ModuleNotFoundError):
+    # Optional, asynchronous requests are performed by the worker threads when not installed.
+    httpx = None
+
+ProxyKey = Optional[Tuple[Tuple[str, str], ...]]
+
+
+class ConnectionPool:
+    """This class represents the pooled HTTP connections used by an interface.
+
+    Sessions are created on first use and retained for the life of the pool, allowing
+    every request made through the interface to reuse established TCP / TLS connections.
+    A separate session (and underlying connection pool) is maintained for each proxy
+    configuration used by classes sharing this interface.
+
+    The pool also owns the worker threads used to perform requests concurrently
+    (asynchronous and batched execution), sized to match the available connections.
+
+    When httpx is installed, asynchronous requests are sent using an httpx.AsyncClient
+    created for each event loop instead, so they do not occupy a worker thread.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 pool_connections: Optional[int] = 10,
+                 pool_maxsize: Optional[int] = 10,
+                 keep_alive: Optional[bool] = True,
+                 max_workers: Optional[int] = None
+                 ):
+        """Construct an instance of the ConnectionPool class."""
+        # Number of distinct hosts to cache connection pools for.
+        self._pool_connections: int = 10
+        if isinstance(pool_connections, int) and pool_connections > 0:
+            self._pool_connections = pool_connections
+
+        # Maximum number of connections to keep open per host.
+        self._pool_maxsize: int = 10
+        if isinstance(pool_maxsize, int) and pool_maxsize > 0:
+            self._pool_maxsize = pool_maxsize
+
+        # When disabled, every request is performed using a new connection.
+        self._keep_alive: bool = True
+        if isinstance(keep_alive, bool):
+            self._keep_alive = keep_alive
+
+        # Sessions are keyed by proxy configuration.
+        self._sessions: Dict[ProxyKey, Session] = {}
+        self._lock: Lock = Lock()
+        # Asynchronous clients are keyed by event loop, proxy configuration and SSL verification.
+        self._async_clients: Dict[Tuple[int, ProxyKey, bool], Tuple[AbstractEventLoop, Any]] = {}
+
+        # Worker threads used for concurrent requests, defaults to one per pooled connection.
+        self._max_workers: int = self._pool_maxsize
+        if isinstance(max_workers, int) and max_workers > 0:
+            self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def get_session(self, proxy: Optional[Dict[str, str]] = None) -> Optional[Session]:
+        """Return the session to use for requests made with the provided proxy configuration.
+
+        Returns None when keep-alive is disabled, indicating the request should be
+        performed without a pooled session.
+        """
+        returned: Optional[Session] = None
+        if self.keep_alive:
+            key = self.proxy_key(proxy)
+            returned = self._sessions.get(key, None)
+            if not returned:
+                with self._lock:
+                    # Another thread may have created this session while we were waiting.
+                    returned = self._sessions.get(key, None)
+                    if not returned:
+                        returned = self._create_session()
+                        self._sessions[key] = returned
+
+        return returned
+
+    def get_async_client(self, proxy: Optional[Dict[str, str]] = None, verify: bool = True) -> Optional[Any]:
+        """Return the asynchronous client to use for requests made from the running event loop.
+
+        Returns None when httpx is not installed, indicating the request should be performed
+        within a worker thread instead. Must be called from a coroutine.
+        """
+        returned = None
+        if httpx is not None:
+            loop = get_running_loop()
+            key = (id(loop), self.proxy_key(proxy), bool(verify))
+            with self._lock:
+                entry = self._async_clients.get(key, None)
+                if entry and entry[0] is loop:
+                    returned = entry[1]
+                else:
+                    # Discard clients belonging to event loops that have been closed.
+                    self._async_clients = {
+                        client_key: client for client_key, client in self._async_clients.items() if not client[0].is_closed()
+                    }
+                    returned = self._create_async_client(proxy, bool(verify))
+                    self._async_clients[key] = (loop, returned)
+
+        return returned
+
+    async def aclose(self):
+        """Close the asynchronous clients created for the running event loop, and then the rest of the pool."""
+        loop = get_running_loop()
+        with self._lock:
+            clients = [client for owner, client in self._async_clients.values() if owner is loop]
+            self._async_clients = {key: entry for key, entry in self._async_clients.items() if entry[0] is not loop}
+        for client in clients:
+            await client.aclose()
+        self.close()
+
+    def close(self):
+        """Close all pooled sessions, release their connections and stop any worker threads.
+
+        The pool remains usable afterwards, new sessions and workers are created on demand.
+        When called from a worker thread, the workers are stopped without waiting for them
+        to finish, as a worker cannot wait on itself. Asynchronous clients are released
+        without being closed, use aclose to close them from their event loop.
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions = {}
+            self._async_clients = {}
+            executor = self._executor
+            self._executor = None
+        for session in sessions:
+            session.close()
+        if executor:
+            executor.shutdown(wait=not in_worker())
+
+    def _create_session(self) -> Session:
+        """Create a new session mounted with a connection pool adapter."""
+        session = Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # Requests to the API are stateless, do not retain cookies between requests.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        return session
+
+    def _create_async_client(self, proxy: Optional[Dict[str, str]], verify: bool) -> Any:
+        """Create a new asynchronous client using the limits and proxy configuration provided."""
+        # Connections are not limited, the number of requests in flight is decided by the caller.
+        limits = httpx.Limits(max_connections=None,
+                              max_keepalive_connections=self.pool_maxsize if self.keep_alive else 0
+                              )
+        mounts = {}
+        for scheme, url in (proxy or {}).items():
+            if url:
+                pattern = scheme if "://" in scheme else f"{scheme}://"
+                mounts[pattern] = httpx.AsyncHTTPTransport(proxy=url, verify=verify, limits=limits)
+
+        return httpx.AsyncClient(verify=verify, limits=limits, mounts=mounts or None)
+
+    @staticmethod
+    def proxy_key(proxy: Optional[Dict[str, str]] = None) -> ProxyKey:
+        """Return a hashable representation of the provided proxy dictionary."""
+        returned = None
+        if proxy and isinstance(proxy, dict):
+            returned = tuple(sorted((str(key), str(val)) for key, val in proxy.items()))
+
+        return returned
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def pool_connections(self) -> int:
+        """Return the number of connection pools to cache."""
+        return self._pool_connections
+
+    @property
+    def pool_maxsize(self) -> int:
+        """Return the maximum number of connections to save in each pool."""
+        return self._pool_maxsize
+
+    @property
+    def keep_alive(self) -> bool:
+        """Return a boolean indicating if connections are kept alive between requests."""
+        return self._keep_alive
+
+    @keep_alive.setter
+    def keep_alive(self, value: bool):
+        """Enable or disable connection reuse."""
+        self._keep_alive = value
+        if not value:
+            self.close()
+
+    @property
+    def max_workers(self) -> int:
+        """Return the maximum number of worker threads used for concurrent requests."""
+        return self._max_workers
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Return the worker thread pool, creating it on first use."""
+        if not self._executor:
+            with self._lock:
+                if not self._executor:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                        thread_name_prefix="falconpy"
+                                                        )
+
+        return self._executor
+
+    @property
+    def sessions(self) -> int:
+        """Return the number of sessions currently open within the pool."""
+        return len(self._sessions)
+
+    @property
+    def async_clients(self) -> int:
+        """Return the number of asynchronous clients currently open within the pool."""
+        return len(self._async_clients)
@@ -42,17 +42,27 @@ import time
 import os
 import warnings
 from contextvars import copy_context
+from hashlib import sha256
 from logging import Logger, getLogger
+from threading import Lock
+from weakref import finalize
 from typing import Dict, Optional, Union
 from ._base_falcon_auth import BaseFalconAuth
 from ._bearer_token import BearerToken
 from .._log import LogFacility
 from .._constant import MIN_TOKEN_RENEW_WINDOW, MAX_TOKEN_RENEW_WINDOW
 from ._interface_config import InterfaceConfiguration
+from ._connection_pool import ConnectionPool
+from ._rate_limiter import RateLimiter
+from ._retry_policy import RetryPolicy
+from ._response_cache import ResponseCache
+from ._token_refresher import TokenRefresher
+from ._token_registry import SharedToken, TOKEN_REGISTRY
 from .._enum import TokenFailReason
 from .._util import (
     autodiscover_region,
     confirm_base_url,
+    generate_ok_result,
     perform_request,
     log_class_startup,
     login_payloads,
@@ -72,7 +82,7 @@ class FalconInterface(BaseFalconAuth):
     #
     # The default constructor for all authentication objects. Ingests provided credentials
     # and sets the necessary class attributes based upon the authentication detail received.
-    # pylint: disable=R0912,R0913,R0914
+    # pylint: disable=R0912,R0913,R0914,R0915,R0917
     def __init__(self,  # noqa: C901
                  access_token: Optional[Union[str, bool]] = False,
                  base_url: Optional[str] = "https://api.crowdstrike.com",
@@ -89,7 +99,16 @@ class FalconInterface(BaseFalconAuth):
                  debug_record_count: Optional[int] = None,
                  sanitize_log: Optional[bool] = None,
                  pythonic: Optional[bool] = False,
-                 environment: Optional[Dict[str, str]] = None
+                 environment: Optional[Dict[str, str]] = None,
+                 pool_connections: Optional[int] = 10,
+                 pool_maxsize: Optional[int] = 10,
+                 keep_alive: Optional[bool] = True,
+                 max_workers: Optional[int] = None,
+                 rate_limit: Optional[bool] = True,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 background_refresh: Optional[bool] = False,
+                 shared_token: Optional[bool] = False
                  ) -> "FalconInterface":
         """Construct an instance of the FalconInterface class."""
         # Set the pythonic behavior mode.
@@ -104,6 +123,19 @@ class FalconInterface(BaseFalconAuth):
                                                                       user_agent=user_agent,
                                                                       ssl_verify=ssl_verify
                                                                       )            # \ o /
+        # Persistent HTTP sessions shared by every Service Class using this interface.
+        self._pool: ConnectionPool = ConnectionPool(pool_connections=pool_connections,
+                                                    pool_maxsize=pool_maxsize,
+                                                    keep_alive=keep_alive,
+                                                    max_workers=max_workers
+                                                    )
+        # API rate limit for this interface. Interfaces sharing a token use the rate limiter held
+        # by the shared token instead, unless pacing has been disabled.
+        self._rate_limiter: RateLimiter = RateLimiter(enabled=rate_limit)
+        # Default retry policy for requests made using this interface, retries are disabled when not provided.
+        self._retry_policy: Optional[RetryPolicy] = retry_policy
+        # Cache for read only operation responses, caching is disabled when not provided.
+        self._response_cache: Optional[ResponseCache] = response_cache
         # ____ _  _ ___ _  _ ____ _  _ ___ _ ____ ____ ___ _ ____ _  _                 |
         # |__| |  |  |  |__| |___ |\ |  |  | |    |__|  |  | |  | |\ |                / \
         # |  | |__|  |  |  | |___ | \|  |  | |___ |  |  |  | |__| | \|
@@ -124,8 +156,18 @@ class FalconInterface(BaseFalconAuth):
         # Object Authentication is handled within the ServiceClass object and leverages the existing
         # authentication used for the underlying authentication object attribute.
 
-        # Set up an empty Bearer Token container.
-        self._token: BearerToken = BearerToken()
+        # Set up an empty Bearer Token container. When token sharing is enabled, objects using
+        # credentials attach to the token shared by every object in this process using the same credentials.
+        self._token_entry: SharedToken = SharedToken()
+        self._token_release: Optional[finalize] = None
+        self._token_attach_lock: Lock = Lock()
+        self._shared_token: bool = False
+        if isinstance(shared_token, bool):
+            self._shared_token = shared_token
+        # Set while an early renewal is underway, a failed renewal does not replace a valid token.
+        self._renewing_token: bool = False
+        self._renew_window: int = MIN_TOKEN_RENEW_WINDOW
+        self._token_refresher: Optional[TokenRefresher] = None
 
         # ___  _ ____ ____ ____ ___    ____ _  _ ___     ____ ____ ____ ___  ____ _  _ ___ _ ____ _
         # |  \ | |__/ |___ |     |     |__| |\ | |  \    |    |__/ |___ |  \ |___ |\ |  |  | |__| |
@@ -145,7 +187,7 @@ class FalconInterface(BaseFalconAuth):
         if not self.cred_format_valid:
             if access_token:
                 # Store this non-refreshable token, assuming it was just generated.
-                self._token: BearerToken = BearerToken(access_token, 1799, 201)
+                self.bearer_token = BearerToken(access_token, 1799, 201)
                 self._auth_style = "TOKEN"
 
         # ____ ____ _  _ ___ ____ _  _ ___
@@ -160,7 +202,7 @@ class FalconInterface(BaseFalconAuth):
             for cvar in copy_context().values():
                 try:
                     # Any object is acceptable as long as it has an attribute or property named "access_token".
-                    self._token: BearerToken = BearerToken(cvar.access_token, 1799, 201)
+                    self.bearer_token = BearerToken(cvar.access_token, 1799, 201)
                     # Attempt to retrieve the cloud region from the same object.
                     # Fall back to our previously set default on failure.
                     try:
@@ -199,6 +241,10 @@ class FalconInterface(BaseFalconAuth):
                     self._creds["member_cid"] = member_cid
                 self._auth_style = "ENVIRONMENT"
 
+        # Share tokens with other objects using these credentials, keyed by the base URL provided.
+        self._token_origin: str = self.base_url
+        self._attach_token()
+
         # Set the token renewal window, ignored when using Legacy or Context Authentication.
         self.renew_window: int = max(min(renew_window, MAX_TOKEN_RENEW_WINDOW),
                                      MIN_TOKEN_RENEW_WINDOW
@@ -229,6 +275,11 @@ class FalconInterface(BaseFalconAuth):
             # Set up an empty log facility
             self._log: LogFacility = LogFacility()
 
+        # Renew tokens in the background ahead of the renew window when requested.
+        if background_refresh is True and self.refreshable:
+            self._token_refresher = TokenRefresher(self)
+            self._token_refresher.start()
+
         # _  _ ____ _    _ ___  ____ ___ ____
         # |  | |__| |    | |  \ |__|  |  |___
         #  \/  |  | |___ | |__/ |  |  |  |___
@@ -260,6 +311,55 @@ class FalconInterface(BaseFalconAuth):
         """Log out of the Falcon API by revoking the current token."""
         return self._logout_handler()
 
+    def refresh_token(self, force: bool = False, lead: float = 0) -> bool:
+        """Generate a new token when the current token is stale, returning a boolean indicating if it is valid.
+
+        Only one thread performs the refresh. Threads arriving while a refresh is underway
+        wait for it to complete and use the resulting token instead of requesting another.
+        Tokens may be renewed a number of seconds (lead) before they become stale. When an
+        early renewal fails, the current token is kept until it becomes stale.
+        """
+        self._attach_token()
+        entry = self._token_entry
+        generation = entry.generation
+        with entry.lock:
+            # Skip the refresh if another thread replaced the token while we were waiting.
+            if generation == entry.generation and (force or self._token_due(lead)):
+                self._renewing_token = True
+                try:
+                    self.login()
+                finally:
+                    self._renewing_token = False
+
+        return self.token_valid
+
+    def _token_due(self, lead: float = 0) -> bool:
+        """Return a boolean indicating if the token is stale, or becomes stale within the lead time."""
+        return (time.time() - self.token_time) >= (self.token_expiration - self.renew_window - lead)
+
+    def _attach_token(self):
+        """Attach to the token shared by objects using the same credentials and base URL."""
+        if self._shared_token and self.cred_format_valid:
+            key = TOKEN_REGISTRY.token_key(self.creds, self._token_origin)
+            if self._token_entry.key != key:
+                with self._token_attach_lock:
+                    if self._token_entry.key != key:
+                        # Credentials (member CID) have changed, or we previously logged out.
+                        self._release_token()
+                        self._token_entry = TOKEN_REGISTRY.acquire(key)
+                        # Release our reference when this object is discarded without logging out.
+                        self._token_release = finalize(self, TOKEN_REGISTRY.release, self._token_entry)
+
+    def _release_token(self) -> int:
+        """Release our reference to a shared token, returning the number of references remaining."""
+        remaining = 0
+        if self._token_release and self._token_release.alive:
+            remaining = self._token_release()
+        self._token_release = None
+        self._token_entry = SharedToken()
+
+        return remaining
+
     def child_login(self, member_cid: str = None) -> bool:
         """Perform a login leveraging the provided member_cid."""
         returned = False
@@ -300,6 +400,9 @@ class FalconInterface(BaseFalconAuth):
         _returned_headers = {}
         try:
             if self.cred_format_valid:
+                if stateful:
+                    # Logins replace the token shared with other objects using these credentials.
+                    self._attach_token()
                 operation, target_url, data_payload = login_payloads(self.creds, self.base_url)
                 # Log the call to this operation if debugging is enabled.
                 if self.log:
@@ -308,28 +411,38 @@ class FalconInterface(BaseFalconAuth):
                                            headers={}, verify=self.ssl_verify, proxy=self.proxy,
                                            timeout=self.timeout, user_agent=self.user_agent,
                                            log_util=self.log, authenticating=True,
-                                           sanitize=self.sanitize_log
+                                           sanitize=self.sanitize_log,
+                                           session=self.connection_pool.get_session(self.proxy)
                                            )
                 _returned_headers = returned["headers"]
                 if stateful:
-                    self.token_status = returned["status_code"]
-                    if self.token_status == 201:
+                    if returned["status_code"] == 201:
                         # Token generation was successful.
                         self.bearer_token = BearerToken(token_value=returned["body"]["access_token"],
                                                         expiration=returned["body"]["expires_in"],
                                                         status=201
                                                         )
                         # Cloud Region auto discovery.
-                        self.base_url = autodiscover_region(self.base_url, returned)
+                        discovered = autodiscover_region(self.base_url, returned)
+                        if discovered != self.base_url:
+                            # Objects sharing this token will use the discovered region.
+                            self._token_entry.base_url = discovered
+                        self.base_url = discovered
+                        # Schedule the next background renewal.
+                        if self._token_refresher:
+                            self._token_refresher.wake()
+                    elif self._renewing_token and self.token_valid:
+                        # The current token is retained, objects sharing it continue to use it until it becomes stale.
+                        if self.log:
+                            self.log.warning("TOKEN: Early token renewal failed, keeping the current token")
                     else:
                         # Token generation failure, reset the current token and check for an error response.
-                        self.bearer_token = BearerToken(status=returned["status_code"])
+                        failed = BearerToken(status=returned["status_code"])
                         # Retrieve the list of errors, there should only be one item in the list.
                         error_list = returned["body"].get("errors", [])
                         if error_list:
-                            self.bearer_token.fail_token(returned["status_code"],
-                                                         error_list[0]["message"]
-                                                         )
+                            failed.fail_token(returned["status_code"], error_list[0]["message"])
+                        self.bearer_token = failed
             else:
                 if stateful:
                     self.bearer_token.fail_token(403, TokenFailReason["INVALID"])
@@ -349,6 +462,13 @@ class FalconInterface(BaseFalconAuth):
         """
         try:
             if self.cred_format_valid:
+                if stateful and not token_value and self._token_entry.shared:
+                    # Shared tokens are only revoked once every object using them has logged out.
+                    token_value = self.token_value
+                    if self._release_token():
+                        if self.log:
+                            self.log.debug("TOKEN: Token remains in use by other objects, revocation skipped")
+                        return generate_ok_result(message="Token remains in use, revocation skipped")
                 if not token_value:
                     token_value = self.token_value
                 operation, target_url, data_payload, header_payload = logout_payloads(
@@ -364,7 +484,8 @@ class FalconInterface(BaseFalconAuth):
                                            headers=header_payload, verify=self.ssl_verify,
                                            proxy=self.proxy, timeout=self.timeout,
                                            user_agent=self.user_agent, log_util=self.log,
-                                           sanitize=self.sanitize_log
+                                           sanitize=self.sanitize_log,
+                                           session=self.connection_pool.get_session(self.proxy)
                                            )
                 if stateful:
                     self.bearer_token: BearerToken = BearerToken()
@@ -469,21 +590,21 @@ class FalconInterface(BaseFalconAuth):
     @property
     def bearer_token(self) -> BearerToken:
         """Return the bearer token object for this configuration."""
-        return self._token
+        return self._token_entry.token
 
     @bearer_token.setter
     def bearer_token(self, value: BearerToken):
         """Set the bearer token."""
-        self._token = value
+        self._token_entry.token = value
 
     @property
     def renew_window(self) -> int:
         """Return the current token renew window setting."""
-        return self.bearer_token.renew_window
+        return self._renew_window
 
     @renew_window.setter
     def renew_window(self, value: int):
-        self.bearer_token.renew_window = value
+        self._renew_window = max(min(MAX_TOKEN_RENEW_WINDOW, value), MIN_TOKEN_RENEW_WINDOW)
 
     @property
     def token_expiration(self) -> int:
@@ -540,6 +661,72 @@ class FalconInterface(BaseFalconAuth):
         """Enable or disable pythonic mode."""
         self._pythonic = value
 
+    @property
+    def connection_pool(self) -> ConnectionPool:
+        """Return the connection pool used for requests made by this interface."""
+        return self._pool
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Return the rate limiter used to pace requests made by this interface.
+
+        Interfaces sharing a token (the same credentials and base URL) share one rate limiter,
+        so every Service Class using the credential is paced together. When pacing is disabled
+        (rate_limit=False), the rate limiter of this interface is used.
+        """
+        returned = self._rate_limiter
+        if returned.enabled and self._token_entry.shared:
+            returned = self._token_entry.rate_limiter
+
+        return returned
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """Return the default retry policy for requests made by this interface."""
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, value: Optional[RetryPolicy]):
+        """Set the default retry policy for requests made by this interface."""
+        self._retry_policy = value
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """Return the cache used for read only operation responses (if enabled)."""
+        return self._response_cache
+
+    @response_cache.setter
+    def response_cache(self, value: Optional[ResponseCache]):
+        """Set the cache used for read only operation responses."""
+        self._response_cache = value
+
+    @property
+    def shared_token(self) -> bool:
+        """Return a boolean indicating if tokens are shared with other objects using the same credentials."""
+        return self._shared_token
+
+    @property
+    def token_entry(self) -> SharedToken:
+        """Return the (potentially shared) token entry used by this object."""
+        return self._token_entry
+
+    @property
+    def token_refresher(self) -> Optional[TokenRefresher]:
+        """Return the background token refresher (if enabled)."""
+        return self._token_refresher
+
+    @property
+    def cache_scope(self) -> str:
+        """Return the identity used to keep cached responses separate for each credential and child CID.
+
+        This matches the token registry key, so an incorrect client secret never reuses a cached response.
+        """
+        if self.creds.get("client_id"):
+            returned = ":".join(TOKEN_REGISTRY.token_key(self.creds, self._token_origin))
+        else:
+            returned = sha256(str(self.token_value).encode("utf-8")).hexdigest()
+        return returned
+
     # All properties defined here are by design IMMUTABLE.
     @property
     def refreshable(self) -> bool:
@@ -549,7 +736,7 @@ class FalconInterface(BaseFalconAuth):
     @property
     def token_stale(self) -> bool:
         """Return whether the token is ready to be renewed."""
-        return (time.time() - self.token_time) >= (self.token_expiration - self.renew_window)
+        return self._token_due()
 
     @property
     def token_valid(self) -> bool:
@@ -581,7 +768,11 @@ class FalconInterface(BaseFalconAuth):
     def auth_headers(self) -> Dict[str, str]:
         """Return a Bearer token baked into an Authorization header ready for an HTTP request."""
         if self.token_stale and self.refreshable:
-            self.login()
+            # Only one thread refreshes the token, the rest wait and reuse the result.
+            self.refresh_token()
+        # Shared tokens may have been generated by an object that discovered a different cloud region.
+        if self._token_entry.base_url and self.base_url == self._token_origin:
+            self.base_url = self._token_entry.base_url
 
         return {"Authorization": f"Bearer {self.token_value}"}
 
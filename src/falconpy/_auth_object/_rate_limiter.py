@@ -0,0 +1,263 @@
+"""Falcon API rate limiter.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from asyncio import sleep as async_sleep
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from time import monotonic, sleep, time
+from typing import Dict, Optional, Union
+from requests import Response
+
+
+class RateLimiter:
+    """This class represents the API rate limit shared by every request made using a credential.
+
+    The limit and remaining request count are read from the X-RateLimit-Limit and
+    X-RateLimit-Remaining headers returned with each response. When the API asks for
+    requests to pause (Retry-After or X-RateLimit-RetryAfter), new requests wait until
+    this time has passed. Once the remaining headroom is exhausted, new requests are
+    paced evenly across the rate limit period instead of being sent in a burst.
+
+    Waiting is performed by the thread sending the request. Asynchronous requests are
+    sent by the httpx AsyncClient and wait using acquire_async, so the event loop is
+    never blocked.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 enabled: Optional[bool] = True,
+                 reserve: Optional[int] = 0,
+                 period: Optional[float] = 60
+                 ):
+        """Construct an instance of the RateLimiter class.
+
+        Keyword arguments:
+        enabled -- Pace requests based upon the rate limit. Headers are tracked when disabled. Boolean.
+        reserve -- Number of remaining requests to hold back before pacing begins. Integer.
+        period -- Length of the rate limit window, in seconds. Float.
+        """
+        self._enabled: bool = True
+        if isinstance(enabled, bool):
+            self._enabled = enabled
+        self._reserve: int = 0
+        if isinstance(reserve, int) and reserve > 0:
+            self._reserve = reserve
+        self._period: float = 60.0
+        if isinstance(period, (int, float)) and period > 0:
+            self._period = float(period)
+        # Values reported by the API.
+        self._limit: Optional[int] = None
+        self._remaining: Optional[int] = None
+        # Requests that have been sent but have not returned a response.
+        self._in_flight: int = 0
+        # Monotonic clock times before which new requests should not be sent.
+        self._retry_at: float = 0.0
+        self._next_slot: float = 0.0
+        # Statistics regarding requests that were paced.
+        self._wait_count: int = 0
+        self._wait_time: float = 0.0
+        self._lock: Lock = Lock()
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def reserve_slot(self) -> float:
+        """Reserve the next available request slot and return the number of seconds to wait for it."""
+        with self._lock:
+            # Headroom is read before this request is counted as in flight.
+            headroom = self.headroom
+            self._in_flight += 1
+            if not self._enabled:
+                return 0.0
+            now = monotonic()
+            start = max(now, self._retry_at)
+            if self._limit and headroom is not None and headroom <= self._reserve:
+                # Out of headroom, space requests evenly across the rate limit period.
+                start = max(start, self._next_slot)
+                self._next_slot = start + self._period / self._limit
+            delay = start - now
+            if delay > 0:
+                self._wait_count += 1
+                self._wait_time += delay
+
+        return max(delay, 0.0)
+
+    def acquire(self) -> float:
+        """Wait for the next available request slot, returning the number of seconds waited."""
+        delay = self.reserve_slot()
+        if delay:
+            sleep(delay)
+
+        return delay
+
+    async def acquire_async(self) -> float:
+        """Wait for the next available request slot without blocking the event loop."""
+        delay = self.reserve_slot()
+        if delay:
+            await async_sleep(delay)
+
+        return delay
+
+    def release(self, response: Optional[Response] = None) -> None:
+        """Release a request slot, updating the rate limit from the response headers if provided."""
+        with self._lock:
+            self._in_flight = max(self._in_flight - 1, 0)
+        if response is not None:
+            self.update(response.headers, response.status_code)
+
+    def update(self, headers: Dict[str, str], status_code: Optional[int] = None) -> None:
+        """Update the rate limit using the headers returned by the API."""
+        received = {str(key).lower(): value for key, value in (headers or {}).items()}
+        limit = self._header_value(received.get("x-ratelimit-limit", None))
+        remaining = self._header_value(received.get("x-ratelimit-remaining", None))
+        delay = self.retry_delay(received)
+        with self._lock:
+            if limit:
+                self._limit = int(limit)
+            if remaining is not None:
+                self._remaining = int(remaining)
+            if status_code == 429 and not delay:
+                # Rate limited without guidance, pace requests until the API reports headroom.
+                self._remaining = 0
+            if delay:
+                self._retry_at = max(self._retry_at, monotonic() + delay)
+
+    @staticmethod
+    def retry_delay(headers: Dict[str, str]) -> float:
+        """Return the number of seconds the API has asked requests to pause for (lowercase header keys)."""
+        returned = 0.0
+        # X-RateLimit-RetryAfter is provided as an epoch timestamp.
+        retry_epoch = RateLimiter._header_value(headers.get("x-ratelimit-retryafter", None))
+        if retry_epoch:
+            returned = retry_epoch - time()
+        retry_after = headers.get("retry-after", None)
+        if retry_after:
+            seconds = RateLimiter._header_value(retry_after)
+            if seconds is None:
+                # Retry-After may also be provided as an HTTP date.
+                try:
+                    seconds = parsedate_to_datetime(retry_after).timestamp() - time()
+                except (TypeError, ValueError):
+                    seconds = 0.0
+            returned = max(returned, seconds)
+
+        return max(returned, 0.0)
+
+    @staticmethod
+    def _header_value(value: Optional[Union[str, int, float]]) -> Optional[float]:
+        """Convert a numeric header value, returning None when it is not numeric."""
+        try:
+            returned = float(value)
+        except (TypeError, ValueError):
+            returned = None
+
+        return returned
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def enabled(self) -> bool:
+        """Return a boolean indicating if requests are paced."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        """Enable or disable request pacing."""
+        self._enabled = value
+
+    @property
+    def reserve(self) -> int:
+        """Return the number of remaining requests held back before pacing begins."""
+        return self._reserve
+
+    @reserve.setter
+    def reserve(self, value: int):
+        """Set the number of remaining requests held back before pacing begins."""
+        self._reserve = value
+
+    @property
+    def period(self) -> float:
+        """Return the length of the rate limit window in seconds."""
+        return self._period
+
+    @property
+    def limit(self) -> Optional[int]:
+        """Return the request limit last reported by the API."""
+        return self._limit
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Return the remaining request count last reported by the API."""
+        return self._remaining
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests currently awaiting a response."""
+        return self._in_flight
+
+    @property
+    def headroom(self) -> Optional[int]:
+        """Return the number of requests that can be sent before the limit is reached.
+
+        Requests awaiting a response are deducted from the remaining count reported by
+        the API. Returns None until the API has reported a limit.
+        """
+        if self._remaining is None:
+            return None
+
+        return max(self._remaining - self._in_flight, 0)
+
+    @property
+    def retry_after(self) -> float:
+        """Return the number of seconds until the API will accept new requests."""
+        return max(self._retry_at - monotonic(), 0.0)
+
+    @property
+    def wait_count(self) -> int:
+        """Return the number of requests that were paced."""
+        return self._wait_count
+
+    @property
+    def wait_time(self) -> float:
+        """Return the total number of seconds requests have waited."""
+        return self._wait_time
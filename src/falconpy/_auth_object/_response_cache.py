@@ -0,0 +1,338 @@
+"""Opt-in cache for read only API operation responses.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from collections import OrderedDict
+from hashlib import sha256
+from io import BytesIO
+from json import dumps, loads
+from sqlite3 import connect, Connection
+from threading import Lock
+from time import time
+from typing import Any, Dict, NamedTuple, Optional
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+# HTTP methods whose responses may be cached. Write operations are never cached.
+CACHEABLE_METHODS = ("GET",)
+
+
+class CachedResponse(NamedTuple):
+    """This class represents a response stored within the cache."""
+
+    operation: str
+    expires: float
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    url: str
+
+    @property
+    def size(self) -> int:
+        """Return the approximate size of this entry in bytes."""
+        return len(self.content) + sum(len(key) + len(value) for key, value in self.headers.items())
+
+    def response(self) -> Response:
+        """Return a new requests.Response object containing this entry."""
+        returned = Response()
+        returned.status_code = self.status_code
+        returned.reason = "OK"
+        returned.headers = CaseInsensitiveDict(self.headers)
+        returned.raw = BytesIO(self.content)
+        returned.url = self.url
+        return returned
+
+
+class ResponseCache:
+    """This class represents an opt-in cache for the responses of read only API operations.
+
+    Successful responses to GET operations are stored in memory, keyed by operation ID,
+    resolved URL, normalized query string parameters and the identity of the credential
+    used to make the request. Entries expire after a time to live that may be set per
+    operation, and the least recently used entries are evicted once the maximum number
+    of entries or the maximum size is exceeded. When a path is provided, entries are also
+    written to a SQLite database so they persist between processes.
+
+    Requests using any other HTTP method are never cached. Caches may be shared, and
+    entries may be invalidated explicitly by operation ID or cleared entirely.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,  # pylint: disable=R0913,R0917
+                 ttl: Optional[float] = 300,
+                 ttls: Optional[Dict[str, float]] = None,
+                 max_entries: Optional[int] = 1024,
+                 max_size: Optional[int] = 67108864,
+                 path: Optional[str] = None
+                 ):
+        """Construct an instance of the ResponseCache class.
+
+        Keyword arguments:
+        ttl -- Default number of seconds a response is cached for. Zero disables caching
+               for operations not listed in ttls. Float. Default: 300
+        ttls -- Dictionary of operation IDs and the number of seconds their responses are cached for.
+        max_entries -- Maximum number of responses held in memory. Integer. Default: 1024
+        max_size -- Maximum size of the responses held in memory in bytes. Integer. Default: 64MB
+        path -- Path to a SQLite database used to persist cached responses. String. Optional.
+        """
+        self._ttl: float = 300.0
+        if isinstance(ttl, (int, float)) and ttl >= 0:
+            self._ttl = float(ttl)
+        self._ttls: Dict[str, float] = {}
+        if isinstance(ttls, dict):
+            self._ttls = {str(operation): float(seconds) for operation, seconds in ttls.items()}
+        self._max_entries: int = 1024
+        if isinstance(max_entries, int) and max_entries > 0:
+            self._max_entries = max_entries
+        self._max_size: int = 67108864
+        if isinstance(max_size, int) and max_size > 0:
+            self._max_size = max_size
+        self._path: Optional[str] = path if isinstance(path, str) else None
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._size: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._lock: Lock = Lock()
+        self._database: Optional[Connection] = None
+        if self._path:
+            self._database = connect(self._path, check_same_thread=False)
+            self._database.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, "
+                                   "operation TEXT, expires REAL, status_code INTEGER, "
+                                   "headers TEXT, content BLOB, url TEXT)"
+                                   )
+            self._database.commit()
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def ttl_for(self, operation_id: str) -> float:
+        """Return the number of seconds responses for this operation are cached for."""
+        return self._ttls.get(operation_id, self._ttl)
+
+    def cacheable(self, method: str, operation_id: Optional[str]) -> bool:
+        """Return a boolean indicating if responses to this request may be cached."""
+        return bool(operation_id) and method.upper() in CACHEABLE_METHODS and self.ttl_for(operation_id) > 0
+
+    @staticmethod
+    def key(operation_id: str,
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            scope: Optional[str] = None
+            ) -> str:
+        """Return the cache key for a request.
+
+        Query string parameters are normalized so that the order they are provided in, and
+        parameters that are not set, do not alter the key. The order of list values is kept.
+        """
+        normalized = []
+        for name, value in sorted((params or {}).items()):
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple)):
+                value = [str(item) for item in value]
+            elif isinstance(value, bool):
+                value = str(value).lower()
+            else:
+                value = str(value)
+            normalized.append([name, value])
+
+        return sha256(dumps([scope, operation_id, url, normalized]).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Response]:
+        """Retrieve the cached response for this key, returning None if it is missing or expired."""
+        now = time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= now:
+                self._remove(key)
+                entry = None
+            if entry is None:
+                entry = self._read(key, now)
+                if entry is not None:
+                    self._insert(key, entry)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+        return entry.response()
+
+    def store(self, key: str, operation_id: str, response: Response) -> bool:
+        """Store a successful response for this key, returning a boolean indicating if it was cached."""
+        ttl = self.ttl_for(operation_id)
+        if response.status_code != 200 or ttl <= 0:
+            return False
+        entry = CachedResponse(operation=operation_id,
+                               expires=time() + ttl,
+                               status_code=response.status_code,
+                               headers=dict(response.headers),
+                               content=response.content,
+                               url=response.url
+                               )
+        if entry.size > self._max_size:
+            return False
+        with self._lock:
+            self._insert(key, entry)
+            self._write(key, entry)
+
+        return True
+
+    def invalidate(self, operation_id: Optional[str] = None) -> int:
+        """Remove the cached responses for an operation, or every response when not provided.
+
+        Returns: the number of responses removed from memory.
+        """
+        with self._lock:
+            keys = [key for key, entry in self._entries.items()
+                    if operation_id is None or entry.operation == operation_id]
+            for key in keys:
+                self._remove(key)
+            if self._database:
+                if operation_id is None:
+                    self._database.execute("DELETE FROM responses")
+                else:
+                    self._database.execute("DELETE FROM responses WHERE operation = ?", (operation_id,))
+                self._database.commit()
+
+        return len(keys)
+
+    def clear(self) -> int:
+        """Remove every cached response, returning the number of responses removed from memory."""
+        return self.invalidate()
+
+    def close(self):
+        """Close the persistent database (if used). Responses held in memory remain available."""
+        with self._lock:
+            if self._database:
+                self._database.close()
+                self._database = None
+
+    def _insert(self, key: str, entry: CachedResponse):
+        """Add an entry to memory, evicting the least recently used entries as necessary."""
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._size += entry.size
+        while len(self._entries) > self._max_entries or self._size > self._max_size:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _remove(self, key: str):
+        """Remove an entry from memory."""
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+    def _read(self, key: str, now: float) -> Optional[CachedResponse]:
+        """Read an unexpired entry from the persistent database."""
+        returned = None
+        if self._database:
+            row = self._database.execute("SELECT operation, expires, status_code, headers, content, url "
+                                         "FROM responses WHERE key = ? AND expires > ?", (key, now)
+                                         ).fetchone()
+            if row:
+                returned = CachedResponse(row[0], row[1], row[2], loads(row[3]), bytes(row[4]), row[5])
+
+        return returned
+
+    def _write(self, key: str, entry: CachedResponse):
+        """Write an entry to the persistent database, removing any expired entries."""
+        if self._database:
+            self._database.execute("DELETE FROM responses WHERE expires <= ?", (time(),))
+            self._database.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                   (key, entry.operation, entry.expires, entry.status_code,
+                                    dumps(entry.headers), entry.content, entry.url)
+                                   )
+            self._database.commit()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def ttl(self) -> float:
+        """Return the default number of seconds a response is cached for."""
+        return self._ttl
+
+    @property
+    def ttls(self) -> Dict[str, float]:
+        """Return the number of seconds responses are cached for, by operation ID."""
+        return self._ttls
+
+    @property
+    def max_entries(self) -> int:
+        """Return the maximum number of responses held in memory."""
+        return self._max_entries
+
+    @property
+    def max_size(self) -> int:
+        """Return the maximum size of the responses held in memory in bytes."""
+        return self._max_size
+
+    @property
+    def path(self) -> Optional[str]:
+        """Return the path to the persistent database (if used)."""
+        return self._path
+
+    @property
+    def entries(self) -> int:
+        """Return the number of responses held in memory."""
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Return the size of the responses held in memory in bytes."""
+        return self._size
+
+    @property
+    def hits(self) -> int:
+        """Return the number of requests answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Return the number of cacheable requests not found within the cache."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Return the number of responses evicted to remain within the size limits."""
+        return self._evictions
@@ -0,0 +1,267 @@
+"""Falcon API retry policy.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from asyncio import sleep as async_sleep
+from random import uniform
+from time import sleep
+from typing import Awaitable, Callable, Iterable, Optional, Tuple, Type, Union
+from requests import Response
+from requests.exceptions import ConnectionError as RequestConnectionError, Timeout
+from ._rate_limiter import RateLimiter
+
+# HTTP methods that do not alter state, and can always be retried.
+SAFE_METHODS: Tuple[str, ...] = ("GET", "HEAD", "OPTIONS")
+# Transient status codes that are retried by default.
+RETRY_STATUS_CODES: Tuple[int, ...] = (429, 500, 502, 503, 504)
+# Exceptions representing transient connection failures (resets, timeouts).
+RETRY_ERRORS: Tuple[Type[Exception], ...] = (RequestConnectionError, Timeout)
+
+
+class RetryPolicy:
+    """This class represents the policy used to retry requests that fail with a transient error.
+
+    Failed attempts are retried with an exponential backoff (backoff_factor * 2 ^ (attempt - 1),
+    capped at backoff_max) and optional full jitter. When the API provides Retry-After guidance,
+    the longer of the two delays is used. Only safe (read only) methods are retried unless
+    additional methods are provided or unsafe retries are enabled.
+
+    Policies may be assigned to an authentication object, a Service Class or an individual
+    request. A policy holds no state regarding the requests it retries, and can be shared.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,  # pylint: disable=R0913,R0917
+                 max_attempts: Optional[int] = 3,
+                 backoff_factor: Optional[float] = 0.5,
+                 backoff_max: Optional[float] = 30,
+                 jitter: Optional[bool] = True,
+                 status_codes: Optional[Iterable[int]] = None,
+                 methods: Optional[Iterable[str]] = None,
+                 unsafe: Optional[bool] = False,
+                 errors: Optional[Iterable[Type[Exception]]] = None
+                 ):
+        """Construct an instance of the RetryPolicy class.
+
+        Keyword arguments:
+        max_attempts -- Maximum number of attempts, including the first. Integer. Default: 3
+        backoff_factor -- Delay before the first retry in seconds, doubled for each retry. Float. Default: 0.5
+        backoff_max -- Maximum delay between attempts in seconds. Float. Default: 30
+        jitter -- Randomize each delay between zero and the calculated backoff. Boolean. Default: True
+        status_codes -- HTTP status codes that are retried. Default: 429, 500, 502, 503, 504
+        methods -- HTTP methods that are retried. Default: GET, HEAD, OPTIONS
+        unsafe -- Retry every HTTP method, including those that are not idempotent. Boolean. Default: False
+        errors -- Exception types that are retried. Default: connection errors and timeouts
+        """
+        self._max_attempts: int = 3
+        if isinstance(max_attempts, int) and max_attempts > 0:
+            self._max_attempts = max_attempts
+        self._backoff_factor: float = 0.5
+        if isinstance(backoff_factor, (int, float)) and backoff_factor >= 0:
+            self._backoff_factor = float(backoff_factor)
+        self._backoff_max: float = 30.0
+        if isinstance(backoff_max, (int, float)) and backoff_max >= 0:
+            self._backoff_max = float(backoff_max)
+        self._jitter: bool = True
+        if isinstance(jitter, bool):
+            self._jitter = jitter
+        self._status_codes: Tuple[int, ...] = RETRY_STATUS_CODES
+        if status_codes is not None:
+            self._status_codes = tuple(status_codes)
+        self._methods: Tuple[str, ...] = SAFE_METHODS
+        if methods is not None:
+            self._methods = tuple(method.upper() for method in methods)
+        self._unsafe: bool = False
+        if isinstance(unsafe, bool):
+            self._unsafe = unsafe
+        self._errors: Tuple[Type[Exception], ...] = RETRY_ERRORS
+        if errors is not None:
+            self._errors = tuple(errors)
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def allowed(self, method: str) -> bool:
+        """Return a boolean indicating if requests using this HTTP method may be retried."""
+        return self._unsafe or method.upper() in self._methods
+
+    def retryable(self,
+                  method: str,
+                  attempt: int,
+                  response: Optional[Response] = None,
+                  error: Optional[Exception] = None
+                  ) -> bool:
+        """Return a boolean indicating if a failed attempt should be retried."""
+        returned = False
+        if attempt < self._max_attempts and self.allowed(method):
+            if error is not None:
+                returned = isinstance(error, self._errors)
+            elif response is not None:
+                returned = response.status_code in self._status_codes
+
+        return returned
+
+    def backoff(self, attempt: int, response: Optional[Response] = None) -> float:
+        """Return the number of seconds to wait before the next attempt."""
+        delay = min(self._backoff_max, self._backoff_factor * (2 ** (attempt - 1)))
+        if self._jitter:
+            delay = uniform(0, delay)
+        if response is not None:
+            # Honor any guidance provided by the API regarding when to retry.
+            headers = {str(key).lower(): value for key, value in response.headers.items()}
+            delay = max(delay, RateLimiter.retry_delay(headers))
+
+        return delay
+
+    def perform(self,
+                method: str,
+                request: Callable[[], Response],
+                log: Optional[Callable[[str], None]] = None
+                ) -> Tuple[Response, int, float]:
+        """Perform a request, retrying transient failures as allowed by this policy.
+
+        Keyword arguments:
+        method -- HTTP method used by the request. String.
+        request -- Callable that performs a single attempt and returns the response.
+        log -- Callable used to log each retry. Optional.
+
+        Returns: tuple containing the final response, the number of retries and the
+                 number of seconds spent waiting between attempts.
+
+        The exception raised by the final attempt is passed to the caller.
+        """
+        retries = 0
+        waited = 0.0
+        while True:
+            attempt = retries + 1
+            try:
+                response = request()
+            except Exception as failure:  # pylint: disable=W0703
+                if not self.retryable(method, attempt, error=failure):
+                    raise
+                reason: Union[int, str] = type(failure).__name__
+                delay = self.backoff(attempt)
+            else:
+                if not self.retryable(method, attempt, response=response):
+                    return response, retries, waited
+                reason = response.status_code
+                delay = self.backoff(attempt, response)
+                response.close()
+            if log:
+                log(f"RETRY: Attempt {attempt + 1} of {self._max_attempts} in {delay:.2f} seconds ({reason})")
+            sleep(delay)
+            waited += delay
+            retries += 1
+
+    async def perform_async(self,
+                            method: str,
+                            request: Callable[[], Awaitable[Response]],
+                            log: Optional[Callable[[str], None]] = None
+                            ) -> Tuple[Response, int, float]:
+        """Perform an asynchronous request, retrying transient failures without blocking the event loop.
+
+        Accepts the same arguments as perform, the request callable returns an awaitable.
+        """
+        retries = 0
+        waited = 0.0
+        while True:
+            attempt = retries + 1
+            try:
+                response = await request()
+            except Exception as failure:  # pylint: disable=W0703
+                if not self.retryable(method, attempt, error=failure):
+                    raise
+                reason: Union[int, str] = type(failure).__name__
+                delay = self.backoff(attempt)
+            else:
+                if not self.retryable(method, attempt, response=response):
+                    return response, retries, waited
+                reason = response.status_code
+                delay = self.backoff(attempt, response)
+                response.close()
+            if log:
+                log(f"RETRY: Attempt {attempt + 1} of {self._max_attempts} in {delay:.2f} seconds ({reason})")
+            await async_sleep(delay)
+            waited += delay
+            retries += 1
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def max_attempts(self) -> int:
+        """Return the maximum number of attempts, including the first."""
+        return self._max_attempts
+
+    @property
+    def backoff_factor(self) -> float:
+        """Return the delay before the first retry in seconds."""
+        return self._backoff_factor
+
+    @property
+    def backoff_max(self) -> float:
+        """Return the maximum delay between attempts in seconds."""
+        return self._backoff_max
+
+    @property
+    def jitter(self) -> bool:
+        """Return a boolean indicating if delays are randomized."""
+        return self._jitter
+
+    @property
+    def status_codes(self) -> Tuple[int, ...]:
+        """Return the HTTP status codes that are retried."""
+        return self._status_codes
+
+    @property
+    def methods(self) -> Tuple[str, ...]:
+        """Return the HTTP methods that are retried."""
+        return self._methods
+
+    @property
+    def unsafe(self) -> bool:
+        """Return a boolean indicating if every HTTP method is retried."""
+        return self._unsafe
+
+    @property
+    def errors(self) -> Tuple[Type[Exception], ...]:
+        """Return the exception types that are retried."""
+        return self._errors
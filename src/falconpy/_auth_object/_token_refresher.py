@@ -0,0 +1,167 @@
+"""Background bearer token renewal.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from threading import Event, Thread
+from time import time
+from typing import Optional, TYPE_CHECKING
+from weakref import finalize, ref
+if TYPE_CHECKING:  # pragma: no cover
+    from ._falcon_interface import FalconInterface
+
+
+class TokenRefresher:
+    """This class represents a background thread that renews the bearer token before it becomes stale.
+
+    The token is renewed a number of seconds (lead) ahead of the renew window, so requests
+    made by Service Classes sharing the interface are not delayed by authentication. Should
+    an early renewal fail, the current token is kept and the renewal is retried after the
+    retry interval. The thread only holds a weak reference to the interface, and exits
+    when the interface is discarded or the refresher is stopped.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 interface: "FalconInterface",
+                 lead: Optional[float] = 30,
+                 retry_interval: Optional[float] = 10
+                 ):
+        """Construct an instance of the TokenRefresher class.
+
+        Keyword arguments:
+        interface -- Authentication object (FalconInterface derivative) to renew tokens for.
+        lead -- Number of seconds ahead of the renew window to renew the token. Float. Default: 30
+        retry_interval -- Number of seconds to wait before retrying a failed renewal. Float. Default: 10
+        """
+        self._interface = ref(interface)
+        self._lead: float = 30.0
+        if isinstance(lead, (int, float)) and lead >= 0:
+            self._lead = float(lead)
+        self._retry_interval: float = 10.0
+        if isinstance(retry_interval, (int, float)) and retry_interval > 0:
+            self._retry_interval = float(retry_interval)
+        self._wake: Event = Event()
+        self._stopped: bool = False
+        self._thread: Optional[Thread] = None
+        self._refresh_count: int = 0
+        self._failure_count: int = 0
+        # Stop the thread when the interface is garbage collected.
+        finalize(interface, self.stop)
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def start(self):
+        """Start the background thread if it is not already running."""
+        self._stopped = False
+        if not self.running:
+            self._thread = Thread(target=self._run, name="falconpy-token-refresher", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background thread."""
+        self._stopped = True
+        self._wake.set()
+
+    def wake(self):
+        """Recalculate when the next renewal is due (called whenever a new token is generated)."""
+        self._wake.set()
+
+    def next_refresh(self, interface: "FalconInterface") -> Optional[float]:
+        """Return the number of seconds until the token should be renewed, or None without a token."""
+        returned = None
+        if interface.refreshable and interface.token_value:
+            returned = interface.token_time + interface.token_expiration - interface.renew_window - self._lead - time()
+
+        return returned
+
+    def _run(self):
+        """Renew the token whenever a renewal is due, until stopped."""
+        while not self._stopped:
+            self._wake.clear()
+            interface = self._interface()
+            if interface is None:
+                break
+            delay = self.next_refresh(interface)
+            if delay is not None and delay <= 0:
+                try:
+                    refreshed = interface.refresh_token(lead=self._lead)
+                except Exception:  # pylint: disable=W0703
+                    # Errors are retried, requests will refresh the token themselves once it is stale.
+                    refreshed = False
+                # A failed early renewal keeps the current token, which is still due for renewal.
+                delay = self.next_refresh(interface) if refreshed else None
+                if delay is not None and delay > 0:
+                    self._refresh_count += 1
+                else:
+                    self._failure_count += 1
+                    delay = self._retry_interval
+            # Release our reference to the interface while we wait.
+            interface = None
+            self._wake.wait(delay)
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def lead(self) -> float:
+        """Return the number of seconds ahead of the renew window tokens are renewed."""
+        return self._lead
+
+    @property
+    def retry_interval(self) -> float:
+        """Return the number of seconds to wait before retrying a failed renewal."""
+        return self._retry_interval
+
+    @property
+    def running(self) -> bool:
+        """Return a boolean indicating if the background thread is running."""
+        return bool(self._thread and self._thread.is_alive())
+
+    @property
+    def refresh_count(self) -> int:
+        """Return the number of tokens renewed by the background thread."""
+        return self._refresh_count
+
+    @property
+    def failure_count(self) -> int:
+        """Return the number of failed renewals performed by the background thread."""
+        return self._failure_count
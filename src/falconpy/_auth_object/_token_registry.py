@@ -0,0 +1,203 @@
+"""Process-wide registry of shared bearer tokens.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from hashlib import sha256
+from threading import Lock
+from typing import Dict, Optional, Tuple
+from ._bearer_token import BearerToken
+from ._rate_limiter import RateLimiter
+
+TokenKey = Tuple[str, str, str, str]
+
+
+class SharedToken:
+    """This class represents a bearer token that may be shared by multiple authentication objects.
+
+    Tokens that are not registered (no key) belong to a single authentication object.
+    Refreshes are serialized using the token lock, and the generation is incremented
+    whenever the token is replaced so waiting threads can detect a completed refresh.
+
+    The API rate limit applies to the credential, so the rate limiter used to pace
+    requests is held here and shared by every object using the token.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, key: Optional[TokenKey] = None):
+        """Construct an instance of the SharedToken class."""
+        self._key: Optional[TokenKey] = key
+        self._token: BearerToken = BearerToken()
+        self._lock: Lock = Lock()
+        self._generation: int = 0
+        self._references: int = 0
+        self._base_url: Optional[str] = None
+        self._rate_limiter: RateLimiter = RateLimiter()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def key(self) -> Optional[TokenKey]:
+        """Return the registry key for this token, None when the token is not shared."""
+        return self._key
+
+    @property
+    def shared(self) -> bool:
+        """Return a boolean indicating if this token is held within the registry."""
+        return self._key is not None
+
+    @property
+    def token(self) -> BearerToken:
+        """Return the bearer token."""
+        return self._token
+
+    @token.setter
+    def token(self, value: BearerToken):
+        """Replace the bearer token, incrementing the generation."""
+        self._token = value
+        self._generation += 1
+
+    @property
+    def lock(self) -> Lock:
+        """Return the lock used to serialize token refreshes."""
+        return self._lock
+
+    @property
+    def generation(self) -> int:
+        """Return the number of times this token has been replaced."""
+        return self._generation
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Return the rate limiter shared by objects using this token."""
+        return self._rate_limiter
+
+    @property
+    def references(self) -> int:
+        """Return the number of authentication objects using this token."""
+        return self._references
+
+    @references.setter
+    def references(self, value: int):
+        """Set the number of authentication objects using this token."""
+        self._references = max(value, 0)
+
+    @property
+    def base_url(self) -> Optional[str]:
+        """Return the base URL (cloud region) the token was generated for."""
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: Optional[str]):
+        """Set the base URL (cloud region) the token was generated for."""
+        self._base_url = value
+
+
+class TokenRegistry:
+    """This class represents a process-wide registry of tokens shared by authentication objects.
+
+    Authentication objects created with the same credentials (client ID, client secret
+    and member CID) and base URL share a single token, so creating additional Service
+    Classes does not generate additional tokens. Each object holds a reference to the
+    token, which is only revoked when the last reference is released by a logout.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self):
+        """Construct an instance of the TokenRegistry class."""
+        self._tokens: Dict[TokenKey, SharedToken] = {}
+        self._lock: Lock = Lock()
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    @staticmethod
+    def token_key(creds: Dict[str, str], base_url: str) -> TokenKey:
+        """Return the registry key for the provided credentials and base URL.
+
+        The client secret is included as a digest so objects using an incorrect
+        secret never share a token generated using the correct one.
+        """
+        secret = sha256(str(creds.get("client_secret", "")).encode("utf-8")).hexdigest()
+        return (str(creds.get("client_id", "")), str(creds.get("member_cid", "") or ""), str(base_url), secret)
+
+    def acquire(self, key: TokenKey) -> SharedToken:
+        """Return the token registered for this key, adding a reference to it."""
+        with self._lock:
+            entry = self._tokens.get(key)
+            if entry is None:
+                entry = SharedToken(key)
+                self._tokens[key] = entry
+            entry.references += 1
+
+        return entry
+
+    def release(self, entry: SharedToken) -> int:
+        """Remove a reference to this token, returning the number of references that remain.
+
+        Tokens without any remaining references are removed from the registry.
+        """
+        with self._lock:
+            entry.references -= 1
+            if not entry.references and self._tokens.get(entry.key) is entry:
+                del self._tokens[entry.key]
+
+            return entry.references
+
+    def get(self, key: TokenKey) -> Optional[SharedToken]:
+        """Return the token registered for this key (if present)."""
+        return self._tokens.get(key)
+
+    def clear(self):
+        """Remove every token from the registry. Tokens are not revoked."""
+        with self._lock:
+            self._tokens.clear()
+
+    def __len__(self) -> int:
+        """Return the number of registered tokens."""
+        return len(self._tokens)
+
+
+# Registry shared by every authentication object within this process.
+TOKEN_REGISTRY: TokenRegistry = TokenRegistry()
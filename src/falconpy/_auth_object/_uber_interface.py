@@ -38,8 +38,11 @@ For more information, please refer to <https://unlicense.org>
 from traceback import extract_tb
 from typing import Dict, List, Optional, Union
 from ._falcon_interface import FalconInterface
+from ._retry_policy import RetryPolicy
+from ._response_cache import ResponseCache
 from .._constant import MAX_DEBUG_RECORDS
-from .._endpoint import api_endpoints
+from .. import _endpoint
+from .._endpoint import OperationRegistry, operation_registry
 from .._util import confirm_base_url
 
 
@@ -52,8 +55,9 @@ class UberInterface(FalconInterface):
     #
     # Attributes present only within the Uber Class.
     #
-    # A dictionary of every available API operation provided by the library.
-    commands: List[List[Union[str, bool, int, List[dict]]]] = []
+    # A list of every available API operation provided by the library. When this is not
+    # customized, the endpoint modules are loaded the first time an operation is requested.
+    _commands: Optional[List[List[Union[str, bool, int, List[dict]]]]] = None
 
     # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
     # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
@@ -62,7 +66,7 @@ class UberInterface(FalconInterface):
     # Starting in v1.3.0, the Uber Class constructs itself leveraging the generic
     # FalconAuth constructor. This results in the Uber Class benefiting from a new
     # authentication style; Legacy / Token authentication.
-    # pylint: disable=R0913
+    # pylint: disable=R0913,R0914,R0917
     def __init__(self,
                  access_token: Optional[Union[str, bool]] = False,
                  base_url: Optional[str] = "https://api.crowdstrike.com",
@@ -79,7 +83,16 @@ class UberInterface(FalconInterface):
                  debug_record_count: Optional[int] = MAX_DEBUG_RECORDS,
                  sanitize_log: Optional[bool] = None,
                  pythonic: Optional[bool] = None,
-                 environment: Optional[Dict[str, str]] = None
+                 environment: Optional[Dict[str, str]] = None,
+                 pool_connections: Optional[int] = 10,
+                 pool_maxsize: Optional[int] = 10,
+                 keep_alive: Optional[bool] = True,
+                 max_workers: Optional[int] = None,
+                 rate_limit: Optional[bool] = True,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 background_refresh: Optional[bool] = False,
+                 shared_token: Optional[bool] = False
                  ):
         """Construct an instance of the UberInterface class.
 
@@ -112,6 +125,20 @@ class UberInterface(FalconInterface):
                             Max: 5000
         sanitize_log: Enable / Disable log sanitization of client IDs, secrets and tokens.
                       Boolean. Defaults to enabled.
+        pool_connections: Number of connection pools (per host) to cache. Integer. Default: 10
+        pool_maxsize: Maximum number of connections to keep alive within each pool. Integer. Default: 10
+        keep_alive: Enable / Disable persistent pooled connections. Boolean. Defaults to enabled.
+        max_workers: Maximum number of worker threads used for concurrent requests. Integer.
+                     Defaults to pool_maxsize. Limits the requests in flight when using acommand or batch.
+        rate_limit: Enable / Disable pacing requests using the API rate limit. Boolean. Defaults to enabled.
+        retry_policy: Policy used to retry requests that fail with a transient error. RetryPolicy.
+                      Defaults to no retries.
+        response_cache: Cache used for the responses of read only (GET) operations. ResponseCache.
+                        Defaults to no caching.
+        background_refresh: Renew tokens ahead of the renew window using a background thread.
+                            Boolean. Defaults to disabled.
+        shared_token: Share the token with other objects created using the same credentials and
+                      base URL. Boolean. Defaults to disabled.
         This method only accepts keywords to specify arguments.
         """
         super().__init__(base_url=confirm_base_url(base_url),
@@ -129,12 +156,18 @@ class UberInterface(FalconInterface):
                          debug_record_count=debug_record_count,
                          sanitize_log=sanitize_log,
                          pythonic=pythonic,
-                         environment=environment
+                         environment=environment,
+                         pool_connections=pool_connections,
+                         pool_maxsize=pool_maxsize,
+                         keep_alive=keep_alive,
+                         max_workers=max_workers,
+                         rate_limit=rate_limit,
+                         retry_policy=retry_policy,
+                         response_cache=response_cache,
+                         background_refresh=background_refresh,
+                         shared_token=shared_token
                          )
 
-        # Complete list of available API operations.
-        self.commands = api_endpoints
-
     # _  _ ____ ___ _  _ ____ ___  ____
     # |\/| |___  |  |__| |  | |  \ [__
     # |  | |___  |  |  | |__| |__/ ___]
@@ -170,6 +203,8 @@ class UberInterface(FalconInterface):
                 fname = frame.filename
                 self.log.error("LOCATION: %s, Line #%i in Function '%s'", fname, lineno, func)
         self.logout()
+        # Release any pooled connections held by this interface.
+        self.connection_pool.close()
 
     # Legacy property getters maintained for backwards functionality.
     def authenticated(self) -> bool:
@@ -180,6 +215,29 @@ class UberInterface(FalconInterface):
         """Return the current token expiration status."""
         return self.token_stale
 
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def commands(self) -> List[List[Union[str, bool, int, List[dict]]]]:
+        """Return the complete list of available API operations.
+
+        Endpoint modules are loaded the first time this list is requested. Operations
+        added to (or removed from) this list are available to the command method.
+        """
+        return self._commands if self._commands is not None else _endpoint.api_endpoints
+
+    @commands.setter
+    def commands(self, value: List[List[Union[str, bool, int, List[dict]]]]):
+        """Set the list of available API operations."""
+        self._commands = value
+
+    @property
+    def operations(self) -> OperationRegistry:
+        """Return the dictionary index of available API operations."""
+        return operation_registry(self.commands)
+
     # _    ____ ____ ____ ____ _   _    _  _ ____ _  _ ___  _    ____ ____ ____
     # |    |___ | __ |__| |     \_/     |__| |__| |\ | |  \ |    |___ |__/ [__
     # |___ |___ |__] |  | |___   |      |  | |  | | \| |__/ |___ |___ |  \ ___]
@@ -35,7 +35,7 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-from typing import List
+from typing import Dict, List
 from .._version import version
 PREFER_NONETYPE: List[str] = [
     "report_executions_download_get", "report_executions_download.get",
@@ -63,6 +63,17 @@ PREFER_IDS_IN_BODY: List[str] = [
 MOCK_OPERATIONS: List[str] = [
     "GetImageAssessmentReport", "DeleteImageDetails", "ImageMatchesPolicy"
 ]
+# Maximum number of IDs accepted per request by read operations that do not declare maxItems for the
+# ids parameter. Each limit is stated within the description of the operation or its ids parameter.
+IDS_MAX_ITEMS: Dict[str, int] = {
+    "GetDetectSummaries": 1000, "GetDeviceDetails": 5000, "PostDeviceDetailsV2": 5000, "getVulnerabilities": 400
+}
+# Number of IDs sent per request by the host bulk dispatchers when the operation does not declare maxItems
+# for its ids. PerformActionV2 accepts 100 hosts per request (see samples/hosts/prune_hosts.py), the
+# limit for UpdateDeviceTags is not documented so the same batch size is used.
+BULK_ACTION_MAX_ITEMS: Dict[str, int] = {
+    "PerformActionV2": 100, "UpdateDeviceTags": 100
+}
 # Restrict requests to only allowed HTTP methods
 ALLOWED_METHODS: List[str] = ["GET", "POST", "PUT", "PATCH", "DELETE", "UPDATE", "HEAD"]
 # Default user-agent string
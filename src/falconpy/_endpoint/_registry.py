@@ -0,0 +1,292 @@
+"""Dictionary backed API operation registry.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from collections.abc import Hashable
+from sys import intern
+from threading import Lock
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Union
+
+
+class Parameter(NamedTuple):
+    """Details for a single API operation parameter.
+
+    Identical parameter definitions are shared by every operation that uses them.
+    """
+
+    name: str
+    type: Optional[str]
+    location: str
+    required: bool = False
+    minimum: Optional[int] = None
+    maximum: Optional[int] = None
+    max_items: Optional[int] = None
+
+
+class EndpointList(list):
+    """This class represents a list of endpoint definitions that counts its modifications.
+
+    Registries created from this list compare the count to detect changes, instead of
+    comparing every definition within the list each time an operation is retrieved.
+    """
+
+    def __init__(self, *args):
+        """Construct an instance of the EndpointList class."""
+        super().__init__(*args)
+        self.version: int = 0
+
+    def _modified(self, method: str, *args) -> Any:
+        """Perform the provided list method and increment the modification count."""
+        self.version += 1
+        return getattr(super(), method)(*args)
+
+    def append(self, *args):
+        """Append an endpoint definition to the list."""
+        return self._modified("append", *args)
+
+    def extend(self, *args):
+        """Extend the list with the provided endpoint definitions."""
+        return self._modified("extend", *args)
+
+    def insert(self, *args):
+        """Insert an endpoint definition into the list."""
+        return self._modified("insert", *args)
+
+    def remove(self, *args):
+        """Remove an endpoint definition from the list."""
+        return self._modified("remove", *args)
+
+    def pop(self, *args):
+        """Remove and return an endpoint definition from the list."""
+        return self._modified("pop", *args)
+
+    def clear(self, *args):
+        """Remove every endpoint definition from the list."""
+        return self._modified("clear", *args)
+
+    def sort(self, *args, **kwargs):
+        """Sort the list in place."""
+        self.version += 1
+        return super().sort(*args, **kwargs)
+
+    def reverse(self, *args):
+        """Reverse the list in place."""
+        return self._modified("reverse", *args)
+
+    def __setitem__(self, *args):
+        """Replace one or more endpoint definitions within the list."""
+        return self._modified("__setitem__", *args)
+
+    def __delitem__(self, *args):
+        """Delete one or more endpoint definitions from the list."""
+        return self._modified("__delitem__", *args)
+
+    def __iadd__(self, *args):
+        """Extend the list in place."""
+        return self._modified("__iadd__", *args)
+
+    def __imul__(self, *args):
+        """Repeat the list in place."""
+        return self._modified("__imul__", *args)
+
+
+def fingerprint(endpoints: List[List[Any]]) -> Hashable:
+    """Return a value that changes whenever the contents of the provided endpoint list change.
+
+    The modification count is used for an EndpointList. Any other list is identified by the
+    definitions it contains, which requires a pass over the list.
+    """
+    if isinstance(endpoints, EndpointList):
+        return endpoints.version
+
+    return hash(tuple(map(id, endpoints)))
+
+
+class Operation:
+    """This class represents a single API operation, indexed by the OperationRegistry.
+
+    Only the details required to perform a request are retained. The complete endpoint
+    definition, which contains the description and any enumerations, remains available
+    from the endpoint property.
+    """
+
+    __slots__ = ("operation_id", "method", "route", "collection", "parameters", "endpoint")
+
+    def __init__(self,
+                 operation_id: str,
+                 method: str,
+                 route: str,
+                 collection: str,
+                 parameters: Dict[str, Parameter],
+                 endpoint: List[Any]
+                 ):
+        """Construct an instance of the Operation class.
+
+        Keyword arguments:
+        operation_id -- API operation ID. String.
+        method -- HTTP method used by the operation. String.
+        route -- Route (URI path) for the operation. String.
+        collection -- Collection (Service Class module) the operation belongs to. String.
+        parameters -- Dictionary of Parameter records keyed by parameter name.
+        endpoint -- The endpoint definition this operation was created from. List.
+        """
+        self.operation_id = intern(operation_id)
+        self.method = intern(method)
+        self.route = intern(route)
+        self.collection = intern(collection)
+        self.parameters = parameters
+        self.endpoint = endpoint
+
+    def __repr__(self) -> str:
+        """Return a string representation of the operation."""
+        return f"Operation({self.operation_id!r}, {self.method!r}, {self.route!r})"
+
+    @property
+    def description(self) -> str:
+        """Return the description of the operation."""
+        return self.endpoint[3]
+
+
+# Parameter records shared by every registry.
+_PARAMETERS: Dict[Parameter, Parameter] = {}
+
+
+class OperationRegistry:
+    """This class represents a dictionary index of API operations.
+
+    Operations are keyed by operation ID, and each operation provides a dictionary
+    of its parameters keyed by parameter name. When an operation ID or parameter name
+    is present more than once, the first occurrence is retained, matching the behavior
+    of the list scans this registry replaces. Every record, including duplicates, is
+    available in definition order from the records property.
+    """
+
+    def __init__(self, endpoints: Optional[List[List[Any]]] = None):
+        """Construct an instance of the OperationRegistry class."""
+        self._endpoints: Optional[List[List[Any]]] = endpoints
+        self._fingerprint: Hashable = fingerprint(endpoints) if endpoints is not None else None
+        self._operations: Dict[str, Operation] = {}
+        self._records: List[Operation] = []
+        for endpoint in (endpoints or []):
+            self.add(self.create_operation(endpoint))
+
+    @staticmethod
+    def create_operation(endpoint: List[Any]) -> Operation:
+        """Create an operation record from an endpoint definition.
+
+        Identical parameter definitions share a single Parameter record.
+        """
+        parameters: Dict[str, Parameter] = {}
+        for param in (endpoint[5] if len(endpoint) > 5 else []):
+            detail = Parameter(param.get("name"),
+                               param.get("type"),
+                               param.get("in"),
+                               param.get("required", False),
+                               param.get("minimum"),
+                               param.get("maximum"),
+                               param.get("maxItems")
+                               )
+            parameters.setdefault(detail.name, _PARAMETERS.setdefault(detail, detail))
+
+        return Operation(endpoint[0], endpoint[1], endpoint[2], endpoint[4], parameters, endpoint)
+
+    def add(self, operation: Operation) -> None:
+        """Add an operation record to the registry, retaining the first record for each operation ID."""
+        self._records.append(operation)
+        self._operations.setdefault(operation.operation_id, operation)
+
+    def get(self, operation_id: str, default: Optional[Operation] = None) -> Optional[Operation]:
+        """Retrieve the operation for the provided operation ID."""
+        return self._operations.get(operation_id, default)
+
+    def __getitem__(self, operation_id: str) -> Operation:
+        """Retrieve the operation for the provided operation ID, raising KeyError if not found."""
+        return self._operations[operation_id]
+
+    def __contains__(self, operation_id: str) -> bool:
+        """Return a boolean indicating if the operation ID is present."""
+        return operation_id in self._operations
+
+    def __iter__(self) -> Iterator[Operation]:
+        """Iterate over the operations within the registry."""
+        return iter(self._operations.values())
+
+    def __len__(self) -> int:
+        """Return the number of operations within the registry."""
+        return len(self._operations)
+
+    @property
+    def endpoints(self) -> Optional[List[List[Any]]]:
+        """Return the endpoint list this registry indexes, if it was created from one."""
+        return self._endpoints
+
+    @property
+    def records(self) -> List[Operation]:
+        """Return every operation record, including duplicate operation IDs, in definition order."""
+        return self._records
+
+    @property
+    def stale(self) -> bool:
+        """Return a boolean indicating if the endpoint list has changed since it was indexed."""
+        return self._endpoints is not None and self._fingerprint != fingerprint(self._endpoints)
+
+
+_REGISTRIES: Dict[int, OperationRegistry] = {}
+_REGISTRY_LOCK: Lock = Lock()
+
+
+def operation_registry(endpoints: Union[List[List[Any]], OperationRegistry]) -> OperationRegistry:
+    """Retrieve the operation registry for the provided endpoint list, creating it on first use.
+
+    Registries are cached for the life of the process. Each registry retains a
+    reference to the list it indexes, so the identity of the list is a stable key.
+    The registry is recreated when the contents of the list change. Registries
+    provided in place of an endpoint list are returned as is.
+    """
+    if isinstance(endpoints, OperationRegistry):
+        return endpoints
+    registry = _REGISTRIES.get(id(endpoints), None)
+    if registry is None or registry.endpoints is not endpoints or registry.stale:
+        with _REGISTRY_LOCK:
+            registry = OperationRegistry(endpoints)
+            _REGISTRIES[id(endpoints)] = registry
+
+    return registry
+
+
+def get_operation(endpoints: Union[List[List[Any]], OperationRegistry], operation_id: str) -> Optional[Operation]:
+    """Retrieve the operation matching the provided operation ID from an endpoint list or registry."""
+    return operation_registry(endpoints).get(operation_id, None)
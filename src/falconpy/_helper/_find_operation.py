@@ -35,8 +35,9 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-from typing import Dict, List, Union
-from .._endpoint import api_endpoints
+from typing import Dict, List, Tuple, Union
+from .. import _endpoint
+from .._endpoint import Operation, OperationRegistry
 from .._error import (
     InvalidOperation,
     InvalidServiceCollection,
@@ -44,57 +45,64 @@ from .._error import (
     InvalidOperationSearch
     )
 
+# Search indexes are built on first use from the operation registry, and rebuilt when it changes.
+_SEARCH_INDEX: Dict[str, Tuple[OperationRegistry, Dict[str, Union[Operation, List[Operation]]]]] = {}
 
-def find_operation(search_for: str,  # pylint: disable=R0912
+
+def _operation_detail(found: Union[Operation, List[Operation]]) -> Union[Dict[str, str], List[Dict[str, str]]]:
+    """Return the searchable details for an operation, or a list of operations.
+
+    Descriptions are only loaded for the operations that are returned.
+    """
+    if isinstance(found, list):
+        return [_operation_detail(op) for op in found]
+
+    return {
+        "operation": found.operation_id,
+        "method": found.method,
+        "route": found.route,
+        "description": found.description,
+        "collection": found.collection
+    }
+
+
+def _search_index(search_by: str) -> Dict[str, Union[Operation, List[Operation]]]:
+    """Retrieve the search index for the requested search type, building it if necessary."""
+    registry = _endpoint.api_operations
+    registry_index, searched = _SEARCH_INDEX.get(search_by, (None, None))
+    if registry_index is not registry:
+        searched = {}
+        for op in registry.records:
+            if search_by == "id":
+                searched[op.operation_id] = op
+            elif search_by == "collection":
+                searched.setdefault(op.collection, []).append(op)
+            else:
+                searched[op.route] = op
+        _SEARCH_INDEX[search_by] = (registry, searched)
+
+    return searched
+
+
+def find_operation(search_for: str,
                    search_by: str = "id",
                    exact: bool = True
                    ) -> Union[str, List[Dict[str, str]]]:
     """Search for API operation details by ID, Collection or Route."""
-    if search_by.lower() == "id":
-        searched = {}
-        for op in api_endpoints:
-            searched[op[0]] = {
-                "operation": op[0],
-                "method": op[1],
-                "route": op[2],
-                "description": op[3],
-                "collection": op[4]
-            }
-    elif search_by.lower() == "collection":
-        searched = {}
-        for op in api_endpoints:
-            if op[4] not in searched:
-                searched[op[4]] = []
-            searched[op[4]].append({
-                "operation": op[0],
-                "method": op[1],
-                "route": op[2],
-                "description": op[3],
-                "collection": op[4]
-            })
-    elif search_by.lower() == "route":
-        searched = {}
-        for op in api_endpoints:
-            searched[op[2]] = {
-                "operation": op[0],
-                "method": op[1],
-                "route": op[2],
-                "description": op[3],
-                "collection": op[4]
-            }
-    else:
+    if search_by.lower() not in ["id", "collection", "route"]:
         raise InvalidOperationSearch
+    searched = _search_index(search_by.lower())
 
     try:
         if exact:
             if search_by == "collection":
                 search_for = search_for.lower()
-            returned = searched[search_for]
+            returned = _operation_detail(searched[search_for])
         else:
             returned = []
             for op_id, op_val in searched.items():
                 if search_for.lower() in op_id.lower():
-                    returned.append(op_val)
+                    returned.append(_operation_detail(op_val))
             if not returned:
                 raise KeyError
     except KeyError as bad_search:
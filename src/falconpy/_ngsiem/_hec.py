@@ -39,7 +39,6 @@ from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from gzip import open as gzip_open
 from logging import Logger, getLogger, FileHandler
-from time import sleep
 from typing import Dict, Union, List, Iterable, Any
 from requests import Response, Session
 from requests.exceptions import (
@@ -52,9 +51,10 @@ from requests.exceptions import (
 from ._ingest_config import IngestConfig
 from ._ingest_payload import IngestPayload
 from ._session_manager import SessionManager
+from .._auth_object import RetryPolicy
 from .._enum import IngestFormat
 from .._log import LogFacility
-from .._util import sanitize_dictionary
+from .._util import sanitize_dictionary, json_dumps, json_loads
 from .._version import _VERSION, _HEC_VERSION
 
 
@@ -78,6 +78,7 @@ class HEC:  # pylint: disable=R0902,R0904
     _last_message: str = None
     _log_facility: LogFacility = LogFacility()
     _session_manager: SessionManager = None
+    _retry_policy: RetryPolicy = None
 
     def __init__(self,
                  api_key: str,
@@ -108,6 +109,9 @@ class HEC:  # pylint: disable=R0902,R0904
             Use the NGSIEM raw ingestion endpoint. Defaults to False.
         retry_count: (integer)
             Number of request retries before erroring on the thread. Defaults to 3.
+        retry_policy: (RetryPolicy)
+            Policy used to retry failed submissions. Overrides retry_count when provided.
+            Defaults to retry_count attempts with a two second exponential backoff.
         thread_count: (integer)
             Number of threads to use for asynchronous processing.
             Defaults to CPU count * 2 or 50, whichever is smaller.
@@ -120,6 +124,7 @@ class HEC:  # pylint: disable=R0902,R0904
         self.session_manager = SessionManager(kwargs.get("thread_count", None),
                                               kwargs.get("retry_count", 3)
                                               )
+        self.retry_policy = kwargs.get("retry_policy", None)
         if debug:
             self.log_facility = LogFacility(getLogger(__name__),
                                             None,
@@ -204,53 +209,44 @@ class HEC:  # pylint: disable=R0902,R0904
                                        f"RESPONSE: {self.last_message}"
                                        ])
                 else:
-                    self.track_result(future.result().status_code, future.result().json())
+                    self.track_result(future.result().status_code, json_loads(future.result().content))
                     self.log_activity([f"STATUS CODE: {future.result().status_code}",
                                        f"RESPONSE HEADERS: {future.result().headers}",
-                                       f"RESPONSE: {future.result().json()}"
+                                       f"RESPONSE: {self.last_message}"
                                        ])
 
         return self.last_status
 
     def _retry_event(self, evt: Union[Dict[str, Any], str]) -> Response:
         response = None
-        error_condition = None
         ingest_to = self.ingest_url
         raw = None
         if self.raw_ingest:
             ingest_to = self.raw_ingest_url
             raw = evt
             evt = None
-        for transmission_count in range(1, self.retry_count+1):
-            try:
-                response = next(self.session_manager).post(ingest_to,
-                                                           headers=self.hec_headers,
-                                                           json=evt,
-                                                           verify=True,
-                                                           timeout=self.ingest_timeout,
-                                                           data=raw
-                                                           )
-                break
-
-            except (InvalidURL, SSLError) as request_error:
-                self.log_activity(f"REQUEST FAILURE: Retry #{transmission_count}")
-                self.log_activity(f"FAILURE REASON: {request_error}")
-                error_condition = request_error
-                sleep(transmission_count*2)
-
-            except (ReadTimeout, Timeout, TimeoutError, ConnectionError, RequestConnectionError):
-                error_condition = "TIMEOUT"
-                self.log_activity(f"REQUEST TIMEOUT: Retry #{transmission_count}")
-                sleep(transmission_count*2)
-
-        if transmission_count == self.retry_count:
-            if error_condition == "TIMEOUT":
-                self.log_activity(f"REQUEST TIMEOUT: {evt if evt else 'Raw file import'}")
-                self.track_result(500, "TIMEOUT ERROR: Check connectivity or increase timeout")
-            else:
-                self.log_activity(f"REQUEST FAILED: {evt if evt else 'Raw file import'}")
-                self.log_activity(f"FAILURE REASON: {error_condition}")
-                self.track_result(500, f"REQUEST FAILURE: {error_condition}")
+        elif evt is not None:
+            raw = json_dumps(evt)
+
+        def transmit() -> Response:
+            return next(self.session_manager).post(ingest_to,
+                                                   headers=self.hec_headers,
+                                                   verify=True,
+                                                   timeout=self.ingest_timeout,
+                                                   data=raw
+                                                   )
+
+        try:
+            response, _, _ = self.retry_policy.perform("POST", transmit, self.log_activity)
+
+        except (InvalidURL, SSLError) as request_error:
+            self.log_activity(f"REQUEST FAILED: {evt if evt else 'Raw file import'}")
+            self.log_activity(f"FAILURE REASON: {request_error}")
+            self.track_result(500, f"REQUEST FAILURE: {request_error}")
+
+        except (ReadTimeout, Timeout, TimeoutError, ConnectionError, RequestConnectionError):
+            self.log_activity(f"REQUEST TIMEOUT: {evt if evt else 'Raw file import'}")
+            self.track_result(500, "TIMEOUT ERROR: Check connectivity or increase timeout")
 
         return response
 
@@ -263,7 +259,7 @@ class HEC:  # pylint: disable=R0902,R0904
         self.log_activity([f"REQUEST HEADERS: {header_log}", f"EVENT PROCESSED: {event}"])
         response = self._retry_event(event)
         if response:
-            self.track_result(response.status_code, response.json())
+            self.track_result(response.status_code, json_loads(response.content))
             self.log_activity([f"RESPONSE CODE: {self.last_status}",
                                f"RESPONSE HEADERS: {response.headers}",
                                f"RESPONSE TEXT: {self.last_message}"
@@ -577,6 +573,28 @@ class HEC:  # pylint: disable=R0902,R0904
         """Set the HTTP request retry count."""
         self.session_manager.retry_count = value
 
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Return the policy used to retry failed submissions."""
+        returned = self._retry_policy
+        if not returned:
+            # Submissions are retried retry_count times, including connection failures.
+            returned = RetryPolicy(max_attempts=self.retry_count,
+                                   backoff_factor=2,
+                                   jitter=False,
+                                   unsafe=True,
+                                   errors=(InvalidURL, SSLError, ReadTimeout, Timeout, TimeoutError,
+                                           ConnectionError, RequestConnectionError
+                                           )
+                                   )
+
+        return returned
+
+    @retry_policy.setter
+    def retry_policy(self, value: RetryPolicy):
+        """Set the policy used to retry failed submissions."""
+        self._retry_policy = value
+
     @property
     def thread_count(self) -> int:
         """Return the default thread count."""
@@ -40,9 +40,9 @@ from csv import DictWriter
 from datetime import datetime, timezone
 from io import StringIO
 from inspect import getmembers
-from json import dumps
 from typing import Dict, Union
 from .._enum import TimeUnit
+from .._util import json_dumps
 
 
 class IngestPayload:
@@ -104,7 +104,7 @@ class IngestPayload:
 
         if raw:
             # Convert to a JSON string for raw payloads
-            returned = dumps(returned)
+            returned = json_dumps(returned).decode("utf-8")
 
         return returned
 
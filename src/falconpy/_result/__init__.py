@@ -37,6 +37,7 @@ For more information, please refer to <https://unlicense.org>
 """
 from ._result import Result
 from ._expanded_result import ExpandedResult
+from ._streamed_result import StreamedResult
 from ._resources import Resources, BaseResource, RawBody, BinaryFile
 from ._response_component import ResponseComponent
 from ._headers import Headers
@@ -45,5 +46,5 @@ from ._base_dictionary import BaseDictionary
 from ._errors import Errors
 
 __all__ = ["Result", "ExpandedResult", "Resources", "BaseResource", "ResponseComponent",
-           "Headers", "Meta", "BaseDictionary", "Errors", "RawBody", "BinaryFile"
+           "Headers", "Meta", "BaseDictionary", "Errors", "RawBody", "BinaryFile", "StreamedResult"
            ]
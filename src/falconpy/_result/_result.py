@@ -43,8 +43,12 @@ from ._headers import Headers
 from ._resources import Resources, BinaryFile, RawBody, ResponseComponent
 
 
-class BaseResult:
-    """Base class for all result objects."""
+class BaseResult:  # pylint: disable=R0902
+    """Base class for all result objects.
+
+    The decoded response body and headers are retained as received. The Headers, Meta,
+    Errors, Resources and RawBody components are only created the first time they are used.
+    """
 
     # _______ _______ _______ _     _  _____  ______  _______
     # |  |  | |______    |    |_____| |     | |     \ |______
@@ -61,79 +65,232 @@ class BaseResult:
 
         # Configure defaults
         self.status_code = status_code  # Will default to 0
-        self.headers = Headers()
-        self.meta = Meta()
-        self.resources = Resources([])
-        self.errors = Errors()
-        self.raw = RawBody()
+        self._source_headers: Optional[Union[Dict[str, Union[str, int, float]], CaseInsensitiveDict]] = None
+        self._source_body: Optional[Union[Dict[str, Union[str, dict, list, int, float, bytes]], list, bytes, str]] = None
+        self._headers: Optional[Headers] = None
+        self._meta: Meta = Meta()
+        self._resources: Union[Resources, BinaryFile, ResponseComponent] = Resources([])
+        self._errors: Errors = Errors()
+        self._raw: RawBody = RawBody()
         # RTR Batch session init and batch responses only
-        self.batch_id = None
-        self.batch_get_cmd_req_id = None
+        self._batch_id: Optional[str] = None
+        self._batch_get_cmd_req_id: Optional[str] = None
+        # Components are parsed from the source body the first time they are used.
+        self._parsed: bool = True
+        # Number of retries performed and seconds spent waiting before this result was received
+        self.retries = 0
+        self.retry_wait = 0.0
 
         if (status_code and headers and body) or head_request:
             self.status_code = status_code
-            _headers = headers
-            if isinstance(_headers, CaseInsensitiveDict):
-                _headers = dict(headers)
-            self.headers = Headers(_headers)
-            self._parse_body(body_rcv=body)
+            self._source_headers = headers
+            self._source_body = body if body is not None else {}
+            self._parsed = False
 
-    def _parse_body(self, body_rcv: Dict[str, Union[str, dict, list, int, float, bytes]]):
+    @staticmethod
+    def _body_kind(body_rcv: Union[Dict[str, Union[str, dict, list, int, float, bytes]], list, bytes, str]) -> str:
+        """Identify the format of a decoded response body."""
         if isinstance(body_rcv, list):
+            returned = "list"
+        elif isinstance(body_rcv, bytes):
+            returned = "binary"
+        elif isinstance(body_rcv, str):
+            returned = "text"
+        elif body_rcv.get("access_token", None):
+            returned = "authentication"
+        elif body_rcv.get("batch_id", {}):
+            returned = "batch"
+        elif body_rcv.get("combined", {}):
+            returned = "combined"
+        elif body_rcv.get("data", {}):
+            returned = "graphql"
+        elif body_rcv.get("resources", None) is None:
+            returned = "raw"
+        elif isinstance(body_rcv.get("resources", []), dict):
+            returned = "unusual"
+        else:
+            returned = "standard"
+
+        return returned
+
+    def _parse(self):
+        """Create the body components from the source body if this has not been done yet."""
+        if not self._parsed:
+            self._parsed = True
+            self._parse_body(body_rcv=self._source_body)
+
+    def _parse_body(self, body_rcv: Dict[str, Union[str, dict, list, int, float, bytes]]):
+        kind = self._body_kind(body_rcv)
+        if kind == "list":
             # Specific to report_executions_download_get returning raw
             # JSON payloads as a list. There will be no Meta or Errors
             # branch in this response.
-            self.resources = Resources(body_rcv)  # pragma: no cover
-        elif isinstance(body_rcv, bytes):
+            self._resources = Resources(body_rcv)  # pragma: no cover
+        elif kind == "binary":
             # Binary response
-            self.resources = BinaryFile(body_rcv)
-            self.meta = Meta()
-            self.errors = Errors()
-        elif isinstance(body_rcv, str):
+            self._resources = BinaryFile(body_rcv)
+        elif kind == "text":
             # Invalid or raw response
             if not body_rcv.strip():
                 body_rcv = {}
-            self.raw = RawBody(body_rcv)
-            self.meta = Meta()
-            self.resources = Resources()
-            self.errors = Errors()
-        elif body_rcv.get("access_token", None):
+            self._raw = RawBody(body_rcv)
+            self._resources = Resources()
+        elif kind == "authentication":
             # Authentication response
-            self.raw = RawBody(body_rcv)
-            self.meta = Meta()
-            self.resources = Resources()
-            self.errors = Errors()
+            self._raw = RawBody(body_rcv)
+            self._resources = Resources()
         else:
             # Standard responses, GraphQL and RTR
-            self.meta = Meta(body_rcv.get("meta", {}))
-            self.errors = Errors(body_rcv.get("errors", []))
-            # RTR Batch responses
-            if body_rcv.get("batch_id", {}):
+            self._meta = Meta(body_rcv.get("meta", {}))
+            self._errors = Errors(body_rcv.get("errors", []))
+            if kind == "batch":
                 # Batch session init returns as a dictionary
-                self.raw = RawBody(body_rcv)
-                self.batch_id = body_rcv.get("batch_id")
-                self.resources = ResponseComponent(body_rcv.get("resources"))
-            elif body_rcv.get("combined", {}):
+                self._raw = RawBody(body_rcv)
+                self._batch_id = body_rcv.get("batch_id")
+                self._resources = ResponseComponent(body_rcv.get("resources"))
+            elif kind == "combined":
                 # Batch session results return as a dictionary.
-                self.batch_get_cmd_req_id = body_rcv.get("batch_get_cmd_req_id", None)
-                self.raw = RawBody(body_rcv)
-                self.resources = ResponseComponent(body_rcv.get("combined"))
-            elif body_rcv.get("data", {}):  # pragma: no cover
+                self._batch_get_cmd_req_id = body_rcv.get("batch_get_cmd_req_id", None)
+                self._raw = RawBody(body_rcv)
+                self._resources = ResponseComponent(body_rcv.get("combined"))
+            elif kind == "graphql":  # pragma: no cover
                 # GraphQL uses a custom response payload. Due to
                 # environment constraints, this is manually tested.
-                self.raw = RawBody(body_rcv)
-                self.resources = ResponseComponent(body_rcv)
-            elif body_rcv.get("resources", None) is None:
+                self._raw = RawBody(body_rcv)
+                self._resources = ResponseComponent(body_rcv)
+            elif kind == "raw":
                 # No resources, this must be a raw dictionary
                 # Probably came from the container API
-                self.raw = RawBody(body_rcv)
-            elif isinstance(body_rcv.get("resources", []), dict):
+                self._raw = RawBody(body_rcv)
+            elif kind == "unusual":
                 # Catch unusual response payloads not explicitly handled
-                self.raw = RawBody(body_rcv)
-                self.resources = ResponseComponent(body_rcv.get("resources"))
+                self._raw = RawBody(body_rcv)
+                self._resources = ResponseComponent(body_rcv.get("resources"))
             else:
                 # Standard API responses
-                self.resources = Resources(body_rcv.get("resources", []))
+                self._resources = Resources(body_rcv.get("resources", []))
+
+    def _source_view(self) -> Union[Dict[str, Union[int, dict]], bytes]:
+        """Return the legacy dictionary form of the result using the source body without creating any components."""
+        body_rcv = self._source_body
+        kind = self._body_kind(body_rcv)
+        if kind == "binary":
+            return body_rcv
+        _body = {}
+        if kind == "list":
+            if body_rcv:
+                _body = {"meta": {}, "resources": body_rcv, "errors": []}
+        elif kind == "standard":
+            _meta = body_rcv.get("meta", {}) or {}
+            _resources = body_rcv.get("resources", [])
+            # Scalar resources are not retained by the Resources component.
+            _resources = _resources if isinstance(_resources, list) else []
+            _errors = body_rcv.get("errors", [])
+            _errors = _errors if isinstance(_errors, list) else []
+            if _meta or _resources or _errors:
+                _body = {"meta": _meta, "resources": _resources, "errors": _errors}
+        else:
+            # Every other format is returned as it was received.
+            _body = body_rcv or {}
+
+        if self._headers is not None:
+            _headers = dict(self._headers.data) if self._headers else {}
+        else:
+            _headers = dict(self._source_headers) if self._source_headers else {}
+
+        return {
+            "status_code": int(self.status_code),
+            "headers": _headers,
+            "body": _body
+        }
+
+    # Body components, created on first access
+    @property
+    def headers(self) -> Headers:
+        """Return the headers of the response."""
+        if self._headers is None:
+            _headers = self._source_headers
+            if isinstance(_headers, CaseInsensitiveDict):
+                _headers = dict(_headers)
+            self._headers = Headers(_headers)
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: Headers):
+        """Set the headers of the response."""
+        self._headers = value
+
+    @property
+    def meta(self) -> Meta:
+        """Return the meta branch of the response."""
+        self._parse()
+        return self._meta
+
+    @meta.setter
+    def meta(self, value: Meta):
+        """Set the meta branch of the response."""
+        self._parse()
+        self._meta = value
+
+    @property
+    def resources(self) -> Union[Resources, BinaryFile, ResponseComponent]:
+        """Return the resources branch of the response."""
+        self._parse()
+        return self._resources
+
+    @resources.setter
+    def resources(self, value: Union[Resources, BinaryFile, ResponseComponent]):
+        """Set the resources branch of the response."""
+        self._parse()
+        self._resources = value
+
+    @property
+    def errors(self) -> Errors:
+        """Return the errors branch of the response."""
+        self._parse()
+        return self._errors
+
+    @errors.setter
+    def errors(self, value: Errors):
+        """Set the errors branch of the response."""
+        self._parse()
+        self._errors = value
+
+    @property
+    def raw(self) -> RawBody:
+        """Return the raw body of responses that do not use the standard format."""
+        self._parse()
+        return self._raw
+
+    @raw.setter
+    def raw(self, value: RawBody):
+        """Set the raw body of the response."""
+        self._parse()
+        self._raw = value
+
+    @property
+    def batch_id(self) -> Optional[str]:
+        """Return the RTR batch session ID."""
+        self._parse()
+        return self._batch_id
+
+    @batch_id.setter
+    def batch_id(self, value: Optional[str]):
+        """Set the RTR batch session ID."""
+        self._parse()
+        self._batch_id = value
+
+    @property
+    def batch_get_cmd_req_id(self) -> Optional[str]:
+        """Return the RTR batch get command request ID."""
+        self._parse()
+        return self._batch_get_cmd_req_id
+
+    @batch_get_cmd_req_id.setter
+    def batch_get_cmd_req_id(self, value: Optional[str]):
+        """Set the RTR batch get command request ID."""
+        self._parse()
+        self._batch_get_cmd_req_id = value
 
     # Iteration handlers
     def __iter__(self):
@@ -412,7 +569,11 @@ class Result(BaseResult):
         """Full dictionary representation of the result.
 
         Used by internal methods for returning contents back to the user.
+        Until a body component is used, this is a view of the received body instead of a copy.
         """
+        if not self._parsed and not isinstance(self._source_body, str):
+            # Text bodies are wrapped by the RawBody component, which rejects them (ValueError) unless empty.
+            return self._source_view()
         if not self.binary:
             _body = self.raw.data if self.raw else {}
             _headers = {}
@@ -0,0 +1,320 @@
+"""Streamed result object.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from codecs import getincrementaldecoder
+from json import JSONDecoder, JSONDecodeError
+from typing import Any, Dict, Iterator, List, Optional, Union
+from requests import Response
+from ._errors import Errors
+from ._headers import Headers
+from ._meta import Meta
+from ._result import Result
+from .._util._codec import json_loads
+
+# Content types decoded as newline delimited JSON (one record per line).
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl",
+                        "application/x-jsonlines", "application/json-seq", "application/stream+json"
+                        )
+
+# Whitespace permitted between JSON tokens.
+_WHITESPACE = " \t\r\n"
+# Characters that may follow a complete value within a JSON document.
+_DELIMITERS = tuple(" \t\r\n,:]}")
+
+
+class StreamedResult:  # pylint: disable=R0902
+    """Iterate over the records of a streamed API response, decoding them one at a time.
+
+    JSON documents are parsed incrementally as the body is received. Every element of the
+    resources array (or of a top level array) is yielded as soon as it has been decoded, and
+    the remaining top level keys (meta, errors, etc.) are retained. Newline delimited JSON
+    bodies yield one record per line. Only the record being decoded is held in memory.
+
+    Keys that precede the resources array (meta within Falcon API responses) are available as
+    soon as the first record is yielded, keys that follow it (errors) once iteration completes.
+    The response is closed when iteration completes, or when used as a context manager.
+
+    Example:
+        with hosts.stream("get_device_details_v2", ids=device_ids) as results:
+            for device in results:
+                print(device["hostname"])
+            print(results.errors)
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 response: Union[Response, Result, Dict[str, Any]],
+                 resources_key: str = "resources",
+                 ndjson: Optional[bool] = None,
+                 chunk_size: int = 65536
+                 ):
+        """Construct an instance of the StreamedResult class.
+
+        Keyword arguments
+        ----
+        response : requests.Response, Result or dict
+            Response returned by a request performed with stream=True. Results (and results in the
+            standard dictionary format) are also accepted so that errors returned by the SDK before
+            the request is made can be handled the same way.
+        resources_key : str
+            Top level key containing the array of records. [Default: resources]
+        ndjson : bool
+            Decode the body as newline delimited JSON. [Default: Determined by the content type]
+        chunk_size : int
+            Number of bytes read from the response at a time. [Default: 65536]
+        """
+        self._response: Optional[Response] = None
+        self._records: Optional[List[Any]] = None
+        self._body: Dict[str, Any] = {}
+        self._count: int = 0
+        self._key = resources_key
+        self._chunk_size = chunk_size
+        self._decoder = JSONDecoder()
+        self._text = getincrementaldecoder("utf-8")()
+        self._chunks: Optional[Iterator[bytes]] = None
+        self._buffer: str = ""
+        self._pos: int = 0
+        self._eof: bool = False
+        if isinstance(response, Response):
+            self._response = response
+            self.status_code: int = response.status_code
+            self._headers = response.headers
+            if ndjson is None:
+                content_type = response.headers.get("Content-Type", "").lower()
+                ndjson = content_type.startswith(NDJSON_CONTENT_TYPES) or not content_type.startswith("application/json")
+            self._ndjson: bool = ndjson
+        else:
+            # The request was not performed or was not streamed.
+            full = response.full_return if isinstance(response, Result) else response
+            self.status_code = full.get("status_code", 0)
+            self._headers = full.get("headers", {})
+            body = full.get("body", {})
+            self._ndjson = False
+            if isinstance(body, list):
+                self._records = body
+            elif isinstance(body, dict):
+                self._body = {key: value for key, value in body.items() if key != resources_key}
+                self._records = body.get(resources_key, None) or []
+            else:
+                self._records = []
+        self._iterator: Iterator[Any] = self._iterate()
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def __iter__(self) -> "StreamedResult":
+        """Return this object, records can only be iterated over once."""
+        return self
+
+    def __next__(self) -> Any:
+        """Return the next record."""
+        return next(self._iterator)
+
+    def __enter__(self) -> "StreamedResult":
+        """Open the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the response when leaving the context manager."""
+        self.close()
+
+    def close(self):
+        """Close the response, releasing the connection."""
+        if self._response is not None:
+            self._response.close()
+
+    def _iterate(self) -> Iterator[Any]:
+        """Yield every record, closing the response once all records have been yielded."""
+        if self._records is not None:
+            source = iter(self._records)
+        elif self._ndjson:
+            source = self._lines()
+        else:
+            self._chunks = self._response.iter_content(chunk_size=self._chunk_size)
+            source = self._document()
+        try:
+            for record in source:
+                self._count += 1
+                yield record
+        finally:
+            self.close()
+
+    def _lines(self) -> Iterator[Any]:
+        """Decode newline delimited JSON, one record per line."""
+        for line in self._response.iter_lines(chunk_size=self._chunk_size):
+            if line.strip():
+                yield json_loads(line)
+
+    def _document(self) -> Iterator[Any]:
+        """Decode a JSON document, yielding the elements of the resources array (or top level array)."""
+        start = self._peek()
+        if start == "[":
+            self._pos += 1
+            yield from self._array()
+        elif start == "{":
+            self._pos += 1
+            while True:
+                token = self._peek()
+                if token == "}":
+                    break
+                if not token:
+                    raise JSONDecodeError("Unterminated object", self._buffer, self._pos)
+                if token == ",":
+                    self._pos += 1
+                    continue
+                key = self._value()
+                self._expect(":")
+                if key == self._key and self._peek() == "[":
+                    self._pos += 1
+                    yield from self._array()
+                else:
+                    self._body[key] = self._value()
+        elif start:
+            # Any other value is the only record.
+            yield self._value()
+
+    def _array(self) -> Iterator[Any]:
+        """Yield the elements of an array, the opening bracket has already been consumed."""
+        while True:
+            token = self._peek()
+            if token == "]":
+                self._pos += 1
+                break
+            if not token:
+                raise JSONDecodeError("Unterminated array", self._buffer, self._pos)
+            if token == ",":
+                self._pos += 1
+                continue
+            yield self._value()
+
+    def _expect(self, token: str):
+        """Consume the provided token, raising an error if it is not the next token."""
+        if self._peek() != token:
+            raise JSONDecodeError(f"Expecting '{token}' delimiter", self._buffer, self._pos)
+        self._pos += 1
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it (empty at the end of the body)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                break
+
+        return self._buffer[self._pos:self._pos + 1]
+
+    def _value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # Values must be followed by a delimiter, numbers may otherwise continue in the next chunk.
+                if self._eof or self._buffer[end:end + 1] in _DELIMITERS:
+                    break
+            except JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+        self._pos = end
+
+        return value
+
+    def _fill(self) -> bool:
+        """Read from the response until the unparsed portion of the buffer has at least doubled.
+
+        Returns False when the end of the body has been reached.
+        """
+        # Discard the portion of the buffer that has already been parsed.
+        pending = [self._buffer[self._pos:]]
+        self._pos = 0
+        wanted = max(len(pending[0]), 1)
+        received = 0
+        while received < wanted and not self._eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._eof = True
+                pending.append(self._text.decode(b"", final=True))
+            else:
+                pending.append(self._text.decode(chunk))
+            received += len(pending[-1])
+        self._buffer = "".join(pending)
+
+        return bool(received)
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def meta(self) -> Meta:
+        """Return the meta branch of the response body, as received so far."""
+        return Meta(self._body.get("meta", None) or {})
+
+    @property
+    def errors(self) -> Errors:
+        """Return the errors branch of the response body, as received so far."""
+        return Errors(self._body.get("errors", None) or [])
+
+    @property
+    def headers(self) -> Headers:
+        """Return the response headers."""
+        return Headers(dict(self._headers))
+
+    @property
+    def body(self) -> Dict[str, Any]:
+        """Return the top level keys of the response body received so far, excluding the records."""
+        return self._body
+
+    @property
+    def count(self) -> int:
+        """Return the number of records yielded so far."""
+        return self._count
+
+    @property
+    def ndjson(self) -> bool:
+        """Return a boolean indicating if the body is decoded as newline delimited JSON."""
+        return self._ndjson
+
+    @property
+    def response(self) -> Optional[Response]:
+        """Return the streamed response."""
+        return self._response
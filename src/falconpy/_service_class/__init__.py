@@ -37,5 +37,14 @@ For more information, please refer to <https://unlicense.org>
 """
 from ._base_service_class import BaseServiceClass
 from ._service_class import ServiceClass
-
-__all__ = ["BaseServiceClass", "ServiceClass"]
+from ._async_service_class import AsyncServiceClass
+from ._paginator import Paginator, ParallelPaginator
+from ._pipeline import DetailsPipeline
+from ._bulk import BulkDispatcher, BulkResult
+from ._shard import ShardedScan
+from ._tuner import PageSizeTuner
+from ._download import FileDownloader, DownloadResult
+
+__all__ = ["BaseServiceClass", "ServiceClass", "AsyncServiceClass", "Paginator", "ParallelPaginator",
+           "DetailsPipeline", "BulkDispatcher", "BulkResult", "ShardedScan",
+           "PageSizeTuner", "FileDownloader", "DownloadResult"]
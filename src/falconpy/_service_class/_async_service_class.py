@@ -0,0 +1,127 @@
+"""FalconPy asynchronous Service Class interface.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import functools
+from typing import Any, Callable, Dict, Optional, Union
+from requests import Response
+from .. import _endpoint
+from .._result import Result
+from .._util import get_executor, run_async, async_process_service_request
+
+# Path variables that are provided to process_service_request as keywords.
+PATH_KEYWORDS = ("partition", "distinct_field", "image_id", "collection_name", "collection_version",
+                 "object_key", "schema_version", "vertex_type", "path_id")
+
+
+class AsyncServiceClass:
+    """Awaitable interface to the methods of a Service Class.
+
+    Each public method of the wrapped Service Class is exposed as a coroutine
+    function that performs the operation within the worker pool owned by the
+    auth_object, so the running event loop is not blocked. These method wrappers
+    still use the blocking requests transport, and the number of requests in
+    flight at once is limited to max_workers (Default: pool_maxsize, 10).
+
+    The command method performs any operation using a non-blocking transport
+    instead (async_process_service_request), when httpx is installed. Requests
+    made this way do not occupy a worker, so one event loop can keep hundreds of
+    requests in flight. Without httpx, command also falls back to the worker pool.
+
+    Requests are crafted, performed and parsed using the exact same endpoint
+    definitions, payload handlers and Result objects as the synchronous methods.
+
+    Example:
+        hosts = Hosts(client_id=CLIENT_ID, client_secret=CLIENT_SECRET)
+        results = await asyncio.gather(*[hosts.aio.command("GetDeviceDetailsV2", ids=batch) for batch in batches])
+    """
+
+    def __init__(self, service: object):
+        """Construct an instance of the AsyncServiceClass class."""
+        self._service = service
+
+    def __getattr__(self, name: str) -> Any:
+        """Return an awaitable version of the requested Service Class method."""
+        attribute = getattr(self._service, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        returned = self._wrap(attribute)
+        # Cache the wrapper so subsequent lookups bypass this handler.
+        setattr(self, name, returned)
+
+        return returned
+
+    def _wrap(self, method: Callable) -> Callable:
+        """Create a coroutine function executing the provided method within the worker pool."""
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs):
+            return await run_async(get_executor(self._service), method, *args, **kwargs)
+
+        return wrapper
+
+    async def command(self,
+                      operation_id: str,
+                      parameters: Optional[Dict[str, Any]] = None,
+                      body: Optional[Dict[str, Any]] = None,
+                      data: Optional[Union[Dict[str, Any], bytes]] = None,
+                      **kwargs
+                      ) -> Union[Dict[str, Union[int, dict]], Result, Response, bytes]:
+        """Perform the requested API operation without blocking the event loop.
+
+        Keyword arguments:
+        operation_id -- Operation ID to perform. String.
+        parameters -- Full query string parameters payload. Dictionary.
+        body -- Full body payload. Dictionary.
+        data -- Data payload. Dictionary or bytes.
+
+        Query string parameters and path variables accepted by the operation may also be
+        provided as keywords, as they are to the Service Class method for the operation.
+        """
+        return await async_process_service_request(calling_object=self._service,
+                                                   endpoints=_endpoint.api_operations,
+                                                   operation_id=operation_id,
+                                                   keywords=kwargs,
+                                                   params=parameters if parameters is not None else {},
+                                                   body=body,
+                                                   data=data,
+                                                   **{key: value for key, value in kwargs.items() if key in PATH_KEYWORDS}
+                                                   )
+
+    @property
+    def service(self) -> object:
+        """Return the wrapped Service Class."""
+        return self._service
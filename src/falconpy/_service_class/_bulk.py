@@ -0,0 +1,296 @@
+"""FalconPy bulk request dispatcher.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from collections import deque
+from collections.abc import Hashable
+from concurrent.futures import Executor, Future, FIRST_COMPLETED, wait
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from ._paginator import Paginator
+from .._error import APIError
+from .._result import Result
+from .._util import get_executor, in_worker
+
+# Status codes that indicate a failure that may succeed when the item is sent again.
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Outcome of each item contained within a batch.
+# Successful items map to a value (such as the ID of the created resource), failed
+# items map to a tuple containing the error message and a flag indicating if it may be retried.
+Outcome = Tuple[Dict[Hashable, Any], Dict[Hashable, Tuple[str, bool]]]
+
+
+class BulkResult:
+    """Compact summary of the outcome for each item sent by the BulkDispatcher.
+
+    Only the key of each item and its outcome is retained, responses are discarded once parsed.
+    """
+
+    def __init__(self):
+        """Construct an instance of the BulkResult class."""
+        self._succeeded: Dict[Hashable, Any] = {}
+        self._failed: Dict[Hashable, str] = {}
+        self._requests: int = 0
+        self._retries: int = 0
+
+    def success(self, key: Hashable, value: Any = True):
+        """Record the successful outcome for an item."""
+        self._failed.pop(key, None)
+        self._succeeded[key] = value
+
+    def failure(self, key: Hashable, message: str):
+        """Record the failed outcome for an item."""
+        if key not in self._succeeded:
+            self._failed[key] = message
+
+    def __repr__(self) -> str:
+        """Return a summary of the outcome."""
+        return f"BulkResult(succeeded={len(self._succeeded)}, failed={len(self._failed)}, " \
+               f"requests={self._requests}, retries={self._retries})"
+
+    @property
+    def succeeded(self) -> Dict[Hashable, Any]:
+        """Return the items that succeeded, mapped to the value returned for each."""
+        return self._succeeded
+
+    @property
+    def failed(self) -> Dict[Hashable, str]:
+        """Return the items that failed, mapped to the error message returned for each."""
+        return self._failed
+
+    @property
+    def processed(self) -> int:
+        """Return the number of items with a final outcome."""
+        return len(self._succeeded) + len(self._failed)
+
+    @property
+    def ok(self) -> bool:
+        """Return a boolean indicating if every item succeeded."""
+        return not self._failed
+
+    @property
+    def requests(self) -> int:
+        """Return the number of requests performed."""
+        return self._requests
+
+    @requests.setter
+    def requests(self, value: int):
+        """Set the number of requests performed."""
+        self._requests = value
+
+    @property
+    def retries(self) -> int:
+        """Return the number of items that were sent again."""
+        return self._retries
+
+    @retries.setter
+    def retries(self, value: int):
+        """Set the number of items that were sent again."""
+        self._retries = value
+
+
+class BulkDispatcher:
+    """Send a large number of items to an API operation in batches using concurrent requests.
+
+    Items are read from the provided iterable as batches are needed, and no more than max_workers
+    batches are in flight at any time. Requests are performed using the worker pool owned by the
+    auth_object, so they are paced by the rate limiter shared with every other request.
+
+    Only the items that failed with a retryable error are sent again, up to max_attempts times.
+    The outcome for each item is returned as a BulkResult.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,  # pylint: disable=R0913,R0917
+                 send: Callable[[List[Any]], Union[Dict[str, Union[int, dict, list]], Result]],
+                 outcome: Callable[[List[Any], Union[Dict[str, Union[int, dict, list]], Result]], Outcome],
+                 key: Callable[[Any], Hashable],
+                 batch_size: int = 100,
+                 max_workers: int = 4,
+                 max_attempts: int = 3,
+                 progress: Optional[Callable[[BulkResult], None]] = None,
+                 executor: Optional[Executor] = None
+                 ):
+        """Construct an instance of the BulkDispatcher class.
+
+        Keyword arguments
+        ----
+        send : callable
+            Performs the request for a batch, provided as a list of items.
+        outcome : callable
+            Parses the result returned for a batch, returning the successful and failed items.
+        key : callable
+            Returns the key used to identify an item within the outcome.
+        batch_size : int
+            Maximum number of items sent per request. [Default: 100]
+        max_workers : int
+            Maximum number of requests in flight at the same time. [Default: 4]
+        max_attempts : int
+            Maximum number of times an item is sent. [Default: 3]
+        progress : callable
+            Called with the BulkResult each time a batch completes.
+        executor : Executor
+            Worker pool used to send batches. [Default: The auth_object worker pool]
+        """
+        self._send = send
+        self._outcome = outcome
+        self._key = key
+        self._batch_size: int = max(int(batch_size), 1)
+        self._max_workers: int = max(int(max_workers), 1)
+        self._max_attempts: int = max(int(max_attempts), 1)
+        self._progress = progress
+        self._executor: Optional[Executor] = None
+        if not in_worker():
+            # Batches are sent in the current thread when we are already running within a worker.
+            self._executor = executor or get_executor(getattr(send, "__self__", None))
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    @staticmethod
+    def failure_message(result: Union[Dict[str, Union[int, dict, list]], Result], default: str = "Request failed") -> str:
+        """Return the first error message contained within a result."""
+        # EAFP
+        try:
+            errors = result.errors.data if isinstance(result, Result) else result["body"]["errors"]
+            returned = str(errors[0]["message"])
+        except (AttributeError, IndexError, KeyError, TypeError):
+            returned = default
+
+        return returned
+
+    def _submit(self, batch: List[Any]) -> Future:
+        """Send the batch using the worker pool, or within the current thread when one is not available."""
+        if self._executor:
+            returned = self._executor.submit(self._send, batch)
+        else:
+            returned = Future()
+            try:
+                returned.set_result(self._send(batch))
+            except Exception as err:  # pylint: disable=W0703  # Raised when the result is requested
+                returned.set_exception(err)
+
+        return returned
+
+    def _next_batch(self, items: Iterator[Any], retry: Deque[Any]) -> Optional[List[Any]]:
+        """Return the next batch, sending items awaiting a retry first. Returns None when nothing remains."""
+        batch = [retry.popleft() for _ in range(min(len(retry), self._batch_size))]
+        batch.extend(islice(items, self._batch_size - len(batch)))
+
+        return batch or None
+
+    def _complete(self,
+                  future: Future,
+                  batch: List[Any],
+                  attempts: Dict[Hashable, int],
+                  retry: Deque[Any],
+                  returned: BulkResult
+                  ):
+        """Record the outcome of a completed batch, queueing retryable failures."""
+        try:
+            result = future.result()
+            status_code = Paginator.page_content(result)[0]
+            succeeded, failed = self._outcome(batch, result)
+            message = self.failure_message(result)
+        except APIError as api_error:
+            # Pythonic mode raises when the request fails.
+            status_code, succeeded, failed, message = api_error.code, {}, {}, str(api_error.message)
+        retryable = status_code in RETRYABLE_STATUS_CODES
+        for item in batch:
+            key = self._key(item)
+            if key in succeeded:
+                returned.success(key, succeeded[key])
+                attempts.pop(key, None)
+                continue
+            error, can_retry = failed.get(key, (message, retryable))
+            if can_retry and attempts.get(key, 1) < self._max_attempts:
+                attempts[key] = attempts.get(key, 1) + 1
+                returned.retries += 1
+                retry.append(item)
+            else:
+                returned.failure(key, error)
+                attempts.pop(key, None)
+
+    def dispatch(self, items: Iterable[Any]) -> BulkResult:
+        """Send every provided item and return the outcome for each."""
+        returned = BulkResult()
+        retry: Deque[Any] = deque()
+        attempts: Dict[Hashable, int] = {}
+        source = iter(items)
+        pending: Dict[Future, List[Any]] = {}
+        try:
+            while True:
+                while len(pending) < self._max_workers:
+                    batch = self._next_batch(source, retry)
+                    if batch is None:
+                        break
+                    pending[self._submit(batch)] = batch
+                    returned.requests += 1
+                if not pending:
+                    break
+                for future in wait(pending, return_when=FIRST_COMPLETED).done:
+                    self._complete(future, pending.pop(future), attempts, retry, returned)
+                    if self._progress:
+                        self._progress(returned)
+        finally:
+            for future in pending:
+                future.cancel()
+
+        return returned
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def batch_size(self) -> int:
+        """Return the maximum number of items sent per request."""
+        return self._batch_size
+
+    @property
+    def max_workers(self) -> int:
+        """Return the maximum number of requests in flight at the same time."""
+        return self._max_workers
+
+    @property
+    def max_attempts(self) -> int:
+        """Return the maximum number of times an item is sent."""
+        return self._max_attempts
@@ -0,0 +1,312 @@
+"""FalconPy streaming file download.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import os
+import re
+from hashlib import sha256
+from typing import BinaryIO, Callable, Dict, Optional, Tuple, Union
+from requests import Response
+from requests.exceptions import ChunkedEncodingError, ConnectionError as RequestConnectionError, Timeout
+from .._result import Result
+from .._util import calc_content_return
+
+# A file path or a binary file object opened for writing.
+Destination = Union[str, os.PathLike, BinaryIO]
+
+# Default number of bytes read from the response and written at a time (1 MB).
+DOWNLOAD_CHUNK_SIZE = 1048576
+
+# Errors raised by requests when a transfer is interrupted.
+INTERRUPTED_ERRORS = (ChunkedEncodingError, RequestConnectionError, Timeout)
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-\d+/(\d+|\*)")
+
+
+class DownloadResult:  # pylint: disable=R0902
+    """Outcome of a file download performed by the FileDownloader."""
+
+    def __init__(self, path: Optional[str] = None):
+        """Construct an instance of the DownloadResult class."""
+        self._path = path
+        self.status_code: int = 0
+        self.headers: Dict[str, str] = {}
+        self.size: int = 0
+        self.total: Optional[int] = None
+        self.sha256: Optional[str] = None
+        self.attempts: int = 0
+        self.resumed: int = 0
+        self.error: Optional[str] = None
+        self.result: Optional[Union[Dict[str, Union[int, dict, list]], Result]] = None
+
+    def __repr__(self) -> str:
+        """Return a summary of the outcome."""
+        return f"DownloadResult(status_code={self.status_code}, size={self.size}, " \
+               f"attempts={self.attempts}, resumed={self.resumed}, ok={self.ok})"
+
+    @property
+    def path(self) -> Optional[str]:
+        """Return the path the file was written to, None when written to a file object."""
+        return self._path
+
+    @property
+    def ok(self) -> bool:
+        """Return a boolean indicating if the entire file was received."""
+        return self.error is None and self.status_code in (200, 206, 416)
+
+
+class FileDownloader:
+    """Write a file returned by an API operation to a path or file object as it is received.
+
+    The body is read in chunks of chunk_size bytes, so memory use does not depend on the size of
+    the file, and the SHA256 of the file is calculated while it is written. When the transfer is
+    interrupted it is resumed from the last byte received using a Range request if the server
+    supports it (or restarted otherwise), up to max_attempts times.
+
+    Files written to a path are received as path.part and renamed once complete. When resume is
+    enabled, a partial file left by a previous download of the same path is resumed.
+
+    The request callable is provided with the headers to add to the request, and must return
+    the response of the request performed with stream=True.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,  # pylint: disable=R0913,R0917
+                 request: Callable[[Dict[str, str]], Union[Response, Dict[str, Union[int, dict, list]], Result]],
+                 chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+                 max_attempts: int = 3,
+                 resume: bool = True,
+                 progress: Optional[Callable[[int, Optional[int]], None]] = None,
+                 pythonic: bool = False
+                 ):
+        """Construct an instance of the FileDownloader class.
+
+        Keyword arguments
+        ----
+        request : callable
+            Performs the request with the provided headers, returning the streamed response.
+        chunk_size : int
+            Number of bytes read and written at a time. [Default: 1048576]
+        max_attempts : int
+            Maximum number of requests performed for the file. [Default: 3]
+        resume : bool
+            Resume interrupted transfers using Range requests. [Default: True]
+        progress : callable
+            Called with the number of bytes received and the total size (None when unknown) for every chunk.
+        pythonic : bool
+            Return failed responses as Result objects, raising an APIError. [Default: False]
+        """
+        self._request = request
+        self._chunk_size: int = max(int(chunk_size), 1)
+        self._max_attempts: int = max(int(max_attempts), 1)
+        self._resume: bool = resume
+        self._progress = progress
+        self._pythonic: bool = pythonic
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    @staticmethod
+    def content_range(response: Response) -> Tuple[Optional[int], Optional[int]]:
+        """Return the first byte and total size provided by the Content-Range header of a response."""
+        returned = (None, None)
+        match = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+        if match:
+            returned = (int(match.group(1)), None if match.group(2) == "*" else int(match.group(2)))
+        elif response.headers.get("Content-Range", "").startswith("bytes */"):
+            # Range not satisfiable responses only provide the total size.
+            returned = (None, int(response.headers["Content-Range"].split("/")[1]))
+
+        return returned
+
+    @staticmethod
+    def _rewind(handle: BinaryIO, start: int):
+        """Discard everything written to the file after the starting position."""
+        if not handle.seekable():
+            raise OSError("Cannot restart the download, the destination is not seekable")
+        handle.seek(start)
+        handle.truncate()
+
+    def _received(self, handle: BinaryIO, start: int) -> Tuple[int, "sha256"]:
+        """Return the size and hash of a partial file that has already been written."""
+        digest = sha256()
+        handle.seek(start)
+        for chunk in iter(lambda: handle.read(self._chunk_size), b""):
+            digest.update(chunk)
+
+        return handle.tell() - start, digest
+
+    def _write(self, response: Response, handle: BinaryIO, digest: "sha256", returned: DownloadResult):
+        """Write the body of the response to the handle as it is received, updating the hash and size."""
+        for chunk in response.iter_content(chunk_size=self._chunk_size):
+            handle.write(chunk)
+            digest.update(chunk)
+            returned.size += len(chunk)
+            if self._progress:
+                self._progress(returned.size, returned.total)
+
+    def _connect(self, returned: DownloadResult) -> Union[Response, bool]:
+        """Request the remainder of the file.
+
+        Returns the response, or a boolean indicating if another attempt should be made when the
+        request failed. A reconnect that could not be made counts as an interrupted attempt.
+        """
+        reconnect = returned.attempts > 1
+        try:
+            response = self._request({"Range": f"bytes={returned.size}-"} if returned.size else {})
+        except INTERRUPTED_ERRORS as interrupted:
+            # Connection failures are raised in pythonic mode.
+            if not reconnect:
+                raise
+            returned.error = str(interrupted)
+            return True
+        if not isinstance(response, Response):
+            # The request was not performed.
+            returned.result = response
+            returned.status_code = response.status_code if isinstance(response, Result) \
+                else response.get("status_code", 0)
+            returned.error = "Request failed"
+            response = reconnect and returned.status_code == 500
+
+        return response
+
+    def _transfer(self, handle: BinaryIO, start: int, returned: DownloadResult, existing: bool = False):
+        """Request the file until it is complete or max_attempts is reached, writing it to the handle."""
+        returned.size, digest = self._received(handle, start) if existing else (0, sha256())
+        resumable = bool(returned.size)
+        complete = False
+        while not complete and returned.attempts < self._max_attempts:
+            returned.attempts += 1
+            if returned.size and not resumable:
+                self._rewind(handle, start)
+                returned.size, digest = 0, sha256()
+            response = self._connect(returned)
+            if not isinstance(response, Response):
+                if response:
+                    continue
+                return
+            returned.status_code = response.status_code
+            returned.headers = dict(response.headers)
+            first, total = self.content_range(response)
+            try:
+                if response.status_code == 416 and returned.size and total == returned.size:
+                    # Everything has already been received.
+                    returned.total = total
+                    complete = True
+                elif response.status_code not in (200, 206):
+                    returned.result, _ = calc_content_return(response, False, False, None, self._pythonic, "GET")
+                    returned.error = f"Request failed with status code {response.status_code}"
+                    return
+                else:
+                    if returned.size and (response.status_code == 200 or first != returned.size):
+                        # The range was not honored, so the entire file is being sent again.
+                        self._rewind(handle, start)
+                        returned.size, digest = 0, sha256()
+                        total = None
+                    elif returned.size:
+                        returned.resumed += 1
+                    # Sizes are unknown when the content is encoded (compressed) in transit.
+                    encoded = response.headers.get("Content-Encoding", "identity") != "identity"
+                    if total is None and not encoded and response.headers.get("Content-Length", None) is not None:
+                        total = returned.size + int(response.headers["Content-Length"])
+                    returned.total = total
+                    ranged = response.status_code == 206 or response.headers.get("Accept-Ranges", "") == "bytes"
+                    resumable = self._resume and not encoded and ranged
+                    self._write(response, handle, digest, returned)
+                    complete = total is None or returned.size >= total
+                    if not complete:
+                        returned.error = "Connection closed before the entire file was received"
+            except INTERRUPTED_ERRORS as interrupted:
+                returned.error = str(interrupted)
+            finally:
+                response.close()
+        if complete:
+            returned.error = None
+            returned.result = None
+            returned.sha256 = digest.hexdigest()
+
+    def download(self, destination: Destination, expected_sha256: Optional[str] = None) -> DownloadResult:
+        """Download the file to the provided path or binary file object, returning the outcome.
+
+        When expected_sha256 is provided, a file with a different SHA256 is reported as failed
+        (and removed when written to a path).
+        """
+        path = os.fspath(destination) if isinstance(destination, (str, os.PathLike)) else None
+        returned = DownloadResult(path)
+        if path is None:
+            self._transfer(destination, destination.tell() if destination.seekable() else 0, returned)
+        else:
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            existing = self._resume and os.path.exists(f"{path}.part")
+            try:
+                with open(f"{path}.part", "r+b" if existing else "w+b") as handle:
+                    self._transfer(handle, 0, returned, existing)
+            finally:
+                if not returned.ok and not os.path.getsize(f"{path}.part"):
+                    # Nothing was received, so there is nothing to resume.
+                    os.remove(f"{path}.part")
+        if returned.ok and expected_sha256 and returned.sha256 != expected_sha256.lower():
+            returned.error = f"SHA256 mismatch, expected {expected_sha256.lower()} but received {returned.sha256}"
+            if path:
+                os.remove(f"{path}.part")
+        elif returned.ok and path:
+            os.replace(f"{path}.part", path)
+
+        return returned
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def chunk_size(self) -> int:
+        """Return the number of bytes read and written at a time."""
+        return self._chunk_size
+
+    @property
+    def max_attempts(self) -> int:
+        """Return the maximum number of requests performed for a file."""
+        return self._max_attempts
+
+    @property
+    def resume(self) -> bool:
+        """Return a boolean indicating if interrupted transfers are resumed."""
+        return self._resume
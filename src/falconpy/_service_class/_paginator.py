@@ -0,0 +1,594 @@
+"""FalconPy pagination helper.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from json import dumps
+from time import monotonic
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
+from requests.exceptions import Timeout
+from ._tuner import PageSizeTuner, TIMEOUT_STATUS_CODES, LIMIT_REFUSED_STATUS_CODE
+from .. import _endpoint
+from .._endpoint import Operation
+from .._error import APIError
+from .._result import Result
+from .._util import get_executor
+
+# Pagination styles recognized by the Paginator.
+PAGINATION_STYLES = ("offset", "scroll", "after", "next_token", "none")
+
+
+class Paginator:
+    """Iterate lazily over every resource returned by a paginated API operation.
+
+    The pagination style is detected from the endpoint definition for the operation,
+    falling back to the pagination branch of the metadata returned with the first page.
+
+    offset     - Integer offset, advanced by the number of resources returned until total is reached.
+    scroll     - String offset token returned in meta.pagination.offset (expires_at is provided).
+    after      - Cursor token returned in meta.pagination.after.
+    next_token - Cursor token returned in meta.pagination.next_token.
+    none       - The operation is not paginated, only one page is requested.
+
+    While the caller processes the current page, the next page is requested in the
+    background using the worker pool owned by the auth_object.
+
+    When a PageSizeTuner is provided, the limit of each page is adjusted using the latency
+    and size of the pages already returned. Pages that fail with a timeout are requested
+    again using a smaller limit.
+
+    Example:
+        hosts = Hosts(client_id=CLIENT_ID, client_secret=CLIENT_SECRET)
+        for device_id in hosts.paginate("query_devices_by_filter_scroll", filter="platform_name:'Windows'"):
+            print(device_id)
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 method: Callable,
+                 operation: Optional[Operation] = None,
+                 prefetch: bool = True,
+                 max_pages: Optional[int] = None,
+                 executor: Optional[Executor] = None,
+                 tuner: Optional[PageSizeTuner] = None,
+                 **kwargs
+                 ):
+        """Construct an instance of the Paginator class.
+
+        Keyword arguments
+        ----
+        method : callable
+            Service Class method used to retrieve each page.
+        operation : Operation
+            Registry record for the operation. Used to detect the pagination style.
+        prefetch : bool
+            Flag specifying if the next page should be requested in the background. [Default: True]
+        max_pages : int
+            Maximum number of pages to retrieve. [Default: No limit]
+        executor : Executor
+            Worker pool used to prefetch pages. [Default: The auth_object worker pool]
+        tuner : PageSizeTuner
+            Tuner used to adjust the limit of each page. [Default: The limit provided is used]
+
+        All other keywords are provided to the method when each page is requested.
+        """
+        if not callable(method):
+            raise ValueError("A callable method must be provided to the Paginator.")
+        self._method: Callable = method
+        self._operation: Optional[Operation] = operation
+        self._prefetch: bool = bool(prefetch)
+        self._max_pages: Optional[int] = None
+        if isinstance(max_pages, int) and max_pages > 0:
+            self._max_pages = max_pages
+        self._executor: Optional[Executor] = executor
+        self._tuner: Optional[PageSizeTuner] = tuner
+        self._keywords: Dict[str, Any] = kwargs
+        self._style: Optional[str] = self.detect_style(operation)
+        self._result: Optional[Union[Dict[str, Union[int, dict, list]], Result]] = None
+        self._pages: int = 0
+        self._count: int = 0
+        self._total: Optional[int] = None
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    @staticmethod
+    def detect_style(operation: Optional[Operation]) -> Optional[str]:
+        """Detect the pagination style using the parameters accepted by the operation.
+
+        Returns None when the operation is not known, the style is then detected from the first page.
+        """
+        returned = None
+        if operation:
+            parameters = operation.parameters
+            returned = "none"
+            if "after" in parameters:
+                returned = "after"
+            elif "next_token" in parameters:
+                returned = "next_token"
+            elif "offset" in parameters:
+                returned = "offset" if parameters["offset"].type == "integer" else "scroll"
+
+        return returned
+
+    @staticmethod
+    def detect_page_style(pagination: Dict[str, Any]) -> str:
+        """Detect the pagination style using the pagination branch of the returned metadata."""
+        if pagination.get("after", None):
+            returned = "after"
+        elif pagination.get("next_token", None):
+            returned = "next_token"
+        elif pagination.get("expires_at", None) or isinstance(pagination.get("offset", None), str):
+            returned = "scroll"
+        elif "offset" in pagination:
+            returned = "offset"
+        else:
+            returned = "none"
+
+        return returned
+
+    @staticmethod
+    def page_content(page: Union[Dict[str, Union[int, dict, list]], Result]
+                     ) -> Tuple[int, Dict[str, Any], List[Any]]:
+        """Return the status code, pagination detail and resources contained within a page."""
+        if isinstance(page, Result):
+            status_code = page.status_code
+            pagination = page.meta.pagination
+            resources = page.resources.data if isinstance(page.resources.data, list) else []
+        else:
+            # EAFP
+            try:
+                status_code = page.get("status_code", 0)
+                body = page.get("body", {})
+                pagination = body.get("meta", {}).get("pagination", {})
+                resources = body.get("resources", [])
+            except AttributeError:
+                status_code, pagination, resources = 0, {}, []
+        if not isinstance(pagination, dict):
+            pagination = {}
+        if not isinstance(resources, list):
+            resources = []
+
+        return status_code, pagination, resources
+
+    def _start(self) -> Dict[str, Any]:
+        """Return the starting position for pagination as provided by the caller."""
+        parameters = self._keywords.get("parameters", None)
+        if not isinstance(parameters, dict):
+            parameters = {}
+        returned = {}
+        for key in ("offset", "after", "next_token"):
+            value = self._keywords.get(key, parameters.get(key, None))
+            if value is not None:
+                returned[key] = value
+
+        return returned
+
+    def _fetch(self, position: Dict[str, Any]) -> Union[Dict[str, Union[int, dict, list]], Result]:
+        """Request the page found at the provided position."""
+        if not self._tuner:
+            return self._method(**{**self._keywords, **position})
+
+        return self._fetch_tuned(position)
+
+    def _fetch_tuned(self, position: Dict[str, Any]) -> Union[Dict[str, Union[int, dict, list]], Result]:
+        """Request the page found at the provided position using the limit calculated by the tuner."""
+        while True:
+            keywords = {**self._keywords, **position}
+            parameters = keywords.get("parameters", None)
+            if isinstance(parameters, dict) and "limit" in parameters:
+                keywords["parameters"] = {**parameters, "limit": self._tuner.limit}
+            else:
+                keywords["limit"] = self._tuner.limit
+            started = monotonic()
+            try:
+                page = self._method(**keywords)
+            except (APIError, Timeout) as failure:
+                # Pythonic mode raises timeouts and server errors.
+                if self._retry_smaller(getattr(failure, "code", 408)):
+                    continue
+                raise
+            status_code, _, resources = self.page_content(page)
+            if self._retry_smaller(status_code):
+                continue
+            self._tuner.observe(len(resources), monotonic() - started, self._page_bytes(page, resources))
+
+            return page
+
+    def _retry_smaller(self, status_code: int) -> bool:
+        """Reduce the limit after a page failed because of its size, returning True when it should be requested again."""
+        if status_code in TIMEOUT_STATUS_CODES:
+            return self._tuner.shrink()
+        if status_code == LIMIT_REFUSED_STATUS_CODE:
+            return self._tuner.refused()
+
+        return False
+
+    def _page_bytes(self, page: Union[Dict[str, Union[int, dict, list]], Result], resources: List[Any]) -> Optional[int]:
+        """Return the size of a page, estimating it from the resources when a byte budget requires it."""
+        headers = page.headers.data if isinstance(page, Result) else page.get("headers", {})
+        returned = PageSizeTuner.page_size(headers)
+        if returned is None and self._tuner.max_bytes and resources:
+            returned = len(dumps(resources, default=str))
+
+        return returned
+
+    def _advance(self,
+                 position: Dict[str, Any],
+                 pagination: Dict[str, Any],
+                 resources: List[Any]
+                 ) -> Optional[Dict[str, Any]]:
+        """Calculate the position of the next page, returning None when pagination is complete."""
+        if self._style is None:
+            # The operation is not known, detect the style using the returned metadata.
+            self._style = self.detect_page_style(pagination)
+        total = pagination.get("total", None)
+        if isinstance(total, int):
+            self._total = total
+        returned = None
+        if resources and self._style != "none":
+            if self._style == "offset":
+                offset = int(position.get("offset", 0) or 0) + len(resources)
+                if self._total is None or offset < self._total:
+                    returned = {"offset": offset}
+            else:
+                key = "offset" if self._style == "scroll" else self._style
+                token = pagination.get(key, None)
+                # Stop when the cursor is exhausted, repeats or every record has been returned.
+                if token and token != position.get(key, None):
+                    if self._total is None or self._count < self._total:
+                        returned = {key: token}
+        if self._max_pages and self._pages >= self._max_pages:
+            returned = None
+
+        return returned
+
+    def _pool(self, max_workers: int = 1) -> Tuple[Optional[Executor], Optional[ThreadPoolExecutor]]:
+        """Return the worker pool used to request pages, and the private pool created when one is not available."""
+        pool = self._executor or get_executor(getattr(self._method, "__self__", None))
+        private_pool = None
+        if not pool:
+            private_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="falconpy-paginator")
+            pool = private_pool
+
+        return pool, private_pool
+
+    def pages(self) -> Iterator[Union[Dict[str, Union[int, dict, list]], Result]]:
+        """Yield each page returned by the operation, prefetching the next page when enabled."""
+        self._pages = 0
+        self._count = 0
+        position = self._start()
+
+        yield from self._follow(position, self._fetch(position))
+
+    def _follow(self,
+                position: Dict[str, Any],
+                page: Union[Dict[str, Union[int, dict, list]], Result]
+                ) -> Iterator[Union[Dict[str, Union[int, dict, list]], Result]]:
+        """Yield the provided page and every page that follows it, one after another."""
+        pool = None
+        private_pool = None
+        if self._prefetch:
+            pool, private_pool = self._pool()
+        pending: Optional[Future] = None
+        try:
+            while page is not None:
+                self._result = page
+                self._pages += 1
+                status_code, pagination, resources = self.page_content(page)
+                self._count += len(resources)
+                upcoming = None
+                if status_code < 400:
+                    upcoming = self._advance(position, pagination, resources)
+                if upcoming is not None and pool:
+                    pending = pool.submit(self._fetch, upcoming)
+                yield page
+                if upcoming is None:
+                    page = None
+                elif pending:
+                    page = pending.result()
+                    pending = None
+                else:
+                    page = self._fetch(upcoming)
+                position = upcoming
+        finally:
+            if pending:
+                pending.cancel()
+            if private_pool:
+                private_pool.shutdown(wait=False)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield each resource returned by the operation across every page."""
+        for page in self.pages():
+            yield from self.page_content(page)[2]
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def method(self) -> Callable:
+        """Return the method used to retrieve each page."""
+        return self._method
+
+    @property
+    def operation(self) -> Optional[Operation]:
+        """Return the registry record for the operation."""
+        return self._operation
+
+    @property
+    def style(self) -> Optional[str]:
+        """Return the detected pagination style."""
+        return self._style
+
+    @property
+    def prefetch(self) -> bool:
+        """Return the flag indicating if pages are prefetched."""
+        return self._prefetch
+
+    @property
+    def max_pages(self) -> Optional[int]:
+        """Return the maximum number of pages retrieved."""
+        return self._max_pages
+
+    @property
+    def result(self) -> Optional[Union[Dict[str, Union[int, dict, list]], Result]]:
+        """Return the most recently retrieved page."""
+        return self._result
+
+    @property
+    def page_count(self) -> int:
+        """Return the number of pages retrieved."""
+        return self._pages
+
+    @property
+    def count(self) -> int:
+        """Return the number of resources retrieved."""
+        return self._count
+
+    @property
+    def total(self) -> Optional[int]:
+        """Return the total number of records reported by the API."""
+        return self._total
+
+    @property
+    def tuner(self) -> Optional[PageSizeTuner]:
+        """Return the tuner used to adjust the limit of each page."""
+        return self._tuner
+
+
+class ParallelPaginator(Paginator):
+    """Retrieve the pages of an integer offset operation concurrently.
+
+    Once the first page has been returned, the total number of records is known and the
+    offset windows for the remaining pages are requested using a bounded number of workers.
+    Requests are still paced by the rate limiter and retried by the retry policy of the auth_object.
+
+    Resources are yielded in offset order, or as each page arrives when ordered is False.
+    When the API refuses an offset (the result window of many operations is capped at 10,000
+    records), pagination stops at the last page that was returned. Provide max_offset to stop
+    before the cap is reached.
+
+    Operations that do not use an integer offset, or do not report a total, are paginated one page at a time.
+
+    Example:
+        hosts = Hosts(client_id=CLIENT_ID, client_secret=CLIENT_SECRET)
+        for device_id in hosts.paginate("query_devices_by_filter", parallel=True, limit=5000):
+            print(device_id)
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 method: Callable,
+                 operation: Optional[Operation] = None,
+                 max_workers: int = 4,
+                 ordered: bool = True,
+                 max_offset: Optional[int] = None,
+                 **kwargs
+                 ):
+        """Construct an instance of the ParallelPaginator class.
+
+        Keyword arguments
+        ----
+        method : callable
+            Service Class method used to retrieve each page.
+        operation : Operation
+            Registry record for the operation. Used to detect the pagination style.
+        max_workers : int
+            Maximum number of pages requested at the same time. [Default: 4]
+        ordered : bool
+            Flag specifying if resources should be yielded in offset order. [Default: True]
+        max_offset : int
+            Position of the last record that may be requested. [Default: total]
+        max_pages : int
+            Maximum number of pages to retrieve. [Default: No limit]
+        executor : Executor
+            Worker pool used to request pages. [Default: The auth_object worker pool]
+
+        All other keywords are provided to the method when each page is requested.
+        """
+        super().__init__(method, operation=operation, **kwargs)
+        self._max_workers: int = max_workers if isinstance(max_workers, int) and max_workers > 0 else 1
+        self._ordered: bool = bool(ordered)
+        self._max_offset: Optional[int] = max_offset if isinstance(max_offset, int) and max_offset > 0 else None
+        self._capped: bool = False
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def _windows(self, start: int, limit: int) -> Iterator[Dict[str, int]]:
+        """Yield the offset and limit of each remaining page."""
+        end = self._total
+        if self._max_offset:
+            end = min(end, self._max_offset)
+        pages = self._pages
+        for offset in range(start, end, limit):
+            if self._max_pages and pages >= self._max_pages:
+                break
+            pages += 1
+            yield {"offset": offset, "limit": min(limit, end - offset)}
+
+    def _fetch_window(self, window: Dict[str, int]) -> Optional[Union[Dict[str, Union[int, dict, list]], Result]]:
+        """Request the page found within the provided window, returning None when the offset is refused."""
+        try:
+            returned = self._fetch(window)
+        except APIError as api_error:
+            # Pythonic mode raises on failure, offset caps are reported as a bad request.
+            if api_error.code != 400:
+                raise
+            returned = None
+        if returned is not None and self.page_content(returned)[0] >= 400:
+            returned = None
+
+        return returned
+
+    def pages(self) -> Iterator[Union[Dict[str, Union[int, dict, list]], Result]]:
+        """Yield each page returned by the operation, requesting the remaining pages concurrently."""
+        self._pages = 0
+        self._count = 0
+        self._capped = False
+        position = self._start()
+        page = self._fetch(position)
+        status_code, pagination, resources = self.page_content(page)
+        total = pagination.get("total", None)
+        style = self._style or self.detect_page_style(pagination)
+        if status_code >= 400 or style != "offset" or not isinstance(total, int) or not resources:
+            # Nothing to fan out, continue one page at a time.
+            yield from self._follow(position, page)
+        else:
+            self._style = style
+            self._total = total
+            self._result = page
+            self._pages = 1
+            self._count = len(resources)
+            limit = self._keywords.get("limit", None) or pagination.get("limit", None) or len(resources)
+            windows = self._windows(int(position.get("offset", 0) or 0) + len(resources), int(limit))
+            yield page
+            yield from self._fan_out(windows)
+
+    def _fan_out(self, windows: Iterator[Dict[str, int]]) -> Iterator[Union[Dict[str, Union[int, dict, list]], Result]]:
+        """Request each window using a bounded number of workers and yield the returned pages."""
+        pool, private_pool = self._pool(self._max_workers)
+        pending: Deque[Future] = deque()
+        try:
+            while True:
+                # Keep up to max_workers pages in flight, stop submitting once an offset is refused.
+                while not self._capped and len(pending) < self._max_workers:
+                    window = next(windows, None)
+                    if window is None:
+                        break
+                    pending.append(pool.submit(self._fetch_window, window))
+                if not pending:
+                    break
+                if self._ordered:
+                    future = pending.popleft()
+                else:
+                    future = wait(pending, return_when=FIRST_COMPLETED).done.pop()
+                    pending.remove(future)
+                page = future.result()
+                if page is None:
+                    self._capped = True
+                    if self._ordered:
+                        # Every window that follows is further past the cap.
+                        break
+                    continue
+                resources = self.page_content(page)[2]
+                self._result = page
+                self._pages += 1
+                self._count += len(resources)
+                yield page
+        finally:
+            for future in pending:
+                future.cancel()
+            if private_pool:
+                private_pool.shutdown(wait=False)
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def max_workers(self) -> int:
+        """Return the maximum number of pages requested at the same time."""
+        return self._max_workers
+
+    @property
+    def ordered(self) -> bool:
+        """Return the flag indicating if resources are yielded in offset order."""
+        return self._ordered
+
+    @property
+    def max_offset(self) -> Optional[int]:
+        """Return the position of the last record that may be requested."""
+        return self._max_offset
+
+    @property
+    def capped(self) -> bool:
+        """Return the flag indicating if pagination stopped because an offset was refused."""
+        return self._capped
+
+
+def resolve_operation(service: object, method: Union[str, Callable]) -> Tuple[Callable, Optional[Operation]]:
+    """Resolve a Service Class method name, operation ID or method to the method and its operation."""
+    if isinstance(method, str):
+        returned_method = getattr(service, method)
+    else:
+        returned_method = method
+    target = getattr(returned_method, "__func__", returned_method)
+    operation = None
+    api_operations = _endpoint.api_operations
+    if isinstance(method, str) and method in api_operations:
+        operation = api_operations[method]
+    else:
+        # Service Classes alias each method using the operation ID.
+        for klass in type(service).__mro__:
+            for name, attribute in vars(klass).items():
+                if attribute is target and name in api_operations:
+                    operation = api_operations[name]
+                    break
+            if operation:
+                break
+
+    return returned_method, operation
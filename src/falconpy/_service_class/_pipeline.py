@@ -0,0 +1,204 @@
+"""FalconPy query to details pipeline.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from collections import deque
+from concurrent.futures import Executor, Future, FIRST_COMPLETED, wait
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
+from ._paginator import Paginator
+from .._error import APIError
+from .._result import Result
+from .._util import get_executor, in_worker
+
+
+class DetailsPipeline:
+    """Stream the details for every ID returned by a paginated query operation.
+
+    Each page of IDs returned by the paginator is handed to the details method as a batch.
+    Batches are requested concurrently using the worker pool owned by the auth_object while
+    the paginator continues to retrieve the next page of IDs. Records are yielded as soon as
+    each batch arrives.
+
+    No more than max_workers batches are in flight at any time, so memory use is bounded by
+    the batch size regardless of the number of records returned by the query.
+
+    Example:
+        hosts = Hosts(client_id=CLIENT_ID, client_secret=CLIENT_SECRET)
+        for device in hosts.inventory(filter="platform_name:'Linux'"):
+            print(device["hostname"])
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 paginator: Paginator,
+                 details: Callable,
+                 max_workers: int = 4,
+                 executor: Optional[Executor] = None
+                 ):
+        """Construct an instance of the DetailsPipeline class.
+
+        Keyword arguments
+        ----
+        paginator : Paginator
+            Paginator returning pages of IDs.
+        details : callable
+            Service Class method used to retrieve the details for a batch, the IDs are provided as the ids keyword.
+        max_workers : int
+            Maximum number of batches requested at the same time. [Default: 4]
+        executor : Executor
+            Worker pool used to request batches. [Default: The auth_object worker pool]
+        """
+        if not isinstance(paginator, Paginator) or not callable(details):
+            raise ValueError("A Paginator and a callable details method must be provided to the DetailsPipeline.")
+        self._paginator: Paginator = paginator
+        self._details: Callable = details
+        self._max_workers: int = max_workers if isinstance(max_workers, int) and max_workers > 0 else 1
+        self._executor: Optional[Executor] = executor
+        self._batches: int = 0
+        self._count: int = 0
+        self._failed: int = 0
+        self._errors: List[Dict[str, Any]] = []
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def _fetch(self, ids: List[str]) -> Tuple[List[str], Union[Dict[str, Union[int, dict, list]], Result]]:
+        """Request the details for a batch of IDs."""
+        try:
+            returned = self._details(ids=ids)
+        except APIError as api_error:
+            # Pythonic mode raises when the request fails, the batch is counted as failed.
+            returned = api_error.result
+
+        return ids, returned
+
+    def _records(self, batch: Tuple[List[str], Union[Dict[str, Union[int, dict, list]], Result]]) -> List[Any]:
+        """Return the records contained within a batch, tracking any IDs that could not be retrieved."""
+        ids, result = batch
+        status_code, _, returned = Paginator.page_content(result)
+        self._batches += 1
+        self._count += len(returned)
+        if status_code >= 400:
+            self._failed += max(len(ids) - len(returned), 0)
+            # EAFP
+            try:
+                errors = result.errors.data if isinstance(result, Result) else result["body"]["errors"]
+            except (AttributeError, KeyError, TypeError):
+                errors = []
+            for error in errors or []:
+                if error not in self._errors:
+                    self._errors.append(error)
+
+        return returned
+
+    def _completed(self, pending: Deque[Future], block: bool) -> Iterator[Any]:
+        """Yield the records of every batch that has arrived, waiting for one when block is True."""
+        if block and not any(future.done() for future in pending):
+            wait(pending, return_when=FIRST_COMPLETED)
+        for future in [future for future in pending if future.done()]:
+            pending.remove(future)
+            yield from self._records(future.result())
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the details for every ID returned by the query."""
+        self._batches = 0
+        self._count = 0
+        self._failed = 0
+        self._errors = []
+        pool = None
+        if not in_worker():
+            # Batches are requested in the current thread when we are already running within a worker.
+            pool = self._executor or get_executor(getattr(self._details, "__self__", None))
+        pending: Deque[Future] = deque()
+        try:
+            for page in self._paginator.pages():
+                ids = Paginator.page_content(page)[2]
+                if not ids:
+                    continue
+                if pool:
+                    pending.append(pool.submit(self._fetch, ids))
+                    # Stop retrieving IDs while the queue of batches is full.
+                    yield from self._completed(pending, len(pending) >= self._max_workers)
+                else:
+                    yield from self._records(self._fetch(ids))
+            while pending:
+                yield from self._completed(pending, True)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def paginator(self) -> Paginator:
+        """Return the paginator returning pages of IDs."""
+        return self._paginator
+
+    @property
+    def details(self) -> Callable:
+        """Return the method used to retrieve the details for each batch."""
+        return self._details
+
+    @property
+    def max_workers(self) -> int:
+        """Return the maximum number of batches requested at the same time."""
+        return self._max_workers
+
+    @property
+    def batches(self) -> int:
+        """Return the number of batches retrieved."""
+        return self._batches
+
+    @property
+    def count(self) -> int:
+        """Return the number of records retrieved."""
+        return self._count
+
+    @property
+    def failed(self) -> int:
+        """Return the number of IDs that could not be retrieved."""
+        return self._failed
+
+    @property
+    def errors(self) -> List[Dict[str, Any]]:
+        """Return the unique errors returned by failed batches."""
+        return self._errors
@@ -36,12 +36,18 @@ OTHER DEALINGS IN THE SOFTWARE.
 For more information, please refer to <https://unlicense.org>
 """
 from traceback import extract_tb
-from typing import Dict, Type, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Type, Optional, Union
 from ._base_service_class import BaseServiceClass
-from .._auth_object import FalconInterface
+from ._async_service_class import AsyncServiceClass
+from ._paginator import Paginator, ParallelPaginator, resolve_operation
+from ._shard import ShardedScan, Boundary
+from ._tuner import PageSizeTuner
+from ._download import FileDownloader, DownloadResult, Destination, DOWNLOAD_CHUNK_SIZE
+from .._auth_object import FalconInterface, RetryPolicy
 from .._util import log_class_startup, perform_request, service_override_payload, deprecated_class
+from .._util import get_executor, imap_workers
 from ..oauth2 import OAuth2
-from .._result import Result
+from .._result import Result, StreamedResult
 from .._endpoint import class_deprecation_mapping
 
 
@@ -123,6 +129,29 @@ class ServiceClass(BaseServiceClass):
             Amount of time (in seconds) between now and the token expiration before
             a refresh of the token is performed. Default: 120, Max: 1200
             Values over 1200 will be reset to the maximum.
+        pool_connections : int
+            Number of connection pools (per host) to cache. Default: 10
+        pool_maxsize : int
+            Maximum number of connections to keep alive within each pool. Default: 10
+        keep_alive : bool
+            Flag specifying if persistent pooled connections should be used. [Default: True]
+        max_workers : int
+            Maximum number of worker threads used for concurrent requests. Default: pool_maxsize
+            Limits the number of requests in flight at once when using aio, map or imap.
+        rate_limit : bool
+            Flag specifying if requests should be paced using the API rate limit. [Default: True]
+        retry_policy : RetryPolicy
+            Policy used to retry requests that fail with a transient error. [Default: No retries]
+            When provided alongside an auth_object, the policy only applies to this Service Class.
+        response_cache : ResponseCache
+            Cache used for the responses of read only (GET) operations. [Default: No caching]
+            Shared by every Service Class using the same auth_object.
+        background_refresh : bool
+            Flag specifying if tokens should be renewed ahead of the renew window by a
+            background thread. [Default: False]
+        shared_token : bool
+            Flag specifying if the token should be shared with other objects created using
+            the same credentials and base URL. [Default: False]
 
         Arguments
         ----
@@ -165,18 +194,27 @@ class ServiceClass(BaseServiceClass):
         self._override_proxy: Dict[str, str] = None
         self._override_timeout: int = None
         self._override_user_agent: str = None
+        self._override_retry_policy: RetryPolicy = None
+
+        # Awaitable interface to this Service Class, created on first use.
+        self._aio: AsyncServiceClass = None
 
         # The following properties can be overridden per Service Class.
-        for item in ["proxy", "timeout", "user_agent"]:
+        for item in ["proxy", "timeout", "user_agent", "retry_policy"]:
             if kwargs.get(item, None) is not None:
                 setattr(self, f"_override_{item}", kwargs.get(item))
 
         # Service Classes automatically log themselves in upon instantiation
-        # if no authentication status is present.
-        if not self.token_status:
+        # if no authentication status is present. Shared tokens are retrieved when
+        # the first request is made, reusing the token of any other object created
+        # with the same credentials.
+        if not self.token_status and not getattr(self.auth_object, "shared_token", False):
             self.login()
 
         # Detect if object authentication is being used to instantiate this class.
+        # Pooled connections are only released on exit when this class created the auth_object,
+        # an auth_object that was provided may be in use by other Service Classes.
+        self._owns_auth_object: bool = not auth_object
         self._override_auth_style: str = None
         if isinstance(auth_object, FalconInterface):
             self.auth_style = "OBJECT"
@@ -244,6 +282,149 @@ class ServiceClass(BaseServiceClass):
                                                           exp=expand_result
                                                           ))
 
+    def paginate(self,
+                 method: Union[str, Callable],
+                 prefetch: bool = True,
+                 max_pages: Optional[int] = None,
+                 parallel: bool = False,
+                 adaptive: bool = False,
+                 max_bytes: Optional[int] = None,
+                 **kwargs
+                 ) -> Paginator:
+        """Iterate over every resource returned by a paginated operation of this Service Class.
+
+        The method may be provided as a method name, an operation ID or the method itself.
+        All other keywords are provided to the method when each page is requested.
+        Use the pages method of the returned Paginator to iterate over each page instead.
+
+        When parallel is True, the remaining pages of integer offset operations are requested
+        concurrently. The max_workers, ordered and max_offset keywords are then also accepted.
+
+        When adaptive is True (or max_bytes is provided), the limit of each page is tuned within the
+        range declared by the endpoint using the latency and size of previous pages, and pages are
+        kept under max_bytes. The target_latency keyword (seconds per page) is then also accepted.
+        Adaptive page sizes only apply to pages that are requested one after another.
+        """
+        page_method, operation = resolve_operation(self, method)
+        # Only used by the tuner, never provided to the method.
+        target_latency = kwargs.pop("target_latency", 2.0)
+        if parallel:
+            return ParallelPaginator(page_method, operation=operation, prefetch=prefetch, max_pages=max_pages, **kwargs)
+        tuner = None
+        if adaptive or max_bytes:
+            parameters = kwargs.get("parameters", None)
+            limit = kwargs.get("limit", parameters.get("limit", None) if isinstance(parameters, dict) else None)
+            tuner = PageSizeTuner(operation, limit=limit, target_latency=target_latency, max_bytes=max_bytes)
+
+        return Paginator(page_method, operation=operation, prefetch=prefetch, max_pages=max_pages, tuner=tuner, **kwargs)
+
+    def scan(self,
+             method: Union[str, Callable],
+             field: str,
+             start: Boundary,
+             end: Boundary,
+             shards: int = 4,
+             shard_size: int = 10000,
+             **kwargs
+             ) -> ShardedScan:
+        """Iterate over every record returned by a paginated operation by scanning ranges of a field concurrently.
+
+        The range between start and end (exclusive) of the provided field is split into shards that
+        are added to the filter and paginated concurrently. Shards reporting a total larger than
+        shard_size are split further. Timestamps may be provided as a datetime or ISO 8601 string.
+        All other keywords are provided to the method when each page is requested.
+        """
+        page_method, operation = resolve_operation(self, method)
+
+        return ShardedScan(page_method, field, start, end, operation=operation, shards=shards, shard_size=shard_size, **kwargs)
+
+    def stream(self,
+               method: Union[str, Callable],
+               resources_key: str = "resources",
+               ndjson: Optional[bool] = None,
+               **kwargs
+               ) -> StreamedResult:
+        """Call a method of this Service Class with a streamed response, yielding each record as it is decoded.
+
+        The method may be provided as a method name, an operation ID or the method itself.
+        All other keywords are provided to the method. The records within the resources_key array
+        (or every line of newline delimited JSON responses) are decoded incrementally so memory use
+        does not grow with the size of the response. The meta and errors branches remain available
+        from the returned StreamedResult.
+        """
+        call = getattr(self, method) if isinstance(method, str) else method
+
+        return StreamedResult(call(stream=True, **kwargs), resources_key=resources_key, ndjson=ndjson)
+
+    def download_file(self,  # pylint: disable=R0913
+                      method: Union[str, Callable],
+                      destination: Destination,
+                      expected_sha256: Optional[str] = None,
+                      chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+                      max_attempts: int = 3,
+                      resume: bool = True,
+                      progress: Optional[Callable[[int, Optional[int]], None]] = None,
+                      **kwargs
+                      ) -> DownloadResult:
+        """Call a method of this Service Class that returns a file, writing it to a path or file object as it is received.
+
+        The method may be provided as a method name, an operation ID or the method itself.
+        All other keywords are provided to the method. The file is written in chunks of chunk_size
+        bytes and never held in memory, and its SHA256 is calculated while it is written. Interrupted
+        transfers are resumed using Range requests when the server supports it. The progress callable
+        is provided with the number of bytes received and the total size (None when unknown).
+        """
+        call = getattr(self, method) if isinstance(method, str) else method
+        ext_headers = kwargs.pop("ext_headers", None) or {}
+
+        def request(headers: Dict[str, str]) -> Any:
+            return call(stream=True, ext_headers={**ext_headers, **headers}, **kwargs)
+
+        downloader = FileDownloader(request, chunk_size=chunk_size, max_attempts=max_attempts, resume=resume,
+                                    progress=progress, pythonic=kwargs.get("pythonic", self.pythonic)
+                                    )
+
+        return downloader.download(destination, expected_sha256)
+
+    def imap(self,
+             method: Union[str, Callable],
+             arguments: Iterable[Union[Dict[str, Any], Any]],
+             max_workers: Optional[int] = None,
+             ordered: bool = True
+             ) -> Iterator[Union[Dict[str, Union[int, dict]], Result]]:
+        """Call a method of this Service Class once for every item provided, yielding each result.
+
+        The method may be provided as a method name, an operation ID or the method itself.
+        Dictionary items are provided to the method as keywords, any other item is provided
+        as the first argument. Calls are made concurrently using the worker pool owned by the
+        auth_object, with no more than max_workers in flight (default: the pool size).
+        Results are yielded in the order provided unless ordered is False, and any error raised
+        for an item (such as an APIError in pythonic mode) is raised when that result is reached.
+        """
+        call = getattr(self, method) if isinstance(method, str) else method
+        executor = get_executor(self)
+        if max_workers is None:
+            max_workers = self.auth_object.connection_pool.max_workers
+
+        def invoke(item: Union[Dict[str, Any], Any]) -> Union[Dict[str, Union[int, dict]], Result]:
+            if isinstance(item, dict):
+                return call(**item)
+            return call(item)
+
+        return imap_workers(executor, invoke, arguments, max_workers=max_workers, ordered=ordered)
+
+    def map(self,
+            method: Union[str, Callable],
+            arguments: Iterable[Union[Dict[str, Any], Any]],
+            max_workers: Optional[int] = None,
+            ordered: bool = True
+            ) -> List[Union[Dict[str, Union[int, dict]], Result]]:
+        """Call a method of this Service Class once for every item provided, returning a list of results.
+
+        Accepts the same arguments as imap.
+        """
+        return list(self.imap(method, arguments, max_workers=max_workers, ordered=ordered))
+
     def __enter__(self):
         """Allow for entry as a context manager."""
         return self
@@ -261,11 +442,27 @@ class ServiceClass(BaseServiceClass):
                 fname = frame.filename
                 self.log.error("LOCATION: %s, Line #%i in Function '%s'", fname, lineno, func)
         self.logout()
+        if self._owns_auth_object:
+            # Release any pooled connections held by the auth_object created for this class.
+            self.auth_object.connection_pool.close()
 
     # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
     # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
     # |    |  \ |__| |    |___ |  \  |  | |___ ___]
     #
+    @property
+    def aio(self) -> AsyncServiceClass:
+        """Provide an awaitable interface to the methods of this Service Class.
+
+        Method wrappers are performed within the worker pool, limited to max_workers requests at
+        once (Default: pool_maxsize, 10). The command method uses httpx when it is installed, and
+        is not limited by the worker pool.
+        """
+        if not self._aio:
+            self._aio = AsyncServiceClass(self)
+
+        return self._aio
+
     # Allow these mutable properties to be set per Service Class in memory.
     @property
     def proxy(self) -> dict:
@@ -297,6 +494,21 @@ class ServiceClass(BaseServiceClass):
         """Allow the timeout to be changed for this instance of the class."""
         self._override_timeout = value
 
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """Provide the retry policy from the auth_object if it's not been set."""
+        if self._override_retry_policy is not None:
+            returned = self._override_retry_policy
+        else:
+            returned = self.auth_object.retry_policy
+
+        return returned
+
+    @retry_policy.setter
+    def retry_policy(self, value: Optional[RetryPolicy]):
+        """Allow the retry policy to be changed for this instance of the class."""
+        self._override_retry_policy = value
+
     @property
     def renew_window(self) -> int:
         """Provide the renew_window from the auth_object."""
@@ -0,0 +1,343 @@
+"""FalconPy sharded scan interface.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from collections import deque
+from concurrent.futures import Executor, Future
+from datetime import datetime, timezone
+from math import ceil, floor
+from queue import Queue, Empty, Full
+from threading import Event
+from typing import Any, Callable, Deque, Dict, Generator, Iterator, List, Optional, Set, Tuple, Union
+from ._paginator import Paginator
+from .._endpoint import Operation
+from .._result import Result
+from .._util import get_executor, in_worker
+
+# Lower and upper bound of a shard, the upper bound is exclusive.
+Shard = Tuple[int, int]
+Boundary = Union[datetime, str, int, float]
+
+
+class ShardedScan:  # pylint: disable=R0902
+    """Retrieve every record matching a filter by scanning disjoint ranges of a monotonic field concurrently.
+
+    Cursor based operations (after tokens) can only be paginated one page at a time. The range
+    between start and end is split into shards, each shard is added to the filter as a range
+    of the provided field and paginated by an independent cursor. Shards are scanned concurrently
+    using the worker pool owned by the auth_object and records are yielded as each page arrives.
+
+    Shard sizes adapt to the data. When the first page of a shard reports a total larger than
+    shard_size, the page is discarded and the shard is split into smaller shards.
+
+    Records are not yielded in any particular order.
+
+    Example:
+        spotlight = SpotlightVulnerabilities(client_id=CLIENT_ID, client_secret=CLIENT_SECRET)
+        for vuln in spotlight.scan("query_vulnerabilities_combined", "created_timestamp",
+                                   "2024-01-01T00:00:00Z", "2025-01-01T00:00:00Z",
+                                   filter="status:'open'", limit=5000):
+            print(vuln["id"])
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 method: Callable,
+                 field: str,
+                 start: Boundary,
+                 end: Boundary,
+                 operation: Optional[Operation] = None,
+                 shards: int = 4,
+                 shard_size: int = 10000,
+                 max_workers: Optional[int] = None,
+                 executor: Optional[Executor] = None,
+                 **kwargs
+                 ):
+        """Construct an instance of the ShardedScan class.
+
+        Keyword arguments
+        ----
+        method : callable
+            Service Class method used to retrieve each page.
+        field : str
+            Monotonic field used to split the filter, such as created_timestamp.
+        start : datetime, str, int or float
+            Lower bound of the scan. Timestamps are provided as a datetime or ISO 8601 string.
+        end : datetime, str, int or float
+            Upper bound of the scan (exclusive).
+        operation : Operation
+            Registry record for the operation. Used to detect the pagination style.
+        shards : int
+            Number of shards the range is initially split into. [Default: 4]
+        shard_size : int
+            Maximum total records a shard may report before it is split. [Default: 10000]
+        max_workers : int
+            Maximum number of shards scanned at the same time. [Default: shards]
+        executor : Executor
+            Worker pool used to scan shards. [Default: The auth_object worker pool]
+
+        All other keywords are provided to the method when each page is requested.
+        The filter keyword is combined with the range of each shard.
+        """
+        if not callable(method) or not field:
+            raise ValueError("A callable method and a field must be provided to the ShardedScan.")
+        self._method: Callable = method
+        self._field: str = field
+        self._timestamps: bool = not isinstance(start, (int, float)) or not isinstance(end, (int, float))
+        self._start: int = floor(self.to_number(start))
+        self._end: int = ceil(self.to_number(end))
+        if self._end <= self._start:
+            raise ValueError("The end of the scan must be after the start.")
+        self._operation: Optional[Operation] = operation
+        self._shard_count: int = shards if isinstance(shards, int) and shards > 0 else 1
+        self._shard_size: int = shard_size if isinstance(shard_size, int) and shard_size > 0 else 10000
+        if not isinstance(max_workers, int) or max_workers < 1:
+            max_workers = self._shard_count
+        self._max_workers: int = max_workers
+        self._executor: Optional[Executor] = executor
+        self._keywords: Dict[str, Any] = kwargs
+        self._stopped: Event = Event()
+        self._count: int = 0
+        self._pages: int = 0
+        self._shards: int = 0
+        self._splits: int = 0
+        self._errors: List[Dict[str, Any]] = []
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    @staticmethod
+    def to_number(value: Boundary) -> float:
+        """Convert a boundary to a number, timestamps are converted to seconds since the epoch."""
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if isinstance(value, datetime):
+            if not value.tzinfo:
+                value = value.replace(tzinfo=timezone.utc)
+            value = value.timestamp()
+        if not isinstance(value, (int, float)):
+            raise ValueError("Shard boundaries must be a datetime, an ISO 8601 string or a number.")
+
+        return value
+
+    @staticmethod
+    def split(shard: Shard, parts: int) -> List[Shard]:
+        """Split a shard into the requested number of equally sized shards."""
+        low, high = shard
+        parts = max(min(parts, high - low), 1)
+        bounds = [low + round((high - low) * position / parts) for position in range(parts)] + [high]
+
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def _format(self, value: int) -> str:
+        """Format a boundary for use within a filter."""
+        if self._timestamps:
+            return f"'{datetime.fromtimestamp(value, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}'"
+        return str(value)
+
+    def _keywords_for(self, shard: Shard) -> Dict[str, Any]:
+        """Return the keywords used to request the pages of a shard, restricting the filter to its range."""
+        low, high = shard
+        shard_filter = f"{self._field}:>={self._format(low)}+{self._field}:<{self._format(high)}"
+        keywords = dict(self._keywords)
+        parameters = keywords.get("parameters", None)
+        if isinstance(parameters, dict) and parameters.get("filter", None):
+            keywords["parameters"] = {**parameters, "filter": f"({parameters['filter']})+{shard_filter}"}
+        elif keywords.get("filter", None):
+            keywords["filter"] = f"({keywords['filter']})+{shard_filter}"
+        else:
+            keywords["filter"] = shard_filter
+
+        return keywords
+
+    def _shard_pages(self, shard: Shard) -> Generator[Union[Dict[str, Union[int, dict, list]], Result], None, List[Shard]]:
+        """Yield each page of a shard, returning the smaller shards to scan instead when it is too large."""
+        paginator = Paginator(self._method, operation=self._operation, prefetch=False, **self._keywords_for(shard))
+        first = True
+        for page in paginator.pages():
+            if first:
+                first = False
+                status_code, pagination, _ = Paginator.page_content(page)
+                total = pagination.get("total", None) if status_code < 400 else None
+                if isinstance(total, int) and total > self._shard_size and shard[1] - shard[0] > 1:
+                    return self.split(shard, ceil(total / self._shard_size))
+            yield page
+
+        return []
+
+    def _scan(self, shard: Shard, pages: "Queue[Any]") -> List[Shard]:
+        """Scan a shard within a worker, handing each page to the consumer."""
+        scanner = self._shard_pages(shard)
+        try:
+            while True:
+                page = next(scanner)
+                while True:
+                    if self._stopped.is_set():
+                        scanner.close()
+                        return []
+                    # EAFP
+                    try:
+                        pages.put(page, timeout=0.1)
+                        break
+                    except Full:
+                        continue
+        except StopIteration as complete:
+            return complete.value
+
+    def _records(self, page: Union[Dict[str, Union[int, dict, list]], Result]) -> List[Any]:
+        """Return the records contained within a page, tracking any errors returned."""
+        status_code, _, returned = Paginator.page_content(page)
+        self._pages += 1
+        self._count += len(returned)
+        if status_code >= 400:
+            # EAFP
+            try:
+                errors = page.errors.data if isinstance(page, Result) else page["body"]["errors"]
+            except (AttributeError, KeyError, TypeError):
+                errors = []
+            for error in errors or []:
+                if error not in self._errors:
+                    self._errors.append(error)
+
+        return returned
+
+    def _finished(self, shards: Deque[Shard], smaller: List[Shard]):
+        """Track a finished shard, queueing the smaller shards it was split into."""
+        if smaller:
+            self._splits += 1
+            shards.extend(smaller)
+        else:
+            self._shards += 1
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield every record returned by every shard."""
+        self._count = 0
+        self._pages = 0
+        self._shards = 0
+        self._splits = 0
+        self._errors = []
+        self._stopped.clear()
+        shards: Deque[Shard] = deque(self.split((self._start, self._end), self._shard_count))
+        pool = None
+        if not in_worker():
+            # Shards are scanned one after another when we are already running within a worker.
+            pool = self._executor or get_executor(getattr(self._method, "__self__", None))
+        if not pool:
+            while shards:
+                scanner = self._shard_pages(shards.popleft())
+                try:
+                    while True:
+                        yield from self._records(next(scanner))
+                except StopIteration as complete:
+                    self._finished(shards, complete.value)
+            return
+
+        pages: "Queue[Any]" = Queue(maxsize=self._max_workers * 2)
+        pending: Set[Future] = set()
+        try:
+            while shards or pending:
+                while shards and len(pending) < self._max_workers:
+                    pending.add(pool.submit(self._scan, shards.popleft(), pages))
+                # EAFP
+                try:
+                    page = pages.get(timeout=0.05)
+                except Empty:
+                    page = None
+                if page is not None:
+                    yield from self._records(page)
+                for future in [future for future in pending if future.done()]:
+                    pending.remove(future)
+                    self._finished(shards, future.result())
+            # Every page is queued before the scan of its shard finishes.
+            while not pages.empty():
+                yield from self._records(pages.get())
+        finally:
+            self._stopped.set()
+            for future in pending:
+                future.cancel()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def method(self) -> Callable:
+        """Return the method used to retrieve each page."""
+        return self._method
+
+    @property
+    def field(self) -> str:
+        """Return the field used to split the filter."""
+        return self._field
+
+    @property
+    def shard_size(self) -> int:
+        """Return the maximum total records a shard may report before it is split."""
+        return self._shard_size
+
+    @property
+    def max_workers(self) -> int:
+        """Return the maximum number of shards scanned at the same time."""
+        return self._max_workers
+
+    @property
+    def count(self) -> int:
+        """Return the number of records retrieved."""
+        return self._count
+
+    @property
+    def page_count(self) -> int:
+        """Return the number of pages retrieved."""
+        return self._pages
+
+    @property
+    def shards(self) -> int:
+        """Return the number of shards scanned."""
+        return self._shards
+
+    @property
+    def splits(self) -> int:
+        """Return the number of shards that were split into smaller shards."""
+        return self._splits
+
+    @property
+    def errors(self) -> List[Dict[str, Any]]:
+        """Return the unique errors returned by failed pages."""
+        return self._errors
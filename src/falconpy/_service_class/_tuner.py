@@ -0,0 +1,230 @@
+"""FalconPy adaptive page size tuner.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from threading import Lock
+from typing import Any, Dict, Optional
+from .._constant import GLOBAL_API_MAX_RETURN
+from .._endpoint import Operation
+
+# Status codes returned when a page took too long to produce, the page size is reduced before trying again.
+TIMEOUT_STATUS_CODES = (408, 500, 502, 503, 504)
+# Status code returned when the limit exceeds the largest page size accepted by the operation.
+LIMIT_REFUSED_STATUS_CODE = 400
+# Weight given to the most recent page when averaging the time and size required per record.
+SMOOTHING_FACTOR = 0.5
+
+
+class PageSizeTuner:
+    """Adjust the page size (limit) of a paginated operation using the latency and size of each page.
+
+    After every page, the time and number of bytes required per record are averaged and the
+    limit for the next page is calculated so that a page takes target_latency seconds to
+    return. The limit grows or shrinks by no more than half or double per page, stays within
+    the minimum and maximum declared by the endpoint definition, and never exceeds the number
+    of records that fit within max_bytes when a byte budget is provided.
+
+    When a byte budget is provided, the first page is requested using the minimum limit so the
+    size of a record is known before a larger page is requested. When the endpoint does not
+    declare a maximum and a grown limit is refused, the limit returns to the last size that
+    succeeded and does not grow past it again.
+
+    The last limit calculated for each operation is remembered, so subsequent pagination of
+    the same operation starts from a tuned page size.
+
+    Example:
+        hosts = Hosts(client_id=CLIENT_ID, client_secret=CLIENT_SECRET)
+        for device_id in hosts.paginate("query_devices_by_filter_scroll", adaptive=True, max_bytes=50000000):
+            print(device_id)
+    """
+
+    # Last limit calculated for each operation ID.
+    _learned: Dict[str, int] = {}
+    _learned_lock: Lock = Lock()
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 operation: Optional[Operation] = None,
+                 limit: Optional[int] = None,
+                 target_latency: float = 2.0,
+                 max_bytes: Optional[int] = None
+                 ):
+        """Construct an instance of the PageSizeTuner class.
+
+        Keyword arguments
+        ----
+        operation : Operation
+            Registry record for the operation. Provides the declared limit range.
+        limit : int
+            Limit used for the first page, the minimum is used instead when max_bytes is provided.
+            [Default: The last limit tuned for the operation, or 100]
+        target_latency : float
+            Number of seconds each page should take to return. [Default: 2.0]
+        max_bytes : int
+            Maximum size of a page in bytes. [Default: No limit]
+        """
+        self._operation_id: Optional[str] = operation.operation_id if operation else None
+        declared = operation.parameters.get("limit", None) if operation else None
+        self._minimum: int = max(getattr(declared, "minimum", None) or 1, 1)
+        self._undeclared_maximum: bool = not getattr(declared, "maximum", None)
+        self._maximum: int = max(getattr(declared, "maximum", None) or GLOBAL_API_MAX_RETURN, self._minimum)
+        self._target_latency: float = target_latency if target_latency and target_latency > 0 else 2.0
+        self._max_bytes: Optional[int] = max_bytes if isinstance(max_bytes, int) and max_bytes > 0 else None
+        self._seconds_per_record: Optional[float] = None
+        self._bytes_per_record: Optional[float] = None
+        # Largest limit that returned a page successfully.
+        self._succeeded: Optional[int] = None
+        if not isinstance(limit, int) or limit < 1:
+            with self._learned_lock:
+                limit = self._learned.get(self._operation_id, 100)
+        # The size of a record is not known until the first page returns.
+        self._probing: bool = bool(self._max_bytes)
+        self._limit: int = self._minimum if self._probing else self._bounded(limit)
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    @staticmethod
+    def average(current: Optional[float], value: float) -> float:
+        """Return the exponentially weighted moving average of the provided value, weighted by SMOOTHING_FACTOR."""
+        return value if current is None else current + SMOOTHING_FACTOR * (value - current)
+
+    def _bounded(self, limit: float) -> int:
+        """Restrict the provided limit to the declared range and byte budget."""
+        if self._max_bytes and self._bytes_per_record:
+            limit = min(limit, self._max_bytes / self._bytes_per_record)
+
+        return int(min(max(limit, self._minimum), self._maximum))
+
+    def _remember(self):
+        """Store the current limit as the starting point for the operation."""
+        if self._operation_id:
+            with self._learned_lock:
+                self._learned[self._operation_id] = self._limit
+
+    def observe(self, records: int, latency: float, size: Optional[int] = None) -> int:
+        """Record the results of a page and return the limit to use for the next page."""
+        if records > 0:
+            self._succeeded = max(self._succeeded or 0, self._limit)
+            self._seconds_per_record = self.average(self._seconds_per_record, max(latency, 0) / records)
+            if size:
+                self._bytes_per_record = self.average(self._bytes_per_record, size / records)
+            desired = self._target_latency / self._seconds_per_record if self._seconds_per_record else self._limit * 2
+            if not self._probing:
+                desired = min(max(desired, self._limit / 2), self._limit * 2)
+            self._limit = self._bounded(desired)
+            self._probing = False
+            self._remember()
+
+        return self._limit
+
+    def shrink(self) -> bool:
+        """Halve the limit after a page failed to return in time, returning False when it cannot shrink further."""
+        returned = self._limit > self._minimum
+        self._limit = self._bounded(self._limit / 2)
+        self._remember()
+
+        return returned
+
+    def refused(self) -> bool:
+        """Return to the last limit that succeeded after a grown limit was refused.
+
+        Only applies when the endpoint does not declare a maximum. The limit is capped at the last
+        successful size from then on. Returns False when the refused limit has not grown past it.
+        """
+        returned = bool(self._undeclared_maximum and self._succeeded and self._limit > self._succeeded)
+        if returned:
+            self._maximum = self._succeeded
+            self._limit = self._succeeded
+            self._remember()
+
+        return returned
+
+    @staticmethod
+    def page_size(headers: Any) -> Optional[int]:
+        """Return the size of a response body from the Content-Length header when it reflects the decoded body."""
+        returned = None
+        # EAFP
+        try:
+            if not headers.get("Content-Encoding", headers.get("content-encoding", None)):
+                returned = int(headers.get("Content-Length", headers.get("content-length", None)))
+        except (AttributeError, TypeError, ValueError):
+            returned = None
+
+        return returned
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def limit(self) -> int:
+        """Return the limit to use for the next page."""
+        return self._limit
+
+    @property
+    def minimum(self) -> int:
+        """Return the smallest limit that may be used."""
+        return self._minimum
+
+    @property
+    def maximum(self) -> int:
+        """Return the largest limit that may be used."""
+        return self._maximum
+
+    @property
+    def target_latency(self) -> float:
+        """Return the number of seconds each page should take to return."""
+        return self._target_latency
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        """Return the maximum size of a page in bytes."""
+        return self._max_bytes
+
+    @property
+    def seconds_per_record(self) -> Optional[float]:
+        """Return the average number of seconds required to return a record."""
+        return self._seconds_per_record
+
+    @property
+    def bytes_per_record(self) -> Optional[float]:
+        """Return the average number of bytes required to return a record."""
+        return self._bytes_per_record
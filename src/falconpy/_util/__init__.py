@@ -54,13 +54,14 @@ from ._functions import (
     base_url_regions,
     autodiscover_region,
     sanitize_dictionary,
-    calc_content_return,
     log_class_startup,
     deprecated_operation,
     deprecated_class,
     params_to_keywords,
     _ALLOWED_METHODS
 )
+from ._request import send_request, pace_request, request_cache_key
+from ._response import calc_content_return
 from ._service import service_override_payload
 from ._uber import (
     create_uber_header_payload,
@@ -69,6 +70,18 @@ from ._uber import (
     handle_container_operations,
     uber_request_keywords,
 )
+from ._codec import JSONCodec, json_codec, set_json_codec, json_loads, json_dumps
+from ._multipart import MultipartEncoder
+from ._executor import get_executor, in_worker, map_workers, imap_workers
+from ._chunk import ids_chunk_size, chunk_ids, chunk_requests, merge_chunk_results, chunked_request
+from ._async import (
+    run_async,
+    async_refresh_token,
+    async_perform_request,
+    async_service_request,
+    async_chunked_request,
+    async_process_service_request
+)
 
 __all__ = ["create_uber_header_payload", "handle_body_payload_ids", "scrub_target",
            "handle_container_operations", "uber_request_keywords", "autodiscover_region",
@@ -79,5 +92,9 @@ __all__ = ["create_uber_header_payload", "handle_body_payload_ids", "scrub_targe
            "_ALLOWED_METHODS", "login_payloads", "logout_payloads", "sanitize_dictionary",
            "calc_content_return", "log_class_startup", "service_override_payload",
            "deprecated_operation", "deprecated_class", "review_provided_credentials",
-           "params_to_keywords"
+           "params_to_keywords", "get_executor", "run_async", "async_refresh_token", "async_perform_request",
+           "async_service_request", "async_chunked_request", "async_process_service_request", "send_request",
+           "pace_request", "request_cache_key", "in_worker", "map_workers", "imap_workers", "ids_chunk_size", "chunk_ids",
+           "chunk_requests", "merge_chunk_results", "chunked_request", "JSONCodec", "json_codec", "set_json_codec",
+           "json_loads", "json_dumps", "MultipartEncoder"
            ]
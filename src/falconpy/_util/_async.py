@@ -0,0 +1,314 @@
+"""Asynchronous request handlers.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import asyncio
+from concurrent.futures import Executor
+from contextvars import copy_context
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+import requests
+from requests.exceptions import ConnectionError as RequestConnectionError, Timeout
+from requests.structures import CaseInsensitiveDict
+from .._api_request import APIRequest
+from .._error import APIError, InvalidMethod, NoContentWarning, SDKError
+from .._result import Result
+from ._functions import (
+    perform_request,
+    prepare_request,
+    complete_request,
+    service_request_keywords,
+    service_request_payload
+    )
+from ._request import request_cache_key
+from ._response import request_failure
+from ._codec import json_dumps
+from ._chunk import chunk_requests, merge_chunk_results
+from ._executor import get_executor
+try:
+    import httpx
+except (ImportError, ModuleNotFoundError):
+    # Optional, requests are performed within worker threads when not installed.
+    httpx = None
+if TYPE_CHECKING:  # pragma: no cover
+    from .._service_class import ServiceClass
+
+
+async def run_async(executor: Optional[Executor], func: Callable, *args, **kwargs) -> Any:
+    """Execute the provided callable within the executor and await the result.
+
+    The current context is copied so context variables are available to the worker.
+    """
+    loop = asyncio.get_running_loop()
+    context = copy_context()
+
+    return await loop.run_in_executor(executor, partial(context.run, func, *args, **kwargs))
+
+
+async def async_refresh_token(caller: object = None) -> None:
+    """Renew the token used by the caller within a worker thread when it is stale.
+
+    Token generation is performed by the synchronous login handlers, so it is completed before the
+    request headers are calculated to prevent the event loop being blocked.
+    """
+    auth = getattr(caller, "auth_object", caller)
+    # EAFP
+    try:
+        stale = auth.token_stale and auth.refreshable
+    except AttributeError:
+        stale = False
+    if stale:
+        await run_async(get_executor(caller), auth.refresh_token)
+
+
+def convert_response(received: Any) -> requests.Response:
+    """Convert a response received by httpx to a requests.Response containing the same content.
+
+    Allows responses to be handled by the same code regardless of how they were sent.
+    """
+    returned = requests.Response()
+    returned.status_code = received.status_code
+    headers: CaseInsensitiveDict = CaseInsensitiveDict()
+    for raw_key, raw_value in received.headers.raw:
+        key, value = raw_key.decode("latin-1"), raw_value.decode("latin-1")
+        # Repeated headers are combined as they would be by requests.
+        headers[key] = f"{headers[key]}, {value}" if key in headers else value
+    returned.headers = headers
+    returned.url = str(received.url)
+    returned.reason = received.reason_phrase
+    # EAFP
+    try:
+        returned.elapsed = received.elapsed
+    except RuntimeError:
+        pass  # Not measured for responses that were not received from the network.
+    returned.encoding = requests.utils.get_encoding_from_headers(headers)
+    # The body has already been received in full.
+    returned._content = received.content  # pylint: disable=W0212
+    returned._content_consumed = True  # pylint: disable=W0212
+
+    return returned
+
+
+def async_timeout(timeout: Optional[Union[float, Tuple[float, float]]]) -> Any:
+    """Convert a requests timeout (global, or a tuple of the connect and read timeouts) to an httpx timeout."""
+    returned = timeout
+    if isinstance(timeout, tuple):
+        returned = httpx.Timeout(timeout[1], connect=timeout[0])
+
+    return returned
+
+
+async def async_pace_request(api: APIRequest) -> float:
+    """Wait for the rate limiter to provide a slot for this request without blocking the event loop."""
+    waited = 0.0
+    if api.rate_limiter:
+        waited = await api.rate_limiter.acquire_async()
+        if waited and api.log_util:
+            api.log_util.debug("RATE LIMIT: Waited %.2f seconds, %s requests remaining",
+                               waited, api.rate_limiter.remaining
+                               )
+
+    return waited
+
+
+async def async_send_request(api: APIRequest,
+                             headers: dict,
+                             allow_redirects: bool,
+                             client: Any
+                             ) -> Tuple[requests.Response, int, float]:
+    """Send the request using the provided httpx.AsyncClient without blocking the event loop.
+
+    Responses are cached, rate limited and retried exactly as they are by send_request. Connection
+    errors and timeouts are raised as their requests equivalents.
+
+    Returns: tuple containing the response, the number of retries performed and the
+             total number of seconds spent waiting for the rate limit or between attempts.
+    """
+    cache_key = request_cache_key(api)
+    if cache_key:
+        cached = api.response_cache.get(cache_key)
+        if cached is not None:
+            if api.log_util:
+                api.log_util.debug("CACHE: Response for %s returned from cache", api.operation_id)
+            return cached, 0, 0.0
+    paced: List[float] = []
+    data = api.data_payload
+    if not data and api.body_payload is not None:
+        # Encode JSON bodies once with the JSON codec in use, as send_request does.
+        data = json_dumps(api.body_payload)
+        if not any(key.lower() == "content-type" for key in headers):
+            headers = {**headers, "Content-Type": "application/json"}
+    payload: Dict[str, Any] = {}
+    if isinstance(data, (str, bytes)):
+        payload["content"] = data
+    elif data:
+        # Form encoded payload.
+        payload["data"] = data
+    # Query string parameters without a value are not sent, matching requests.
+    params = {key: value for key, value in (api.param_payload or {}).items() if value is not None}
+
+    async def attempt() -> requests.Response:
+        response = None
+        # Wait for headroom within the rate limit shared by this credential.
+        paced.append(await async_pace_request(api))
+        try:
+            try:
+                received = await client.request(api.method.upper(), api.endpoint, params=params, headers=headers,
+                                                follow_redirects=allow_redirects, timeout=async_timeout(api.timeout),
+                                                **payload
+                                                )
+            except httpx.TimeoutException as timed_out:
+                raise Timeout(str(timed_out)) from timed_out
+            except httpx.TransportError as failed:
+                raise RequestConnectionError(str(failed)) from failed
+            response = convert_response(received)
+        finally:
+            if api.rate_limiter:
+                api.rate_limiter.release(response)
+
+        return response
+
+    if api.retry_policy:
+        retry_log = api.log_util.debug if api.log_util else None
+        returned, retries, waited = await api.retry_policy.perform_async(api.method, attempt, retry_log)
+    else:
+        returned, retries, waited = await attempt(), 0, 0.0
+
+    if cache_key and api.response_cache.store(cache_key, api.operation_id, returned) and api.log_util:
+        api.log_util.debug("CACHE: Response for %s stored in cache", api.operation_id)
+
+    return returned, retries, waited + sum(paced)
+
+
+async def async_perform_request(endpoint: str = "",
+                                headers: Optional[Dict[str, str]] = None,
+                                client: Any = None,
+                                executor: Optional[Executor] = None,
+                                **kwargs
+                                ) -> Union[Dict[str, Union[int, dict, list]], Result, requests.Response, bytes]:
+    """Perform the requested API operation without blocking the running event loop.
+
+    Accepts the same keywords as perform_request. The request is sent using the provided
+    httpx.AsyncClient, so any number of requests may be in flight from one event loop.
+
+    When a client is not provided (httpx is not installed), or the request uploads files or
+    streams the response, perform_request is called within the executor instead.
+    """
+    headers = {} if headers is None else headers
+    if client is None or kwargs.get("stream", False) or kwargs.get("files", None):
+        return await run_async(executor, perform_request, endpoint=endpoint, headers=headers, **kwargs)
+
+    pythonic = kwargs.get("pythonic", False)
+    # Errors are handled as they are by the force_default decorator of perform_request.
+    try:
+        api, allow_redirects, returned = prepare_request(endpoint, headers, kwargs)
+        if api.perform:
+            response = None
+            try:
+                response, retries, retry_wait = await async_send_request(api, headers, allow_redirects, client)
+                returned = complete_request(api, response, retries, retry_wait, pythonic)
+            except Exception as havoc:  # pylint: disable=W0703
+                returned = request_failure(api, havoc, response, pythonic)
+    except NoContentWarning as no_content_received:
+        returned = no_content_received.result
+    except APIError as api_error:
+        # Should only receive this in pythonic mode
+        raise api_error
+    except (SDKError, InvalidMethod) as bad_sdk_command:
+        returned = bad_sdk_command.result
+
+    return returned
+
+
+async def async_service_request(caller: "ServiceClass" = None, **kwargs
+                                ) -> Union[Dict[str, Union[int, dict, list]], Result, requests.Response, bytes]:
+    """Prepare and then perform the request (Service Classes only) without blocking the event loop.
+
+    Accepts the same keywords as service_request.
+    """
+    keywords = service_request_keywords(caller, kwargs)
+    # EAFP
+    try:
+        client = caller.auth_object.connection_pool.get_async_client(keywords.get("proxy", None),
+                                                                     keywords.get("verify", True)
+                                                                     )
+    except AttributeError:
+        client = None
+    executor = None
+    if client is None or keywords.get("stream", False) or keywords.get("files", None):
+        # Performed within the worker pool owned by the caller.
+        executor = get_executor(caller)
+
+    return await async_perform_request(client=client, executor=executor, **keywords)
+
+
+async def async_chunked_request(func: Callable[..., Awaitable[Any]],
+                                chunks: List[Dict[str, Any]]
+                                ) -> Union[Dict[str, Union[int, dict, list]], Result]:
+    """Await each chunk of a split request concurrently and merge the results.
+
+    APIError exceptions raised for a chunk (pythonic mode) are merged as failed chunks.
+    """
+    async def request_chunk(keywords: Dict[str, Any]) -> Union[Dict[str, Union[int, dict, list]], Result, APIError]:
+        try:
+            returned = await func(**keywords)
+        except APIError as api_error:
+            returned = api_error
+
+        return returned
+
+    return merge_chunk_results(await asyncio.gather(*[request_chunk(chunk) for chunk in chunks]))
+
+
+async def async_process_service_request(calling_object: "ServiceClass",
+                                        endpoints: List[List[Union[str, List[Dict[str, Any]]]]],
+                                        operation_id: str,
+                                        **kwargs
+                                        ) -> Union[Dict[str, Union[int, dict, list]], Result, requests.Response, bytes]:
+    """Perform a request originating from a service class module without blocking the event loop.
+
+    Accepts the same keywords as process_service_request. ID lists larger than the
+    operation accepts are requested in concurrent chunks and merged.
+    """
+    await async_refresh_token(calling_object)
+    keywords, operation = service_request_payload(calling_object, endpoints, operation_id, kwargs)
+    chunks = chunk_requests(keywords, operation)
+    if chunks:
+        returned = await async_chunked_request(async_service_request, chunks)
+    else:
+        returned = await async_service_request(**keywords)
+
+    return returned
@@ -0,0 +1,172 @@
+"""FalconPy ID list chunking helpers.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, Union
+from ._executor import get_executor, map_workers
+from .._constant import IDS_MAX_ITEMS
+from .._endpoint import Operation
+from .._error import APIError
+from .._result import Result
+
+
+def ids_chunk_size(operation: Optional[Operation]) -> Optional[int]:
+    """Return the maximum number of IDs accepted per request by the operation.
+
+    Only read operations are split. The limit is retrieved from the list of known limits for the
+    read operations that only document it, or the maxItems definition of the ids parameter for GET
+    operations. Returns None when the operation has no known limit, or is not a read operation.
+    """
+    returned = None
+    if operation:
+        returned = IDS_MAX_ITEMS.get(operation.operation_id, None)
+        ids = operation.parameters.get("ids", None)
+        if not returned and operation.method == "GET" and ids and ids.location == "query":
+            returned = ids.max_items
+
+    return returned
+
+
+def chunk_ids(ids: Union[str, List[str]], size: int) -> List[List[str]]:
+    """Split the provided IDs into lists no larger than size, removing duplicates while preserving order."""
+    if isinstance(ids, str):
+        ids = ids.split(",")
+    unique = list(dict.fromkeys(ids))
+
+    return [unique[pos:pos + size] for pos in range(0, len(unique), size)]
+
+
+def merge_chunk_results(results: List[Union[Dict[str, Union[int, dict, list]], Result, APIError]]
+                        ) -> Union[Dict[str, Union[int, dict, list]], Result]:
+    """Merge the results returned for each chunk of IDs into a single result.
+
+    Resources are returned in request order and errors are deduplicated. When any chunk succeeds,
+    the status code of the successful chunks is used and the failed chunks are listed within errors,
+    otherwise the highest status code returned is used. Metadata is taken from the first successful
+    chunk and headers from the last. APIError exceptions raised for a chunk (pythonic mode) are
+    merged as failed chunks, and the first is raised again when every chunk fails.
+    """
+    failures = [result for result in results if isinstance(result, APIError)]
+    pythonic = bool(failures) or any(isinstance(result, Result) for result in results)
+    contents = [result.result if isinstance(result, APIError)
+                else result.full_return if isinstance(result, Result)
+                else result for result in results]
+    if not all(isinstance(content, dict) and isinstance(content.get("body", None), dict) for content in contents):
+        # Unexpected (binary) response, nothing to merge.
+        return results[0]
+    succeeded = [content for content in contents if content.get("status_code", 0) < 400]
+    if pythonic and not succeeded:
+        if failures:
+            raise failures[0]
+    resources: List[Any] = []
+    errors: List[Any] = []
+    for content in contents:
+        resources.extend(content["body"].get("resources", None) or [])
+        for error in content["body"].get("errors", None) or []:
+            if error not in errors:
+                errors.append(error)
+    status_code = max(content.get("status_code", 0) for content in succeeded or contents)
+    reference = succeeded or contents
+    meta = dict(reference[0]["body"].get("meta", {}) or {})
+    query_times = [content["body"].get("meta", {}).get("query_time", None) for content in contents]
+    if all(isinstance(query_time, (int, float)) for query_time in query_times):
+        meta["query_time"] = sum(query_times)
+    body = {"meta": meta, "resources": resources, "errors": errors}
+    headers = reference[-1].get("headers", {})
+    if pythonic:
+        returned = Result(status_code=status_code, headers=headers, body=body)
+        returned.retries = sum(result.retries for result in results if isinstance(result, Result))
+        returned.retry_wait = sum(result.retry_wait for result in results if isinstance(result, Result))
+    else:
+        returned = {"status_code": status_code, "headers": headers, "body": body}
+
+    return returned
+
+
+def request_chunk(func: Callable, keywords: Dict[str, Any]) -> Union[Dict[str, Union[int, dict, list]], Result, APIError]:
+    """Request a single chunk, returning the APIError raised in pythonic mode instead of raising it."""
+    try:
+        returned = func(**keywords)
+    except APIError as api_error:
+        returned = api_error
+
+    return returned
+
+
+def chunk_requests(keywords: Dict[str, Any], operation: Optional[Operation]) -> Optional[List[Dict[str, Any]]]:
+    """Split the request keywords into one set of keywords per chunk of IDs the operation accepts.
+
+    Returns None when the request does not need to be split.
+    """
+    returned = None
+    size = ids_chunk_size(operation)
+    location = "body"
+    if size and operation.parameters.get("ids", None):
+        location = "params"
+    payload = keywords.get(location, None)
+    ids = payload.get("ids", None) if isinstance(payload, dict) else None
+    if isinstance(ids, str):
+        ids = ids.split(",")
+    if size and isinstance(ids, list) and len(ids) > size and not keywords.get("expand_result", False) \
+            and not keywords.get("stream", False):
+        chunks = chunk_ids(ids, size)
+        # Duplicate IDs are removed, the remaining IDs may fit within a single request.
+        if len(chunks) > 1:
+            returned = [{**keywords, location: {**payload, "ids": chunk}} for chunk in chunks]
+
+    return returned
+
+
+def chunked_request(func: Callable,
+                    keywords: Dict[str, Any],
+                    operation: Optional[Operation],
+                    executor: Optional[Executor] = None,
+                    caller: object = None
+                    ) -> Optional[Union[Dict[str, Union[int, dict, list]], Result]]:
+    """Perform the request in chunks when more IDs are provided than the operation accepts.
+
+    Each chunk is requested concurrently using the provided worker pool (or the pool owned by the caller,
+    which is only created when a request is split) and the results are merged. Returns None when the
+    request does not need to be split, the caller should perform it normally.
+    """
+    returned = None
+    requests = chunk_requests(keywords, operation)
+    if requests:
+        pool = executor or get_executor(caller or keywords.get("caller", None))
+        returned = merge_chunk_results(map_workers(pool, lambda request: request_chunk(func, request), requests))
+
+    return returned
@@ -0,0 +1,158 @@
+"""FalconPy JSON codec.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from functools import partial
+from importlib import import_module
+from json import dumps as std_dumps, loads as std_loads, JSONDecodeError
+from typing import Any, Callable, Optional, Union
+
+# Supported JSON libraries, in order of preference. The first one installed is used.
+JSON_CODECS = ("orjson", "ujson", "simplejson", "json")
+
+
+class JSONCodec:
+    """Encode and decode JSON payloads using the fastest JSON library available.
+
+    Bodies are decoded directly from the received bytes and encoded directly to bytes,
+    so no intermediate string copies are created when the library supports it.
+
+    Decoding errors are always raised as json.JSONDecodeError, regardless of the library used.
+    Payloads the library cannot encode are encoded using the standard library instead.
+    """
+
+    def __init__(self, name: Optional[str] = None):
+        """Construct an instance of the JSONCodec class.
+
+        Keyword arguments
+        ----
+        name : str
+            Name of the JSON library to use, one of orjson, ujson, simplejson or json.
+            [Default: The first library installed, in that order]
+
+        Raises ImportError when the requested library is not installed.
+        """
+        names = JSON_CODECS if name is None else (name,)
+        if name is not None and name not in JSON_CODECS:
+            raise ValueError(f"Unsupported JSON codec specified, must be one of: {', '.join(JSON_CODECS)}.")
+        self._name: str = "json"
+        self._loads: Callable[[Union[bytes, str]], Any] = std_loads
+        self._dumps: Callable[[Any], bytes] = self.std_encode
+        for candidate in names:
+            # EAFP
+            try:
+                library = import_module(candidate)
+            except ImportError:
+                if name is not None:
+                    # The requested library is not installed.
+                    raise
+                continue
+            self._name = candidate
+            self._loads = library.loads
+            if candidate == "orjson":
+                self._dumps = partial(library.dumps, option=library.OPT_NON_STR_KEYS)
+            elif candidate != "json":
+                self._dumps = partial(self.text_encode, library.dumps)
+            break
+
+    @staticmethod
+    def std_encode(payload: Any) -> bytes:
+        """Encode a payload using the standard library."""
+        return std_dumps(payload).encode("utf-8")
+
+    @staticmethod
+    def text_encode(encoder: Callable[[Any], str], payload: Any) -> bytes:
+        """Encode a payload using a library that produces strings."""
+        return encoder(payload).encode("utf-8")
+
+    def loads(self, content: Union[bytes, bytearray, str]) -> Any:
+        """Decode a JSON document."""
+        # EAFP
+        try:
+            returned = self._loads(content)
+        except JSONDecodeError:
+            raise
+        except ValueError as bad_json:
+            # Provide the same error type regardless of the library used.
+            raise JSONDecodeError(str(bad_json), content if isinstance(content, str) else "", 0) from bad_json
+
+        return returned
+
+    def dumps(self, payload: Any) -> bytes:
+        """Encode a payload as a UTF-8 JSON document."""
+        # EAFP
+        try:
+            returned = self._dumps(payload)
+        except (TypeError, OverflowError):
+            # Fall back to the standard library for types the library does not support.
+            returned = self.std_encode(payload)
+
+        return returned
+
+    @property
+    def name(self) -> str:
+        """Return the name of the JSON library in use."""
+        return self._name
+
+
+# Codec shared by every request, response and ingest payload.
+_CODEC = JSONCodec()
+
+
+def json_codec() -> JSONCodec:
+    """Return the JSON codec in use."""
+    return _CODEC
+
+
+def set_json_codec(name: Optional[str] = None) -> JSONCodec:
+    """Select the JSON library used for every request and response, returning the new codec.
+
+    Provide None to select the fastest library installed.
+    """
+    global _CODEC  # pylint: disable=W0603
+    _CODEC = JSONCodec(name)
+
+    return _CODEC
+
+
+def json_loads(content: Union[bytes, bytearray, str]) -> Any:
+    """Decode a JSON document using the JSON codec in use."""
+    return _CODEC.loads(content)
+
+
+def json_dumps(payload: Any) -> bytes:
+    """Encode a payload as a UTF-8 JSON document using the JSON codec in use."""
+    return _CODEC.dumps(payload)
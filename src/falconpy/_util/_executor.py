@@ -0,0 +1,127 @@
+"""FalconPy worker pool helpers.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from collections import deque
+from concurrent.futures import Executor, Future, wait, FIRST_COMPLETED
+from threading import current_thread
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional
+
+# Prefix used to name the worker threads owned by the connection pool.
+WORKER_PREFIX = "falconpy"
+
+
+def get_executor(caller: object = None) -> Optional[Executor]:
+    """Retrieve the worker pool owned by the auth_object (or interface) of the caller.
+
+    Returns None when one is not available, resulting in the default loop executor being used.
+    """
+    # EAFP
+    try:
+        returned = caller.auth_object.connection_pool.executor
+    except AttributeError:
+        try:
+            returned = caller.connection_pool.executor
+        except AttributeError:
+            returned = None
+
+    return returned
+
+
+def in_worker() -> bool:
+    """Return a boolean indicating if the current thread is a FalconPy worker thread."""
+    return current_thread().name.startswith(WORKER_PREFIX)
+
+
+def map_workers(executor: Optional[Executor], func: Callable, items: Iterable[Any]) -> List[Any]:
+    """Call the provided function with each item concurrently, returning the results in order.
+
+    When a worker pool is not available, or we are already running within a worker, the items
+    are handled one after another in the current thread. This prevents a saturated pool
+    from waiting on itself.
+    """
+    if not executor or in_worker():
+        returned = [func(item) for item in items]
+    else:
+        futures = [executor.submit(func, item) for item in items]
+        try:
+            returned = [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+
+    return returned
+
+
+def imap_workers(executor: Optional[Executor],
+                 func: Callable,
+                 items: Iterable[Any],
+                 max_workers: int = 4,
+                 ordered: bool = True
+                 ) -> Iterator[Any]:
+    """Call the provided function with each item concurrently, yielding each result as it becomes available.
+
+    Items are consumed lazily and no more than max_workers calls are in flight at any time.
+    When ordered is False, results are yielded in the order they complete. Exceptions raised
+    by the function are raised when the result for that item is reached.
+    """
+    if not executor or in_worker():
+        for item in items:
+            yield func(item)
+        return
+
+    source = iter(items)
+    exhausted = object()
+    pending: Deque[Future] = deque()
+    try:
+        while True:
+            while len(pending) < max(max_workers, 1):
+                item = next(source, exhausted)
+                if item is exhausted:
+                    break
+                pending.append(executor.submit(func, item))
+            if not pending:
+                break
+            if ordered:
+                future = pending.popleft()
+            else:
+                future = wait(pending, return_when=FIRST_COMPLETED).done.pop()
+                pending.remove(future)
+            yield future.result()
+    finally:
+        # Abandon any requests that have not started when the caller stops early.
+        for future in pending:
+            future.cancel()
@@ -39,20 +39,20 @@ from __future__ import annotations
 import base64
 import functools
 from warnings import warn
-from json import loads
-try:
-    from simplejson import JSONDecodeError as SimplejsonJSONDecodeError
-except (ImportError, ModuleNotFoundError):  # Support import as a module
-    SimplejsonJSONDecodeError = None  # Support import as a module
-from json.decoder import JSONDecodeError as StdJSONDecodeError
-from typing import Dict, Any, Union, Optional, List, TYPE_CHECKING
+from typing import Dict, Any, Union, Optional, List, Tuple, TYPE_CHECKING
 from copy import deepcopy
 from logging import Logger
 import requests
 import urllib3
 from urllib3.exceptions import InsecureRequestWarning
 from .._api_request import APIRequest
-from .._endpoint import operation_deprecation_mapping
+from .._endpoint import (
+    operation_deprecation_mapping,
+    operation_registry,
+    get_operation,
+    Operation,
+    OperationRegistry
+    )
 from .._enum import BaseURL, ContainerBaseURL
 from .._constant import (
     PREFER_NONETYPE,
@@ -63,9 +63,9 @@ from .._constant import (
     GLOBAL_API_MAX_RETURN
 )
 from .._error import (
-    RegionSelectError,
     SDKError,
     InvalidMethod,
+    InvalidOperation,
     KeywordsOnly,
     APIError,
     NoContentWarning,
@@ -78,18 +78,17 @@ from .._error import (
     )
 from .._result import Result
 from .._version import version
+from ._request import send_request
+from ._response import calc_content_return, request_failure
+from ._chunk import chunked_request
 if TYPE_CHECKING:  # pragma: no cover
-    from .._auth_object import FalconInterface
+    from .._auth_object import FalconInterface, RateLimiter, ResponseCache, RetryPolicy
     from .._service_class import ServiceClass
     from ..api_complete import APIHarness, APIHarnessV2
     from ..oauth2 import OAuth2
 
 urllib3.disable_warnings(InsecureRequestWarning)
 
-# create a tuple of all possible JSONDecodeError types for exception handling
-# pylint: disable=invalid-name
-JSONDecodeError = (SimplejsonJSONDecodeError, StdJSONDecodeError) if SimplejsonJSONDecodeError else (StdJSONDecodeError,)
-
 
 def validate_payload(validator: Dict[str, Any],
                      payload: Dict[str, Union[str, int, dict, list, bytes]],
@@ -214,6 +213,15 @@ def service_request(caller: ServiceClass = None, **kwargs) -> Union[Dict[str, Un
 
     Inbound caller argument should be a ServiceClass class or derivative.
     """
+    return perform_request(**service_request_keywords(caller, kwargs))
+
+
+# pylint: disable=R0915  # Each attribute is retrieved from the caller individually (EAFP).
+def service_request_keywords(caller: ServiceClass, kwargs: dict) -> Dict[str, Any]:  # noqa: C901
+    """Retrieve the keywords provided to perform_request for a request made by a Service Class.
+
+    Connection handling, logging, rate limiting, retries and caching are retrieved from the caller.
+    """
     if caller:
         # EAFP
         try:
@@ -240,6 +248,35 @@ def service_request(caller: ServiceClass = None, **kwargs) -> Union[Dict[str, Un
             debug_count: Optional[int] = caller.debug_record_count
         except AttributeError:
             debug_count = None
+
+        try:
+            # Reuse the connection pool maintained by the underlying auth_object.
+            session: Optional[requests.Session] = caller.auth_object.connection_pool.get_session(proxy)
+        except AttributeError:
+            session = None
+
+        try:
+            # Pace requests using the rate limit shared by the underlying auth_object.
+            rate_limiter: Optional[RateLimiter] = caller.auth_object.rate_limiter
+        except AttributeError:
+            rate_limiter = None
+
+        # A retry policy provided for this request takes precedence over the Service Class.
+        retry_policy: Optional[RetryPolicy] = kwargs.pop("retry_policy", None)
+        if retry_policy is None:
+            try:
+                retry_policy = caller.retry_policy
+            except AttributeError:
+                retry_policy = None
+
+        try:
+            # Read only operation responses may be cached by the underlying auth_object.
+            response_cache: Optional[ResponseCache] = caller.auth_object.response_cache
+            cache_scope: Optional[str] = caller.auth_object.cache_scope if response_cache else None
+        except AttributeError:
+            response_cache = None
+            cache_scope = None
+
         try:
             do_sanitize: Optional[bool] = caller.sanitize_log
         except AttributeError:
@@ -253,84 +290,19 @@ def service_request(caller: ServiceClass = None, **kwargs) -> Union[Dict[str, Un
         except AttributeError:
             kwargs["pythonic"] = None
     # pylint: disable=E0606
-    return perform_request(proxy=proxy,
-                           timeout=timeout,
-                           user_agent=user_agent,
-                           log_util=log_utility,
-                           debug_record_count=debug_count,
-                           sanitize=do_sanitize,
-                           **kwargs
-                           )
-
-
-# pylint: disable=R0912  # I don't disagree, but this will work for now.
-def calc_content_return(resp: requests.Response,
-                        contain: bool,
-                        auth: bool,
-                        log: Logger,
-                        pythonic_mode: bool,
-                        api_method: str
-                        ) -> Union[dict, bytes]:
-    """Calculate the returned content based upon the results from the call to requests."""
-    returned = {}
-    returned_content_type = resp.headers.get('content-type', None)
-    if not returned_content_type:
-        returned_content_type = resp.headers.get("Content-Type", "Binary")
-    if log:
-        log.debug("RECEIVED: Content returned in %s format", returned_content_type)
-    if returned_content_type.startswith("application/json"):  # Issue 708
-        json_resp: Union[dict, Result] = {}
-        try:
-            json_resp = resp.json()
-        except JSONDecodeError:
-            if api_method != "HEAD":
-                # It says JSON in the headers but it came back to us as a binary string.
-                json_resp = loads(resp.content.decode("ascii"))
-        finally:
-            # Default behavior is to return results as a standardized dictionary.
-            returned = Result(status_code=resp.status_code,
-                              headers=resp.headers,
-                              body=json_resp,
-                              head_request=bool(api_method == "HEAD")
-                              ).full_return
-    elif returned_content_type.startswith("text/plain"):
-        # Assuming UTF-8 for now
-        returned = Result(resp.status_code,
-                          resp.headers,
-                          loads(resp.content.decode("utf-8"))
-                          ).full_return
-    elif contain:
-        returned = Result(resp.status_code, resp.headers, resp.json()).full_return
-    else:
-        # Binary response
-        if not resp.content:
-            if auth:
-                # Issue 433 - GovCloud autodiscovery is not supported
-                raise RegionSelectError(headers=resp.headers)
-
-            # Nothing was returned, so give them back the blank binary object
-            # Emulates < v1.3 functionality
-            returned = resp.content
-        else:
-            # returned = resp.content
-            returned = Result(resp.status_code, resp.headers, resp.content).full_return
-
-    # Catch and log API response errors
-    try:
-        if resp.status_code >= 400:
-            _message = None
-            _errors = returned.get("body", {}).get("errors", [])
-            if _errors:
-                _message = f"ERROR: {_errors[0]['message']}"
-            raise APIError(code=resp.status_code, message=_message, headers=resp.headers)
-    except APIError as api_error:
-        # Still return the payload unless we're in pythonic mode
-        if log:
-            log.error(api_error.message)
-        if pythonic_mode:
-            raise api_error
-
-    return returned, returned_content_type
+    return {"proxy": proxy,
+            "timeout": timeout,
+            "user_agent": user_agent,
+            "log_util": log_utility,
+            "debug_record_count": debug_count,
+            "sanitize": do_sanitize,
+            "session": session,
+            "rate_limiter": rate_limiter,
+            "retry_policy": retry_policy,
+            "response_cache": response_cache,
+            "cache_scope": cache_scope,
+            **kwargs
+            }
 
 
 # pylint: disable=R0915
@@ -356,7 +328,7 @@ def perform_request(endpoint: str = "",  # noqa: C901
         - Example: True
     data - Encoded data to send to the API
         - Example: PAYLOAD = open(FILENAME, 'rb').read()
-    files: list - List of files to upload
+    files: list - List of files to upload, file handles and paths are streamed as the request is sent
         - Example: [('file',('testfile2.jpg',open('testfile2.jpg','rb'),'image/jpeg'))]
     body_validator: dict - Dictionary containing payload to be validated for the requested operation (key / datatype)
         - Example: { "limit": int, "offset": int, "filter": str}
@@ -378,121 +350,131 @@ def perform_request(endpoint: str = "",  # noqa: C901
     debug_record_count: int - Maximum number of records to log in debug logs
     authenticating: bool - This request is driving a token request
     stream: bool - Enabling streaming download.
+    session: requests.Session - Pooled session to use for the request. Defaults to a single use connection.
+    rate_limiter: RateLimiter - Rate limiter used to pace the request. Defaults to no pacing.
+    retry_policy: RetryPolicy - Policy used to retry transient failures. Defaults to no retries.
+    response_cache: ResponseCache - Cache used for read only operation responses. Defaults to no caching.
+    cache_scope: str - Identity of the credential used for this request, separates cached responses.
+    operation_id: str - Operation ID for this request, required for the response to be cached.
     """
     # Shortcut for now
     pythonic = kwargs.get("pythonic", False)
+    api, allow_redirects, returned = prepare_request(endpoint, headers, kwargs)
+
+    # Perform the request
+    if api.perform:
+        response = None
+        try:
+            # Send the request, retrying transient failures if a retry policy is provided.
+            response, retries, retry_wait = send_request(api, headers, allow_redirects)
+            if api.stream:
+                if api.log_util:
+                    api.log_util.debug("STREAM: Download requested")
+                    api.log_util.debug(f"STREAM: {response.headers}")
+                api.debug_headers = response.headers
+                # Return the requests.Response object instead of a FalconPy Result object
+                return response
+            returned = complete_request(api, response, retries, retry_wait, pythonic)
+        except Exception as havoc:  # pylint: disable=W0703
+            returned = request_failure(api, havoc, response, pythonic)
+
+    return returned
+
+
+def prepare_request(endpoint: str, headers: dict, kwargs: dict) -> Tuple[APIRequest, bool, Optional[dict]]:
+    """Create the request for the requested operation, validating the payload and completing the headers.
+
+    Shared by the synchronous and asynchronous request handlers.
+
+    Returns: tuple containing the request, a boolean indicating if redirects are allowed and
+             the result to return when the request is not performed (failed payload validation).
+    """
+    pythonic = kwargs.get("pythonic", False)
+    returned = None
     api: APIRequest = APIRequest(endpoint, kwargs)
     if not api.verify:
         ssl_disabled = SSLDisabledWarning()
         if pythonic:
-            warn(ssl_disabled.message, SSLDisabledWarning, stacklevel=2)
+            warn(ssl_disabled.message, SSLDisabledWarning, stacklevel=3)
         else:
             api.log_warning(msg=ssl_disabled.message)
 
-    if api.method.upper() in _ALLOWED_METHODS:
-        # Validate body payload
-        if api.body_validator:
-            try:
-                validate_payload(api.body_validator, api.body_payload, api.body_required)
-            except PayloadValidationError as err:
-                api.log_error(400, err.message, err.result)
-                returned = err.result
-                api.perform = False
-
-        # Perform the request
-        if api.perform:
-            if api.user_agent:
-                headers["User-Agent"] = api.user_agent
-            else:
-                # Force all requests to pass the User-Agent identifier
-                headers["User-Agent"] = _USER_AGENT
-            headers["CrowdStrike-SDK"] = _USER_AGENT
-            # Clean up query string booleans - Issue #1129
-            if api.param_payload:
-                for param, param_value in api.param_payload.items():
-                    if isinstance(param_value, bool):
-                        api.param_payload[param] = str(param_value).lower()
-            try:
-                allow_redirects = False
-                # Allow redirections during token authentication and revocation
-                for check_point in ["/oauth2/revoke", "/oauth2/token"]:
-                    if check_point in api.endpoint:
-                        allow_redirects = True
-                # Log our payloads if debugging is enabled
-                log_api_payloads(api, headers)
-                response = requests.request(api.method.upper(), endpoint, params=api.param_payload,
-                                            headers=headers, json=api.body_payload, data=api.data_payload,
-                                            files=api.files, verify=api.verify, allow_redirects=allow_redirects,
-                                            proxies=api.proxy, timeout=api.timeout, stream=api.stream
-                                            )
-
-                api.debug_headers = response.headers
-
-                if api.stream:
-                    if api.log_util:
-                        api.log_util.debug("STREAM: Download requested")
-                        api.log_util.debug(f"STREAM: {api.debug_headers}")
-                    # Return the requests.Response object instead of a FalconPy Result object
-                    return response
-
-                content_return, returning_content_type = calc_content_return(response,
-                                                                             api.container,
-                                                                             api.authenticating,
-                                                                             api.log_util,
-                                                                             pythonic,
-                                                                             api.method
-                                                                             )
-                # Expanded results allow for status code and
-                # header checks on binary returns.
-                # Maintained for < v1.3 syntax compatibility
-                if api.expand_result:
-                    returned = Result(response.status_code, response.headers, content_return).tupled
-                else:
-                    returned = content_return
-
-                # Log our response if debugging is enabled
-                log_api_activity(content_return, returning_content_type, api)
-
-                # !!! EXPERIMENTAL !!!
-                # This functionality is new in v1.3.0 and still experimental, mileage may vary.
-                if pythonic:
-                    if isinstance(returned, bytes):
-                        returned = Result(response.status_code, response.headers, returned)
-                    else:
-                        returned = Result(full=returned, head_request=bool(api.method == "HEAD"))
-
-            except RegionSelectError as bad_region:
-                # More than likely they tried to autoselect to GovCloud
-                returned = bad_region.result
-                api.log_error(returned.get("status_code"), bad_region.message, returned)
-
-            except JSONDecodeError as json_decode_error:
-                # No response content, but a successful request was made
-                if "/identity-protection/combined/graphql/v1" in api.endpoint:  # pragma: no cover
-                    raise SDKError(message=f"{str(json_decode_error)}",
-                                   headers=api.debug_headers
-                                   ) from json_decode_error
-
-                api.log_warning("WARNING: No content was received for this request.")
-                raise NoContentWarning(headers=response.headers,
-                                       code=response.status_code
-                                       ) from json_decode_error
-
-            except Exception as havoc:  # pylint: disable=W0703
-                # General catch-all for anything coming          ____ ____ _ _      \\       o   o
-                # out of requests or the library itself.         |___ |--<  Y        ||      |\O/|
-                # Pass this error up to the parent try/catch                          \\      \Y/
-                # block residing within our decorator        _  _ ____ _  _ ____ ____         /W\
-                # (force_default) for handling.              |--| |--|  \/  [__] |___  !!   _|WWW|_
-                if pythonic:
-                    # Oh wait, we're pythonic, lets generate
-                    # a regular python error condition instead.
-                    raise havoc
-
-                raise SDKError(message=f"{str(havoc)}", headers=api.debug_headers) from havoc
-    else:
+    if api.method.upper() not in _ALLOWED_METHODS:
         raise InvalidMethod
 
+    # Validate body payload
+    if api.body_validator:
+        try:
+            validate_payload(api.body_validator, api.body_payload, api.body_required)
+        except PayloadValidationError as err:
+            api.log_error(400, err.message, err.result)
+            returned = err.result
+            api.perform = False
+
+    allow_redirects = False
+    if api.perform:
+        if api.user_agent:
+            headers["User-Agent"] = api.user_agent
+        else:
+            # Force all requests to pass the User-Agent identifier
+            headers["User-Agent"] = _USER_AGENT
+        headers["CrowdStrike-SDK"] = _USER_AGENT
+        # Clean up query string booleans - Issue #1129
+        if api.param_payload:
+            for param, param_value in api.param_payload.items():
+                if isinstance(param_value, bool):
+                    api.param_payload[param] = str(param_value).lower()
+        # Allow redirections during token authentication and revocation
+        for check_point in ["/oauth2/revoke", "/oauth2/token"]:
+            if check_point in api.endpoint:
+                allow_redirects = True
+        # Log our payloads if debugging is enabled
+        log_api_payloads(api, headers)
+
+    return api, allow_redirects, returned
+
+
+def complete_request(api: APIRequest,
+                     response: requests.Response,
+                     retries: int,
+                     retry_wait: float,
+                     pythonic: bool
+                     ) -> Union[Dict[str, Union[int, dict, list]], Result, bytes]:
+    """Convert the response received for the request into the value returned to the caller.
+
+    Shared by the synchronous and asynchronous request handlers.
+    """
+    api.debug_headers = response.headers
+    content_return, returning_content_type = calc_content_return(response,
+                                                                 api.container,
+                                                                 api.authenticating,
+                                                                 api.log_util,
+                                                                 pythonic,
+                                                                 api.method
+                                                                 )
+    returned = content_return
+    if isinstance(content_return, Result) and (api.expand_result or api.log_util):
+        # Pythonic mode receives the Result object, expansion and logging use the legacy form.
+        content_return = content_return.full_return
+    # Expanded results allow for status code and
+    # header checks on binary returns.
+    # Maintained for < v1.3 syntax compatibility
+    if api.expand_result:
+        returned = Result(response.status_code, response.headers, content_return).tupled
+
+    # Log our response if debugging is enabled
+    log_api_activity(content_return, returning_content_type, api)
+
+    # !!! EXPERIMENTAL !!!
+    # This functionality is new in v1.3.0 and still experimental, mileage may vary.
+    if pythonic:
+        if isinstance(returned, bytes):
+            returned = Result(response.status_code, response.headers, returned)
+        elif not isinstance(returned, Result):
+            returned = Result(full=returned, head_request=bool(api.method == "HEAD"))
+        returned.retries = retries
+        returned.retry_wait = retry_wait
+
     return returned
 
 
@@ -579,9 +561,9 @@ def get_default(types: list, position: int) -> Union[list, str, int, dict, bool]
     return retval
 
 
-def args_to_params(payload: dict,
+def args_to_params(payload: dict,  # pylint: disable=R0912 # (16/15)
                    passed_arguments: dict,
-                   endpoints: list,
+                   endpoints: Union[list, OperationRegistry],
                    epname: str,
                    log_utl: Logger = None,
                    pyth: bool = None
@@ -603,7 +585,7 @@ def args_to_params(payload: dict,
     Keyword arguments:
     payload -- Existing QueryString parameter payload. Dictionary.
     passed_arguments -- Keywords provided to the calling method.
-    endpoints -- List of API endpoints available to the calling method.
+    endpoints -- List of API endpoints available to the calling method, or an OperationRegistry.
     epname -- Operation ID to be retrieved from the endpoints list.
     log_utl -- Logger used when warnings are issued.
     pyth -- Boolean indicating if pythonic responses are enabled.
@@ -614,34 +596,35 @@ def args_to_params(payload: dict,
     if epname != "Manual":  # pylint: disable=R1702
         if epname in operation_deprecation_mapping:
             deprecated_operation(pyth, log_utl, epname, operation_deprecation_mapping[epname])
+        # Parameters are retrieved from the operation registry instead of scanning the endpoint list.
+        operation = get_operation(endpoints, epname)
+        if not operation and passed_arguments:
+            # An unknown operation ID is an error, not a request without parameters.
+            raise InvalidOperation(message=f"{epname} is not an available API operation.")
+        parameters = operation.parameters if operation else {}
         for arg in passed_arguments:
-            eps = [ep[5] for ep in endpoints if epname == ep[0]][0]
-            try:
-                argument = [param for param in eps if param["name"] == arg][0]
-                if argument:
-                    arg_name = argument["name"]
-                    if "type" in argument:  # Body payload parameters do not have a type field
-                        if argument["type"] == "array":
-                            if isinstance(passed_arguments[arg_name], (str)):
-                                passed_arguments[arg_name] = passed_arguments[arg_name].split(",")
-                        # Check for unnecessarily URLEncoded strings by finding an encoded ":", Issue #850
-                        if isinstance(passed_arguments[arg_name], str):
-                            if "%3A" in passed_arguments[arg_name]:
-                                msg = " ".join([arg_name,
-                                                "argument contains potentially urlencoded string of",
-                                                f"'{passed_arguments[arg_name]}'."
-                                                ])
-                                if pyth:
-                                    warn(msg, UnnecessaryEncodingUsed, stacklevel=5)
-                                else:
-                                    if log_utl:
-                                        log_utl.warning(msg)
-
-                        # More data type validation can go here
-                        payload[arg_name] = passed_arguments[arg_name]
-            except IndexError:
-                # Unrecognized argument
-                pass
+            argument = parameters.get(arg, None)
+            if argument:
+                arg_name = argument.name
+                if argument.type:  # Body payload parameters do not have a type field
+                    if argument.type == "array":
+                        if isinstance(passed_arguments[arg_name], (str)):
+                            passed_arguments[arg_name] = passed_arguments[arg_name].split(",")
+                    # Check for unnecessarily URLEncoded strings by finding an encoded ":", Issue #850
+                    if isinstance(passed_arguments[arg_name], str):
+                        if "%3A" in passed_arguments[arg_name]:
+                            msg = " ".join([arg_name,
+                                            "argument contains potentially urlencoded string of",
+                                            f"'{passed_arguments[arg_name]}'."
+                                            ])
+                            if pyth:
+                                warn(msg, UnnecessaryEncodingUsed, stacklevel=5)
+                            else:
+                                if log_utl:
+                                    log_utl.warning(msg)
+
+                    # More data type validation can go here
+                    payload[arg_name] = passed_arguments[arg_name]
 
     # Clean up reserved word conversions when passing in an invalid raw payload
     if payload:
@@ -654,7 +637,7 @@ def args_to_params(payload: dict,
     return returned_payload
 
 
-def process_service_request(calling_object: ServiceClass,  # pylint: disable=R0914 # (19/15)
+def process_service_request(calling_object: ServiceClass,
                             endpoints: List[List[Union[str, List[Dict[str, Any]]]]],
                             operation_id: str,
                             **kwargs
@@ -684,7 +667,28 @@ def process_service_request(calling_object: ServiceClass,  # pylint: disable=R09
     collection_version -- Repository version [PATH] (Custom Objects API)
     object_key -- Object Key [PATH] (Custom Objects API)
     path_id -- ASPM ID path variable [PATH] (ASPM API)
-    stream -- Enabling streaming download.
+    stream -- Enabling streaming download. Also accepted as a keyword provided to the Service Class method.
+
+    The ext_headers keyword may be provided to the Service Class method to send additional headers with this request.
+    """
+    new_keywords, target_endpoint = service_request_payload(calling_object, endpoints, operation_id, kwargs)
+    returned = chunked_request(service_request, new_keywords, target_endpoint)
+    if returned is None:
+        returned = service_request(**new_keywords)
+
+    return returned
+
+
+def service_request_payload(calling_object: ServiceClass,  # pylint: disable=R0914 # (19/15)
+                            endpoints: Union[List[List[Union[str, List[Dict[str, Any]]]]], OperationRegistry],
+                            operation_id: str,
+                            kwargs: dict
+                            ) -> Tuple[Dict[str, Any], Operation]:
+    """Calculate the keywords provided to service_request for a request originating from a service class module.
+
+    Accepts the same keywords as process_service_request.
+
+    Returns: tuple containing the keywords and the operation being performed.
     """
     # Log the operation ID if we have logging enabled.
     if calling_object.log:
@@ -693,11 +697,15 @@ def process_service_request(calling_object: ServiceClass,  # pylint: disable=R09
     # For scenarios where cloud region autodiscovery is leveraged, we cannot create
     # the target URL for our call to requests until we know our correct base_url.
     passed_headers = kwargs.get("headers", None) if kwargs.get("headers", None) else {}
+    # Retrieve our keyword arguments
+    passed_keywords = kwargs.get("keywords", {})  # Changed from None in v1.3.3
     joined_headers = {
         ** calling_object.headers,
-        ** passed_headers
+        ** passed_headers,
+        # Additional headers for this request only
+        ** (passed_keywords.get("ext_headers", None) or {} if passed_keywords else {})
     }
-    target_endpoint = [ep for ep in endpoints if operation_id == ep[0]][0]
+    target_endpoint = operation_registry(endpoints)[operation_id]
     base_url = calling_object.base_url
     container = False
     # Check if this operation requires the custom container base URL.
@@ -707,9 +715,7 @@ def process_service_request(calling_object: ServiceClass,  # pylint: disable=R09
                 base_url = f"https://{ContainerBaseURL[base].value}"
                 container = True
     # Handle any provided PATH variables, should happen before query string argument abstraction.
-    target_url = handle_path_variables(passed=kwargs, route_url=f"{base_url}{target_endpoint[2]}")
-    # Retrieve our keyword arguments
-    passed_keywords = kwargs.get("keywords", {})  # Changed from None in v1.3.3
+    target_url = handle_path_variables(passed=kwargs, route_url=f"{base_url}{target_endpoint.route}")
     passed_params = kwargs.get("params", None)
     # Starting in v1.3.3, Service Classes will pass an empty parameters dictionary
     # instead of a NoneType when no query string arguments are specified.
@@ -726,7 +732,7 @@ def process_service_request(calling_object: ServiceClass,  # pylint: disable=R09
         do_pythonic = passed_keywords.get("pythonic")
     new_keywords = {
         "caller": calling_object,
-        "method": target_endpoint[1],
+        "method": target_endpoint.method,
         "endpoint": target_url,
         "verify": calling_object.ssl_verify,
         "headers": joined_headers,
@@ -740,10 +746,12 @@ def process_service_request(calling_object: ServiceClass,  # pylint: disable=R09
         "container": container,
         "pythonic": do_pythonic,
         "perform": True,
-        "stream": kwargs.get("stream", False)
+        "stream": kwargs.get("stream", passed_keywords.get("stream", False)),
+        "retry_policy": passed_keywords.get("retry_policy", None),
+        "operation_id": operation_id
     }
 
-    return service_request(**new_keywords)
+    return new_keywords, target_endpoint
 
 
 def handle_path_variables(passed: dict, route_url: str):
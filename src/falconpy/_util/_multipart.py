@@ -0,0 +1,292 @@
+"""Streaming multipart form encoder.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from binascii import hexlify
+from io import SEEK_END, TextIOBase
+from os import PathLike, fspath, fstat, urandom
+from os.path import basename, getsize
+from stat import S_ISREG
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+# Number of bytes read from a file at a time while the body is being sent.
+UPLOAD_CHUNK_SIZE = 1048576
+
+# Content that may be provided for an uploaded file.
+FileContent = Union[bytes, bytearray, memoryview, str, BinaryIO, PathLike]
+
+
+def guess_filename(content: Any) -> Optional[str]:
+    """Return the name of the file the content was read from, if it was read from a file."""
+    returned = None
+    if isinstance(content, PathLike):
+        returned = basename(fspath(content))
+    else:
+        name = getattr(content, "name", None)
+        if name and isinstance(name, str) and name[0] != "<" and name[-1] != ">":
+            returned = basename(name)
+
+    return returned
+
+
+def header_param(name: str, value: Union[str, bytes]) -> str:
+    """Format and quote a multipart header parameter, percent encoding line breaks and quotes."""
+    if isinstance(value, bytes):
+        value = value.decode("utf-8")
+
+    return f'{name}="{value.translate({10: "%0A", 13: "%0D", 34: "%22"})}"'
+
+
+def handle_size(handle: BinaryIO) -> Optional[int]:
+    """Return the number of bytes remaining to be read from the handle, or None if it cannot be determined."""
+    returned = None
+    # EAFP
+    try:
+        status = fstat(handle.fileno())
+        if S_ISREG(status.st_mode):
+            returned = max(status.st_size - handle.tell(), 0)
+    except (AttributeError, OSError, ValueError):
+        pass
+    if returned is None:
+        try:
+            if handle.seekable():
+                position = handle.tell()
+                returned = max(handle.seek(0, SEEK_END) - position, 0)
+                handle.seek(position)
+        except (AttributeError, OSError, ValueError):
+            pass
+
+    return returned
+
+
+class MultipartEncoder:
+    """Stream a multipart/form-data request body without reading the uploaded files into memory.
+
+    Accepts the same data and files payloads as requests, and produces the same body. File content
+    may be provided as bytes, a string, an open binary file handle or a path (os.PathLike). Handles
+    and paths are read in chunks while the request is sent, paths are opened for each request so the
+    same file may be uploaded by several requests in parallel.
+
+    The encoder is sent by requests as a streamed body, the len attribute is used for the
+    Content-Length header. When the size of a file handle cannot be determined, len is None
+    and the body is sent using chunked transfer encoding instead.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 files: Union[Dict[str, Any], List[Tuple[str, Any]]],
+                 data: Optional[Union[Dict[str, Any], List[Tuple[str, Any]]]] = None,
+                 boundary: Optional[str] = None,
+                 chunk_size: int = UPLOAD_CHUNK_SIZE
+                 ):
+        """Construct an instance of the MultipartEncoder class.
+
+        Keyword arguments
+        ----
+        files : dict or list of tuples
+            Files to upload, as provided to requests. Each value may be the content, or a tuple
+            containing the file name, content and optionally the content type and part headers.
+        data : dict or list of tuples
+            Form fields sent before the files.
+        boundary : str
+            Boundary separating each part of the body. [Default: Randomly generated]
+        chunk_size : int
+            Number of bytes to read from a file at a time. [Default: 1048576]
+        """
+        self._boundary: str = boundary or hexlify(urandom(16)).decode("ascii")
+        self._chunk_size: int = chunk_size
+        # Part headers and content, in the order they are sent.
+        self._parts: List[Tuple[bytes, FileContent]] = []
+        # Starting position of each file handle, used to rewind the body when a request is retried.
+        self._starts: List[Tuple[BinaryIO, int]] = []
+        for field, value in (data.items() if isinstance(data, dict) else data or []):
+            values = [value] if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__") else value
+            for content in values:
+                if content is not None:
+                    self._add(field.decode("utf-8") if isinstance(field, bytes) else field,
+                              content if isinstance(content, bytes) else str(content)
+                              )
+        for field, value in (files.items() if isinstance(files, dict) else files):
+            content_type = None
+            headers = None
+            if isinstance(value, (tuple, list)):
+                file_name, content, *extra = value
+                content_type = extra[0] if extra else None
+                headers = extra[1] if len(extra) > 1 else None
+            else:
+                file_name = guess_filename(value) or field
+                content = value
+            if content is not None:
+                self._add(field, content, file_name, content_type, headers)
+        self._trailer: bytes = f"--{self._boundary}--\r\n".encode("latin-1")
+        self._len: Optional[int] = self._calculate_length()
+        self._stream: Optional[Iterator[bytes]] = None
+        self._pending: memoryview = memoryview(b"")
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def _add(self,  # pylint: disable=R0913,R0917
+             field: str,
+             content: FileContent,
+             file_name: Optional[str] = None,
+             content_type: Optional[str] = None,
+             headers: Optional[Dict[str, str]] = None
+             ):
+        """Add a part to the body."""
+        disposition = f"form-data; {header_param('name', field)}"
+        if file_name is not None:
+            disposition = f"{disposition}; {header_param('filename', file_name)}"
+        part_headers = {**(headers or {}), "Content-Disposition": disposition, "Content-Type": content_type}
+        lines = [f"{key}: {part_headers[key]}" for key in ("Content-Disposition", "Content-Type") if part_headers[key]]
+        lines.extend(f"{key}: {value}" for key, value in part_headers.items()
+                     if key not in ("Content-Disposition", "Content-Type", "Content-Location") and value
+                     )
+        head = f"--{self._boundary}\r\n".encode("latin-1") + "\r\n".join([*lines, "\r\n"]).encode("utf-8")
+        if isinstance(content, TextIOBase):
+            # Text handles are encoded up front, as requests would.
+            content = content.read()
+        if isinstance(content, int):
+            content = str(content)
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        if hasattr(content, "read"):
+            # EAFP
+            try:
+                self._starts.append((content, content.tell()))
+            except (AttributeError, OSError, ValueError):
+                pass
+        self._parts.append((head, content))
+
+    def _calculate_length(self) -> Optional[int]:
+        """Calculate the size of the body, returning None if the size of a file handle cannot be determined."""
+        returned = len(self._trailer)
+        for head, content in self._parts:
+            if isinstance(content, PathLike):
+                size = getsize(content)
+            elif hasattr(content, "read"):
+                size = handle_size(content)
+            else:
+                size = len(content)
+            if size is None:
+                return None
+            returned += len(head) + size + 2
+
+        return returned
+
+    def _chunks(self, handle: BinaryIO) -> Iterator[bytes]:
+        """Read the handle in chunks until it is exhausted."""
+        chunk = handle.read(self._chunk_size)
+        while chunk:
+            yield chunk
+            chunk = handle.read(self._chunk_size)
+
+    def _segments(self) -> Iterator[Union[bytes, bytearray, memoryview]]:
+        """Produce the body one segment at a time, reading files as they are reached."""
+        for head, content in self._parts:
+            yield head
+            if isinstance(content, PathLike):
+                with open(content, "rb") as source:
+                    yield from self._chunks(source)
+            elif hasattr(content, "read"):
+                yield from self._chunks(content)
+            else:
+                yield content
+            yield b"\r\n"
+        yield self._trailer
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """Read up to size bytes of the body. The remainder of the body is returned when size is not provided."""
+        if self._stream is None:
+            self._stream = self._segments()
+        chunks: List[memoryview] = []
+        wanted = size if size is not None and size >= 0 else None
+        while wanted is None or wanted > 0:
+            if not self._pending:
+                segment = next(self._stream, None)
+                if segment is None:
+                    break
+                self._pending = memoryview(segment).cast("B")
+                continue
+            taken = len(self._pending) if wanted is None else min(wanted, len(self._pending))
+            chunks.append(self._pending[:taken])
+            self._pending = self._pending[taken:]
+            if wanted is not None:
+                wanted -= taken
+
+        return b"".join(chunks)
+
+    def rewind(self):
+        """Rewind the body to the beginning so it may be sent again."""
+        for handle, start in self._starts:
+            handle.seek(start)
+        self._stream = None
+        self._pending = memoryview(b"")
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over the body in chunks."""
+        chunk = self.read(self._chunk_size)
+        while chunk:
+            yield chunk
+            chunk = self.read(self._chunk_size)
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def boundary(self) -> str:
+        """Boundary separating each part of the body."""
+        return self._boundary
+
+    @property
+    def content_type(self) -> str:
+        """Content-Type header value for the body."""
+        return f"multipart/form-data; boundary={self._boundary}"
+
+    @property
+    def len(self) -> Optional[int]:
+        """Size of the body in bytes, None if it cannot be determined before it is sent."""
+        return self._len
+
+    @property
+    def chunk_size(self) -> int:
+        """Number of bytes read from a file at a time."""
+        return self._chunk_size
@@ -0,0 +1,132 @@
+"""Request transmission helpers.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from typing import List, Optional, Tuple
+import requests
+from .._api_request import APIRequest
+from ._codec import json_dumps
+from ._multipart import MultipartEncoder
+
+
+def send_request(api: APIRequest, headers: dict, allow_redirects: bool) -> Tuple[requests.Response, int, float]:
+    """Send the request, retrying transient failures when a retry policy is provided.
+
+    Responses to read only operations are returned from, and stored within,
+    the response cache when one is provided.
+
+    Returns: tuple containing the response, the number of retries performed and the
+             total number of seconds spent waiting for the rate limit or between attempts.
+    """
+    cache_key = request_cache_key(api)
+    if cache_key:
+        cached = api.response_cache.get(cache_key)
+        if cached is not None:
+            if api.log_util:
+                api.log_util.debug("CACHE: Response for %s returned from cache", api.operation_id)
+            return cached, 0, 0.0
+    # Use the pooled session from the auth_object when available, otherwise
+    # fall back to a single use connection.
+    requester = api.session if api.session else requests
+    paced: List[float] = []
+    data = api.data_payload
+    files = api.files
+    if not data and not files and api.body_payload is not None:
+        # Encode JSON bodies once with the JSON codec in use, as requests would with the json keyword.
+        data = json_dumps(api.body_payload)
+        if not any(key.lower() == "content-type" for key in headers):
+            headers = {**headers, "Content-Type": "application/json"}
+    if files and not isinstance(data, (str, bytes)):
+        # Stream multipart bodies as they are sent, instead of letting requests build them in memory.
+        data = MultipartEncoder(files, data)
+        files = None
+        if not any(key.lower() == "content-type" for key in headers):
+            headers = {**headers, "Content-Type": data.content_type}
+
+    def attempt() -> requests.Response:
+        response = None
+        # Wait for headroom within the rate limit shared by this credential.
+        paced.append(pace_request(api))
+        if isinstance(data, MultipartEncoder):
+            # Retried uploads are sent again from the beginning of each file.
+            data.rewind()
+        try:
+            response = requester.request(api.method.upper(), api.endpoint, params=api.param_payload,
+                                         headers=headers, data=data,
+                                         files=files, verify=api.verify, allow_redirects=allow_redirects,
+                                         proxies=api.proxy, timeout=api.timeout, stream=api.stream
+                                         )
+        finally:
+            if api.rate_limiter:
+                api.rate_limiter.release(response)
+
+        return response
+
+    if api.retry_policy:
+        retry_log = api.log_util.debug if api.log_util else None
+        returned, retries, waited = api.retry_policy.perform(api.method, attempt, retry_log)
+    else:
+        returned, retries, waited = attempt(), 0, 0.0
+
+    if cache_key and api.response_cache.store(cache_key, api.operation_id, returned) and api.log_util:
+        api.log_util.debug("CACHE: Response for %s stored in cache", api.operation_id)
+
+    return returned, retries, waited + sum(paced)
+
+
+def pace_request(api: APIRequest) -> float:
+    """Wait for the rate limiter to provide a slot for this request, returning the seconds waited."""
+    waited = 0.0
+    if api.rate_limiter:
+        waited = api.rate_limiter.acquire()
+        if waited and api.log_util:
+            api.log_util.debug("RATE LIMIT: Waited %.2f seconds, %s requests remaining",
+                               waited, api.rate_limiter.remaining
+                               )
+
+    return waited
+
+
+def request_cache_key(api: APIRequest) -> Optional[str]:
+    """Return the response cache key for this request, or None if the response cannot be cached."""
+    returned = None
+    cache = api.response_cache
+    # Only read only operations without a payload are cached, streamed downloads are never cached.
+    if cache and not api.stream and not (api.body_payload or api.data_payload or api.files):
+        if cache.cacheable(api.method, api.operation_id):
+            returned = cache.key(api.operation_id, api.endpoint, api.param_payload, api.cache_scope)
+
+    return returned
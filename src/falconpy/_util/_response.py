@@ -0,0 +1,181 @@
+"""FalconPy response handling helpers.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from logging import Logger
+from typing import Any, Dict, Optional, Union
+try:
+    from simplejson import JSONDecodeError as SimplejsonJSONDecodeError
+except (ImportError, ModuleNotFoundError):  # Support import as a module
+    SimplejsonJSONDecodeError = None  # Support import as a module
+from json.decoder import JSONDecodeError as StdJSONDecodeError
+import requests
+from .._api_request import APIRequest
+from .._error import APIError, NoContentWarning, RegionSelectError, SDKError
+from .._result import Result
+from ._codec import json_loads
+
+# create a tuple of all possible JSONDecodeError types for exception handling
+# pylint: disable=invalid-name
+JSONDecodeError = (SimplejsonJSONDecodeError, StdJSONDecodeError) if SimplejsonJSONDecodeError else (StdJSONDecodeError,)
+
+
+def decode_json_body(resp: requests.Response) -> Any:
+    """Decode a JSON response body, using the character set detected by requests when it is not UTF-8."""
+    # EAFP
+    try:
+        returned = json_loads(resp.content)
+    except JSONDecodeError:
+        returned = resp.json()
+
+    return returned
+
+
+# pylint: disable=R0912  # I don't disagree, but this will work for now.
+def calc_content_return(resp: requests.Response,
+                        contain: bool,
+                        auth: bool,
+                        log: Logger,
+                        pythonic_mode: bool,
+                        api_method: str
+                        ) -> Union[dict, bytes, Result]:
+    """Calculate the returned content based upon the results from the call to requests.
+
+    The decoded body is wrapped by a single Result object. When pythonic mode is enabled this
+    object is returned, otherwise a view of the result in the legacy dictionary format is returned.
+    """
+    returned = {}
+    result: Optional[Result] = None
+    returned_content_type = resp.headers.get('content-type', None)
+    if not returned_content_type:
+        returned_content_type = resp.headers.get("Content-Type", "Binary")
+    if log:
+        log.debug("RECEIVED: Content returned in %s format", returned_content_type)
+    if returned_content_type.startswith("application/json"):  # Issue 708
+        json_resp: Union[dict, Result] = {}
+        try:
+            json_resp = decode_json_body(resp)
+        except JSONDecodeError:
+            if api_method != "HEAD":
+                # It says JSON in the headers but it came back to us as a binary string.
+                json_resp = json_loads(resp.content.decode("ascii"))
+        finally:
+            # Default behavior is to return results as a standardized dictionary.
+            result = Result(status_code=resp.status_code,
+                            headers=resp.headers,
+                            body=json_resp,
+                            head_request=bool(api_method == "HEAD")
+                            )
+    elif returned_content_type.startswith("text/plain"):
+        # Assuming UTF-8 for now
+        result = Result(resp.status_code,
+                        resp.headers,
+                        json_loads(resp.content)
+                        )
+    elif contain:
+        result = Result(resp.status_code, resp.headers, decode_json_body(resp))
+    else:
+        # Binary response
+        if not resp.content:
+            if auth:
+                # Issue 433 - GovCloud autodiscovery is not supported
+                raise RegionSelectError(headers=resp.headers)
+
+            # Nothing was returned, so give them back the blank binary object
+            # Emulates < v1.3 functionality
+            returned = resp.content
+        else:
+            # returned = resp.content
+            result = Result(resp.status_code, resp.headers, resp.content)
+    if result is not None:
+        returned = result if pythonic_mode else result.full_return
+
+    # Catch and log API response errors
+    try:
+        if resp.status_code >= 400:
+            _message = None
+            _errors = result.errors.data if result is not None else []
+            if _errors:
+                _message = f"ERROR: {_errors[0]['message']}"
+            raise APIError(code=resp.status_code, message=_message, headers=resp.headers)
+    except APIError as api_error:
+        # Still return the payload unless we're in pythonic mode
+        if log:
+            log.error(api_error.message)
+        if pythonic_mode:
+            raise api_error
+
+    return returned, returned_content_type
+
+
+def request_failure(api: APIRequest,
+                    failure: Exception,
+                    response: Optional[requests.Response],
+                    pythonic: bool
+                    ) -> Dict[str, Union[int, dict, list]]:
+    """Handle an error raised while performing a request, returning the error result or raising.
+
+    Shared by the synchronous and asynchronous request handlers.
+    """
+    if isinstance(failure, RegionSelectError):
+        # More than likely they tried to autoselect to GovCloud
+        returned = failure.result
+        api.log_error(returned.get("status_code"), failure.message, returned)
+        return returned
+
+    if isinstance(failure, JSONDecodeError):
+        # No response content, but a successful request was made
+        if "/identity-protection/combined/graphql/v1" in api.endpoint:  # pragma: no cover
+            raise SDKError(message=f"{str(failure)}",
+                           headers=api.debug_headers
+                           ) from failure
+
+        api.log_warning("WARNING: No content was received for this request.")
+        raise NoContentWarning(headers=response.headers,
+                               code=response.status_code
+                               ) from failure
+
+    # General catch-all for anything coming          ____ ____ _ _      \\       o   o
+    # out of requests or the library itself.         |___ |--<  Y        ||      |\O/|
+    # Pass this error up to the parent try/catch                          \\      \Y/
+    # block residing within our decorator        _  _ ____ _  _ ____ ____         /W\
+    # (force_default) for handling.              |--| |--|  \/  [__] |___  !!   _|WWW|_
+    if pythonic:
+        # Oh wait, we're pythonic, lets generate
+        # a regular python error condition instead.
+        raise failure
+
+    raise SDKError(message=f"{str(failure)}", headers=api.debug_headers) from failure
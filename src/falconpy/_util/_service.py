@@ -65,5 +65,8 @@ def service_override_payload(caller: object,
         "log_util": caller.log,
         "debug_record_count": caller.debug_record_count,
         "sanitize": caller.sanitize_log,
-        "pythonic": caller.pythonic
+        "pythonic": caller.pythonic,
+        "session": caller.auth_object.connection_pool.get_session(caller.proxy),
+        "rate_limiter": caller.auth_object.rate_limiter,
+        "retry_policy": caller.retry_policy
     }
@@ -185,7 +185,7 @@ def uber_request_keywords(caller,
         "data": kwa.get("data", return_preferred_default(oper)),
         "params": args_to_params(kwa.get("parameters", {}),
                                  kwa,
-                                 caller.commands,
+                                 caller.operations,
                                  oper,
                                  caller.log,
                                  caller.pythonic
@@ -202,5 +202,11 @@ def uber_request_keywords(caller,
         "debug_record_count": caller.debug_record_count,
         "sanitize": caller.sanitize_log,
         "pythonic": caller.pythonic,
-        "stream": do_stream
+        "stream": do_stream,
+        "session": caller.connection_pool.get_session(caller.proxy),
+        "rate_limiter": caller.rate_limiter,
+        "retry_policy": kwa.get("retry_policy") if kwa.get("retry_policy") is not None else caller.retry_policy,
+        "response_cache": caller.response_cache,
+        "cache_scope": caller.cache_scope if caller.response_cache else None,
+        "operation_id": oper
     }
@@ -36,19 +36,32 @@ OTHER DEALINGS IN THE SOFTWARE.
 For more information, please refer to <https://unlicense.org>
 """
 import functools
-from typing import Dict, Union, Callable
+from collections.abc import Hashable
+from functools import partial
+from inspect import iscoroutinefunction
+from json import dumps
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, Callable
 from requests import Response
+from requests.exceptions import RequestException
 from .._constant import ALLOWED_METHODS
 from .._util import (
-    perform_request
+    perform_request,
+    async_perform_request,
+    async_chunked_request,
+    async_refresh_token,
+    run_async,
+    imap_workers
     )
 from .._auth_object import UberInterface
 from .._result import Result
+from .._service_class._download import FileDownloader, DownloadResult, Destination, DOWNLOAD_CHUNK_SIZE
 from .._util import (
     handle_body_payload_ids,
     scrub_target,
     handle_container_operations,
-    uber_request_keywords
+    uber_request_keywords,
+    chunk_requests,
+    chunked_request
     )
 from .._error import (
     InvalidOperation,
@@ -68,25 +81,44 @@ def command_error_handler(func: Callable):
     of log settings, this method will craft the error response returned
     based upon the result property of the SDKError derivative.
 
+    Coroutine functions (acommand) are wrapped by a coroutine function.
+
     Defined here to prevent weirdness in the wrapper behavior.
     """
+    def handle_failure(caller, bad_sdk: SDKError) -> Dict[str, Union[str, int, dict]]:
+        """Log the failure and return the error result."""
+        result = bad_sdk.result
+        if caller.log:
+            caller.log.error(bad_sdk.message)
+            # Warnings shouldn't generate result payloads
+            caller.log.debug("STATUS CODE: %i", bad_sdk.code)
+            caller.log.debug("RESULT: %s", result)
+        return result
+
+    if iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(caller, *args, **kwargs) -> Union[Dict[str, Union[str, int, dict]], bytes, Result, Response]:
+            """Inner wrapper."""
+            try:
+                result = await func(caller, *args, **kwargs)
+            except APIError as api_error:
+                # Should only receive this in pythonic mode
+                raise api_error
+            except (SDKError, InvalidMethod, InvalidOperation) as bad_sdk:
+                result = handle_failure(caller, bad_sdk)
+            return result
+        return async_wrapper
+
     @functools.wraps(func)
     def wrapper(caller, *args, **kwargs) -> Union[Dict[str, Union[str, int, dict]], bytes, Result, Response]:
         """Inner wrapper."""
-        def log_failure(msg, code: int, res: dict = None):
-            if caller.log:
-                caller.log.error(msg)
-                # Warnings shouldn't generate result payloads
-                caller.log.debug("STATUS CODE: %i", code)
-                caller.log.debug("RESULT: %s", res)
         try:
             result = func(caller, *args, **kwargs)
         except APIError as api_error:
             # Should only receive this in pythonic mode
             raise api_error
         except (SDKError, InvalidMethod, InvalidOperation) as bad_sdk:
-            result = bad_sdk.result
-            log_failure(bad_sdk.message, bad_sdk.code, result)
+            result = handle_failure(caller, bad_sdk)
         return result
     return wrapper
 
@@ -123,7 +155,6 @@ class APIHarnessV2(UberInterface):
     #             `-'    \ -._\ ""_..--''  .-' .'
     #                     \/    .' .-'.-'  .-' .-'
     #                         .-'.' .'  .' .-
-    # pylint: disable=R0912
     @command_error_handler
     def command(self, *args, **kwargs) -> Union[Dict[str, Union[str, int, dict]], bytes, Result, Response]:
         """Uber Class API command method.
@@ -183,6 +214,185 @@ class APIHarnessV2(UberInterface):
         dict or bytes
             Dictionary or binary object containing API response depending on requested operation.
         """
+        returned, keyword_payload = self._command_payload(*args, **kwargs)
+        if keyword_payload:
+            # Split ID lists larger than the operation accepts into concurrently performed requests.
+            returned = chunked_request(perform_request,
+                                       keyword_payload,
+                                       self.operations.get(keyword_payload["operation_id"]),
+                                       caller=self
+                                       )
+            if returned is None:
+                # Process the API request normally.
+                returned = perform_request(**keyword_payload)
+
+        return returned
+
+    @command_error_handler
+    async def acommand(self, *args, **kwargs) -> Union[Dict[str, Union[str, int, dict]], bytes, Result, Response]:
+        """Uber Class asynchronous API command method.
+
+        Awaitable version of the command method, accepting the same arguments and keywords.
+
+        When httpx is installed, the request is sent using an asynchronous client so the
+        number of commands in flight from one event loop is not limited by the worker pool.
+        Otherwise, and for file uploads and streamed downloads, the request is performed
+        within the worker pool owned by this interface (max_workers, Default: pool_maxsize).
+        Token generation is always performed within the worker pool.
+
+        Returns
+        ----
+        dict or bytes
+            Dictionary or binary object containing API response depending on requested operation.
+        """
+        operation = kwargs.get("api_operation", kwargs.get("action", args[0] if args else None))
+        if operation in ("oauth2AccessToken", "oauth2RevokeToken"):
+            # Token operations are performed by the synchronous login and logout handlers.
+            return await run_async(self.connection_pool.executor, self.command, *args, **kwargs)
+        await async_refresh_token(self)
+        returned, keyword_payload = self._command_payload(*args, **kwargs)
+        if keyword_payload:
+            client = self.connection_pool.get_async_client(self.proxy, self.ssl_verify)
+            chunks = chunk_requests(keyword_payload, self.operations.get(keyword_payload["operation_id"]))
+            executor = None
+            if not client or keyword_payload["stream"] or keyword_payload["files"]:
+                # Performed within the worker pool.
+                executor = self.connection_pool.executor
+            perform = partial(async_perform_request, client=client, executor=executor)
+            if chunks:
+                returned = await async_chunked_request(perform, chunks)
+            else:
+                returned = await perform(**keyword_payload)
+
+        return returned
+
+    def batch(self,
+              commands: Sequence[Union[str, Dict[str, Any], Tuple[str, Dict[str, Any]]]],
+              max_workers: Optional[int] = None
+              ) -> List[Union[Dict[str, Union[str, int, dict]], bytes, Result, Response]]:
+        """Uber Class batch command method.
+
+        Performs many unrelated API operations concurrently using the worker pool owned by
+        this interface, sharing the connection pool and rate limiter with every other request.
+
+        Keyword arguments
+        ----
+        commands : list
+            Operations to perform. Each command is either an operation ID, a dictionary of
+            keywords accepted by the command method (including api_operation), or a tuple
+            containing the operation ID and a dictionary of keywords.
+        max_workers : int (Default: worker pool size)
+            Maximum number of operations in flight at the same time.
+
+        Identical read (GET) commands are only performed once, with the same result returned
+        for each. Errors are isolated to the command that raised them and returned as results,
+        even when pythonic mode is enabled.
+
+        Returns
+        ----
+        list
+            Results for each command, in the order provided.
+        """
+        specs: List[Dict[str, Any]] = []
+        for command in commands:
+            if isinstance(command, str):
+                specs.append({"api_operation": command})
+            elif isinstance(command, tuple):
+                specs.append({**command[1], "api_operation": command[0]})
+            else:
+                specs.append(dict(command))
+        # Map each command to the position of the unique command that will be performed.
+        unique: List[Dict[str, Any]] = []
+        positions: List[int] = []
+        seen: Dict[Hashable, int] = {}
+        for spec in specs:
+            key = self._batch_key(spec)
+            if key is None or key not in seen:
+                if key is not None:
+                    seen[key] = len(unique)
+                positions.append(len(unique))
+                unique.append(spec)
+            else:
+                positions.append(seen[key])
+
+        def perform(spec: Dict[str, Any]) -> Union[Dict[str, Union[str, int, dict]], bytes, Result, Response]:
+            try:
+                returned = self.command(**spec)
+            except SDKError as failure:
+                # Pythonic mode raises API errors, return them as the result of this command.
+                returned = failure.result
+            except RequestException as failure:
+                # Connection failures outside of the request handler (such as a token refresh).
+                returned = SDKError(code=500, message=str(failure)).result
+            if self.pythonic and isinstance(returned, dict):
+                # SDK errors are always handled by the command method using the legacy result format.
+                returned = Result(full=returned)
+            return returned
+
+        if max_workers is None:
+            max_workers = self.connection_pool.max_workers
+        results = list(imap_workers(self.connection_pool.executor, perform, unique, max_workers=max_workers))
+
+        return [results[position] for position in positions]
+
+    def download_file(self,  # pylint: disable=R0913
+                      api_operation: str,
+                      destination: Destination,
+                      expected_sha256: Optional[str] = None,
+                      chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+                      max_attempts: int = 3,
+                      resume: bool = True,
+                      progress: Optional[Callable[[int, Optional[int]], None]] = None,
+                      **kwargs
+                      ) -> DownloadResult:
+        """Uber Class download method.
+
+        Performs an API operation that returns a file, writing the file to a path or binary file
+        object as it is received so that it is never held in memory.
+
+        Keyword arguments
+        ----
+        api_operation : str
+            API Operation ID to perform.
+        destination : str, path or binary file object
+            Location the file is written to. Files written to a path are received as path.part
+            and renamed once complete.
+        expected_sha256 : str (Default: None)
+            SHA256 the received file must match.
+        chunk_size : int (Default: 1048576)
+            Number of bytes read and written at a time.
+        max_attempts : int (Default: 3)
+            Maximum number of requests performed for the file.
+        resume : bool (Default: True)
+            Resume interrupted transfers using Range requests when the server supports it.
+        progress : callable (Default: None)
+            Called with the number of bytes received and the total size (None when unknown).
+
+        All other keywords are accepted as provided to the command method.
+
+        Returns
+        ----
+        DownloadResult
+            Outcome of the download, including the size and SHA256 of the file received.
+        """
+        def request(headers: Dict[str, str]) -> Union[Dict[str, Union[str, int, dict]], Result, Response]:
+            return self.command(api_operation, stream=True, **{**kwargs, "headers": {**kwargs.get("headers", {}), **headers}})
+
+        downloader = FileDownloader(request, chunk_size=chunk_size, max_attempts=max_attempts, resume=resume,
+                                    progress=progress, pythonic=self.pythonic
+                                    )
+
+        return downloader.download(destination, expected_sha256)
+
+    # pylint: disable=R0912
+    def _command_payload(self, *args, **kwargs) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Calculate the keywords provided to perform_request for the requested command.
+
+        Accepts the same arguments and keywords as the command method.
+
+        Returns: tuple containing the result when the command was completed without a
+                 request (token operations), and the keywords for the request to perform.
+        """
         # Issue #1161 - operation is specified using the action keyword
         if kwargs.get("action", None) and not kwargs.get("api_operation", None):
             kwargs["api_operation"] = kwargs.get("action")
@@ -192,9 +402,13 @@ class APIHarnessV2(UberInterface):
                 kwargs["api_operation"] = args[0]
         except IndexError:
             pass  # They didn't specify an action, try for an override instead.
-        uber_command = [a for a in self.commands if a[0] == kwargs.get("api_operation", None)]
+        # Retrieve the operation from the registry instead of scanning the list of commands.
+        found = self.operations.get(kwargs.get("api_operation", None))
+        uber_command = [[found.operation_id, found.method, found.route]] if found else []
         if kwargs.get("override", None):
             uber_command = [["Manual"] + kwargs["override"].split(",")]
+        returned = None
+        keyword_payload = None
         if uber_command:
             # Which API operation to perform.
             operation = uber_command[0][0]
@@ -234,8 +448,6 @@ class APIHarnessV2(UberInterface):
                     # Log the operation we're performing if enabled.
                     if self.log:
                         self.log.debug("OPERATION: %s", operation)
-                    # Process the API request normally.
-                    returned = perform_request(**keyword_payload)
             else:
                 # Bad HTTP method.
                 raise InvalidMethod
@@ -243,4 +455,17 @@ class APIHarnessV2(UberInterface):
             # That command doesn't exist, have a cup of tea instead.
             raise InvalidOperation
 
+        return returned, keyword_payload
+
+    def _batch_key(self, spec: Dict[str, Any]) -> Optional[str]:
+        """Create the key used to identify duplicate read commands, returns None when the command is not a read."""
+        operation = self.operations.get(spec.get("api_operation", spec.get("action", None)), None)
+        returned = None
+        if operation and operation.method.upper() == "GET" and not spec.get("override", None):
+            # EAFP
+            try:
+                returned = dumps(spec, sort_keys=True, default=repr)
+            except (TypeError, ValueError):
+                returned = None
+
         return returned
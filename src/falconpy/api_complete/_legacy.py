@@ -57,7 +57,8 @@ from .._util import (
     )
 from .._enum import BaseURL, ContainerBaseURL, TokenFailReason
 from .._constant import PREFER_IDS_IN_BODY, MOCK_OPERATIONS
-from .._endpoint import api_endpoints
+from .. import _endpoint
+from .._endpoint import operation_registry
 from .._log import LogFacility
 
 
@@ -144,7 +145,7 @@ class APIHarness:
         self.token_fail_reason = None
         self.token_status = None
         self.headers = lambda: {"Authorization": f"Bearer {self.token}"} if self.token else {}
-        self.commands = api_endpoints
+        self.commands = _endpoint.api_endpoints
         self.user_agent = user_agent  # Issue #365
         # Maximum renewal window is 20 minutes, Minimum is 2 minutes
         self.token_renew_window = max(min(renew_window, 1200), 120)  # in seconds
@@ -349,7 +350,9 @@ class APIHarness:
         except IndexError:
             pass  # They didn't specify an action, use the default and try for an override instead
 
-        uber_command = [a for a in self.commands if a[0] == kwargs.get("action", None)]
+        # Retrieve the operation from the registry instead of scanning the list of commands.
+        found = operation_registry(self.commands).get(kwargs.get("action", None))
+        uber_command = [found.endpoint] if found else []
         if kwargs.get("override", None):
             uber_command = [["Manual"] + kwargs["override"].split(",")]
         if uber_command:
@@ -452,6 +452,7 @@ class FalconXSandbox(ServiceClass):
         Keyword arguments:
         comment -- A descriptive comment to identify the file for other users. String.
         file_data -- Content of the uploaded sample in binary format. Max file size is 256 MB.
+                     Open binary file handles and paths (pathlib.Path) are read as the request is sent.
                      'sample' and 'upfile' are also accepted as this parameter.
 
                      Accepted File Formats:
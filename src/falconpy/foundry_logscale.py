@@ -94,6 +94,7 @@ class FoundryLogScale(ServiceClass):
         Keyword arguments:
         data_content -- JSON formatted data to ingest. String.
         data_file -- Content of the uploaded archive in binary format.
+                     Open binary file handles and paths (pathlib.Path) are read as the request is sent.
                      'file' is also accepted as this parameter.
         parameters -- full parameters payload, not required if using other keywords.
         tag -- Custom tag for ingested data in the form 'tag:value'. String.
@@ -147,6 +148,7 @@ class FoundryLogScale(ServiceClass):
         Keyword arguments:
         data_content -- JSON formatted data to ingest. String.
         data_file -- Content of the uploaded file in binary format.
+                     Open binary file handles and paths (pathlib.Path) are read as the request is sent.
                      'file' is also accepted as this parameter.
         parameters -- full parameters payload, not required if using other keywords.
         tag -- Custom tag for ingested data in the form 'tag:value'. String.
@@ -198,6 +200,7 @@ class FoundryLogScale(ServiceClass):
 
         Keyword arguments:
         data_file -- Content of the uploaded file in binary format.
+                     Open binary file handles and paths (pathlib.Path) are read as the request is sent.
                      'file' is also accepted as this parameter.
         name -- Name used to identify the file
         description -- File description
@@ -247,6 +250,7 @@ class FoundryLogScale(ServiceClass):
 
         Keyword arguments:
         data_file -- Content of the uploaded file in binary format.
+                     Open binary file handles and paths (pathlib.Path) are read as the request is sent.
                      'file' is also accepted as this parameter.
         description -- File description. String.
         id -- Unique identifier of the file being updated. String.
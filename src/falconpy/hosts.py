@@ -35,12 +35,16 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-from typing import Dict, List, Union
-from ._util import generate_error_result, force_default, args_to_params
+# pylint: disable=C0302
+from typing import Callable, Dict, Iterable, List, Optional, Union
+from ._util import generate_error_result, force_default, args_to_params, get_executor
 from ._util import process_service_request, handle_single_argument
 from ._payload import generic_payload_list, simple_action_parameter
 from ._result import Result
-from ._service_class import ServiceClass
+from ._service_class import ServiceClass, BulkDispatcher, BulkResult, DetailsPipeline, Paginator
+from ._service_class._bulk import RETRYABLE_STATUS_CODES, Outcome
+from ._constant import BULK_ACTION_MAX_ITEMS
+from ._endpoint import get_operation
 from ._endpoint._hosts import _hosts_endpoints as Endpoints
 
 
@@ -265,6 +269,38 @@ class Hosts(ServiceClass):
 
         return returned
 
+    def perform_action_bulk(self: object,
+                            action_name: str,
+                            ids: Iterable[str],
+                            batch_size: Optional[int] = None,
+                            max_workers: int = 4,
+                            max_attempts: int = 3,
+                            progress: Optional[Callable[[BulkResult], None]] = None,
+                            **kwargs
+                            ) -> BulkResult:
+        """Take an action on a large number of hosts using concurrent requests.
+
+        The provided AIDs are split into batches of batch_size and sent concurrently.
+        Only hosts that fail with a retryable error (rate limiting or server errors) are sent again.
+
+        Keyword arguments:
+        action_name -- action to perform, see perform_action. String.
+        ids -- AID(s) to perform the action against. Iterable of strings.
+        batch_size -- Number of AIDs sent per request. Integer. Default: 100, or the limit declared by the operation
+        max_workers -- Maximum number of requests in flight at the same time. Integer. Default: 4
+        max_attempts -- Maximum number of times a host is sent. Integer. Default: 3
+        progress -- Called with the BulkResult each time a batch completes. Callable.
+        note -- a custom note that is attached to the action. String.
+
+        Returns: BulkResult object containing the outcome for each AID.
+        """
+        def send(batch: List[str]) -> Union[Dict[str, Union[int, dict]], Result]:
+            return self.perform_action(action_name=action_name, ids=batch, **kwargs)
+
+        return self._bulk_action(send, ids, batch_size or self._bulk_batch_size("PerformActionV2"),
+                                 max_workers, max_attempts, progress
+                                 )
+
     @force_default(defaults=["parameters", "body"], default_types=["dict"])
     def perform_group_action(self: object, body: dict = None, parameters: dict = None, **kwargs) -> dict:
         """Take various actions on the provided prevention policy IDs.
@@ -384,6 +420,95 @@ class Hosts(ServiceClass):
             returned = generate_error_result("Invalid value specified for action_name parameter.")
         return returned
 
+    def update_device_tags_bulk(self: object,
+                                action_name: str,
+                                ids: Iterable[str],
+                                tags: Union[List[str], str],
+                                batch_size: Optional[int] = None,
+                                max_workers: int = 4,
+                                max_attempts: int = 3,
+                                progress: Optional[Callable[[BulkResult], None]] = None
+                                ) -> BulkResult:
+        """Append or remove Falcon Grouping Tags on a large number of hosts using concurrent requests.
+
+        The provided AIDs are split into batches of batch_size and sent concurrently.
+        Only hosts that fail with a retryable error (rate limiting or server errors) are sent again.
+
+        Keyword arguments:
+        action_name -- action to perform, 'add' or 'remove'. String.
+        ids -- AID(s) of the hosts to update. Iterable of strings.
+        tags -- Tag(s) to update. String or list of strings.
+        batch_size -- Number of AIDs sent per request. Integer. Default: 100, or the limit declared by the operation
+        max_workers -- Maximum number of requests in flight at the same time. Integer. Default: 4
+        max_attempts -- Maximum number of times a host is sent. Integer. Default: 3
+        progress -- Called with the BulkResult each time a batch completes. Callable.
+
+        Returns: BulkResult object containing the outcome for each AID.
+        """
+        def send(batch: List[str]) -> Union[Dict[str, Union[int, dict]], Result]:
+            return self.update_device_tags(action_name=action_name, ids=batch, tags=tags)
+
+        return self._bulk_action(send, ids, batch_size or self._bulk_batch_size("UpdateDeviceTags"),
+                                 max_workers, max_attempts, progress
+                                 )
+
+    def _bulk_action(self: object,  # pylint: disable=R0913,R0917
+                     send: Callable,
+                     ids: Iterable[str],
+                     batch_size: int,
+                     max_workers: int,
+                     max_attempts: int,
+                     progress: Optional[Callable[[BulkResult], None]]
+                     ) -> BulkResult:
+        """Send the provided AIDs to a host action operation in batches."""
+        return BulkDispatcher(send, self._action_outcome, str, batch_size=batch_size, max_workers=max_workers,
+                              max_attempts=max_attempts, progress=progress, executor=get_executor(self)
+                              ).dispatch(ids)
+
+    @staticmethod
+    def _bulk_batch_size(operation_id: str) -> int:
+        """Return the default number of AIDs sent per request to a host action operation.
+
+        The maxItems definition of the ids parameter is used when the operation declares one,
+        otherwise the limit listed within BULK_ACTION_MAX_ITEMS.
+        """
+        ids = get_operation(Endpoints, operation_id).parameters.get("ids", None)
+
+        return (ids.max_items if ids else None) or BULK_ACTION_MAX_ITEMS[operation_id]
+
+    @staticmethod
+    def _action_outcome(batch: List[str], result: Union[Dict[str, Union[int, dict]], Result]) -> Outcome:
+        """Return the successful and failed AIDs contained within the result of a host action.
+
+        Only hosts returned with an error code or message have failed. Hosts that were not updated
+        because they are already in the requested state (such as unhiding a visible host) succeed.
+        """
+        succeeded = {}
+        failed = {}
+        for resource in Paginator.page_content(result)[2]:
+            if not isinstance(resource, dict):
+                continue
+            # Tag updates are returned per device with a status code.
+            device_id = resource.get("device_id", resource.get("id", None))
+            code = resource.get("code", 200)
+            if not device_id:
+                continue
+            if (isinstance(code, int) and code >= 300) or resource.get("error", None):
+                message = str(resource.get("error", None) or resource.get("message", "Action was not performed"))
+                failed[device_id] = (message, code in RETRYABLE_STATUS_CODES)
+            else:
+                succeeded[device_id] = True
+        # EAFP
+        try:
+            errors = result.errors.data if isinstance(result, Result) else result["body"]["errors"]
+        except (AttributeError, KeyError, TypeError):
+            errors = []
+        for error in errors or []:
+            if isinstance(error, dict) and error.get("id", None) in batch:
+                failed[error["id"]] = (str(error.get("message", "")), error.get("code", 0) in RETRYABLE_STATUS_CODES)
+
+        return succeeded, failed
+
     @force_default(defaults=["parameters"], default_types=["dict"])
     def get_device_details_v1(self: object,
                               *args,
@@ -965,6 +1090,33 @@ class Hosts(ServiceClass):
             body_required=["ids"] if self.validate_payloads else None
             )
 
+    def inventory(self: object,
+                  batch_size: int = 5000,
+                  max_workers: int = 4,
+                  **kwargs
+                  ) -> DetailsPipeline:
+        """Stream the details of every host matching the provided filter.
+
+        Host IDs are scrolled using QueryDevicesByFilterScroll, and each page of IDs is
+        retrieved using PostDeviceDetailsV2 while scrolling continues. Device records are
+        yielded as each batch arrives, no more than max_workers batches are held at once.
+
+        Keyword arguments:
+        batch_size -- Number of hosts to retrieve per batch. Integer. Default: 5000, Max: 5000
+        max_workers -- Maximum number of batches retrieved at the same time. Integer. Default: 4
+        filter -- The filter expression that should be used to limit the results. FQL syntax.
+        sort -- The property to sort by. FQL syntax (e.g. status.desc or hostname.asc).
+        max_pages -- Maximum number of batches to retrieve. Integer. Default: No limit
+
+        Returns: DetailsPipeline object, iterate to retrieve each device record.
+        """
+        kwargs["limit"] = min(max(int(batch_size), 1), 5000)
+
+        return DetailsPipeline(self.paginate("query_devices_by_filter_scroll", **kwargs),
+                               self.get_device_details,
+                               max_workers=max_workers
+                               )
+
     # These method names align to the operation IDs in the API but
     # do not conform to snake_case / PEP8 and are defined here for
     # backwards compatibility / ease of use purposes
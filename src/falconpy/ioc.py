@@ -35,8 +35,10 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-from typing import Dict, Union
-from ._util import force_default, process_service_request, handle_single_argument
+# pylint: disable=C0302
+from collections.abc import Hashable
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from ._util import force_default, process_service_request, handle_single_argument, get_executor
 from ._payload import (
     aggregate_payload,
     indicator_payload,
@@ -44,7 +46,7 @@ from ._payload import (
     indicator_report_payload
     )
 from ._result import Result
-from ._service_class import ServiceClass
+from ._service_class import ServiceClass, BulkDispatcher, BulkResult, Paginator
 from ._endpoint._ioc import _ioc_endpoints as Endpoints
 from ._endpoint._iocs import _iocs_endpoints as LegacyEndpoints
 
@@ -523,6 +525,149 @@ class IOC(ServiceClass):
             params=parameters
             )
 
+    def indicator_create_bulk(self: object,
+                              indicators: Iterable[dict],
+                              batch_size: int = 200,
+                              max_workers: int = 4,
+                              max_attempts: int = 3,
+                              progress: Optional[Callable[[BulkResult], None]] = None,
+                              **kwargs
+                              ) -> BulkResult:
+        """Create a large number of indicators using concurrent requests.
+
+        Indicators are read from the provided iterable and sent in batches of batch_size.
+        Only indicators that fail with a retryable error (rate limiting or server errors)
+        are sent again. Indicators are identified by their type and value within the result.
+
+        Keyword arguments:
+        indicators -- Indicators to create. Iterable of dictionaries, see indicator_create.
+        batch_size -- Number of indicators sent per request. Integer. Default: 200
+        max_workers -- Maximum number of requests in flight at the same time. Integer. Default: 4
+        max_attempts -- Maximum number of times an indicator is sent. Integer. Default: 3
+        progress -- Called with the BulkResult each time a batch completes. Callable.
+        comment -- Audit log comment for the operation. String.
+        ignore_warnings -- Set to true to ignore warnings and add all IOCs. Boolean. Default: False
+        retrodetects -- Whether to submit to retrodetects. Boolean.
+
+        Returns: BulkResult object, successes are mapped to the ID of the created indicator.
+        """
+        return self._bulk_indicators("create", indicators, batch_size,
+                                     max_workers, max_attempts, progress, kwargs
+                                     )
+
+    def indicator_update_bulk(self: object,
+                              indicators: Iterable[dict],
+                              batch_size: int = 200,
+                              max_workers: int = 4,
+                              max_attempts: int = 3,
+                              progress: Optional[Callable[[BulkResult], None]] = None,
+                              **kwargs
+                              ) -> BulkResult:
+        """Update a large number of indicators using concurrent requests.
+
+        Indicators are read from the provided iterable and sent in batches of batch_size.
+        Only indicators that fail with a retryable error (rate limiting or server errors)
+        are sent again. Indicators are identified by their ID within the result.
+
+        Keyword arguments:
+        indicators -- Indicators to update, each must contain the id key. Iterable of dictionaries.
+        batch_size -- Number of indicators sent per request. Integer. Default: 200
+        max_workers -- Maximum number of requests in flight at the same time. Integer. Default: 4
+        max_attempts -- Maximum number of times an indicator is sent. Integer. Default: 3
+        progress -- Called with the BulkResult each time a batch completes. Callable.
+        comment -- Audit log comment for the operation. String.
+        ignore_warnings -- Set to true to ignore warnings and add all IOCs. Boolean. Default: False
+        retrodetects -- Whether to submit to retrodetects. Boolean.
+
+        Returns: BulkResult object, successes are mapped to the ID of the updated indicator.
+        """
+        return self._bulk_indicators("update", indicators, batch_size,
+                                     max_workers, max_attempts, progress, kwargs
+                                     )
+
+    def indicator_delete_bulk(self: object,
+                              ids: Iterable[str],
+                              batch_size: int = 200,
+                              max_workers: int = 4,
+                              max_attempts: int = 3,
+                              progress: Optional[Callable[[BulkResult], None]] = None,
+                              **kwargs
+                              ) -> BulkResult:
+        """Delete a large number of indicators by ID using concurrent requests.
+
+        IDs are read from the provided iterable and sent in batches of batch_size.
+        Only IDs that fail with a retryable error (rate limiting or server errors) are sent again.
+
+        Keyword arguments:
+        ids -- Indicator IDs to delete. Iterable of strings.
+        batch_size -- Number of IDs sent per request. Integer. Default: 200
+        max_workers -- Maximum number of requests in flight at the same time. Integer. Default: 4
+        max_attempts -- Maximum number of times an ID is sent. Integer. Default: 3
+        progress -- Called with the BulkResult each time a batch completes. Callable.
+        comment -- Audit log comment for the operation. String.
+        from_parent -- Limit action to IOCs originating from the MSSP parent. Boolean.
+
+        Returns: BulkResult object.
+        """
+        return self._bulk_indicators("delete", ids, batch_size,
+                                     max_workers, max_attempts, progress, kwargs
+                                     )
+
+    def _bulk_indicators(self: object,  # pylint: disable=R0913,R0917
+                         action: str,
+                         items: Iterable[Union[dict, str]],
+                         batch_size: int,
+                         max_workers: int,
+                         max_attempts: int,
+                         progress: Optional[Callable[[BulkResult], None]],
+                         keywords: dict
+                         ) -> BulkResult:
+        """Send the provided indicators (or IDs) to the create, update or delete operation of the IOC Service Class."""
+        method = getattr(self, f"indicator_{action}")
+        if action == "create":
+            def key(item: dict) -> Tuple[str, str]:
+                return (str(item.get("type", "")), str(item.get("value", "")))
+        elif action == "update":
+            def key(item: dict) -> str:
+                return str(item.get("id", ""))
+        else:
+            def key(item: str) -> str:
+                return str(item)
+
+        def send(batch: List[Union[dict, str]]) -> Union[Dict[str, Union[int, dict]], Result]:
+            if action == "delete":
+                return method(ids=batch, **keywords)
+            body = {"indicators": batch}
+            if keywords.get("comment", None):
+                body["comment"] = keywords.get("comment")
+            return method(body=body, **{kw: val for kw, val in keywords.items() if kw != "comment"})
+
+        def outcome(batch: List[Union[dict, str]],
+                    result: Union[Dict[str, Union[int, dict]], Result]
+                    ) -> Tuple[Dict[Hashable, str], Dict[Hashable, Tuple[str, bool]]]:
+            succeeded = {}
+            failed = {}
+            resources = Paginator.page_content(result)[2]
+            for resource in resources:
+                if isinstance(resource, str):
+                    # Deleted indicators are returned as a list of IDs.
+                    succeeded[resource] = resource
+                elif isinstance(resource, dict):
+                    # Failed indicators are returned with a message type of error.
+                    if resource.get("message_type", None) == "error" or not resource.get("id", None):
+                        failed[key(resource)] = (str(resource.get("message", "Indicator was not processed")), False)
+                    else:
+                        succeeded[key(resource)] = resource.get("id")
+            if action == "delete" and Paginator.page_content(result)[0] < 300:
+                # Indicators that no longer exist are not returned but do not require a retry.
+                for item in batch:
+                    succeeded.setdefault(key(item), key(item))
+            return succeeded, failed
+
+        return BulkDispatcher(send, outcome, key, batch_size=batch_size, max_workers=max_workers,
+                              max_attempts=max_attempts, progress=progress, executor=get_executor(self)
+                              ).dispatch(items)
+
     @force_default(defaults=["parameters"], default_types=["dict"])
     def action_query(self: object, parameters: dict = None, **kwargs) -> Union[Dict[str, Union[int, dict]], Result]:
         """Query Actions.
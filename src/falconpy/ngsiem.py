@@ -42,7 +42,8 @@ from ._util import (
     force_default,
     process_service_request,
     generate_error_result,
-    handle_single_argument
+    handle_single_argument,
+    json_loads
 )
 from ._payload import (
     ngsiem_search_payload,
@@ -79,7 +80,7 @@ class NGSIEM(ServiceClass):
         """Upload file to NGSIEM.
 
         Keyword arguments:
-        lookup_file -- File to be uploaded. Binary data.  (CSV format)
+        lookup_file -- Path to the file to be uploaded, read as the request is sent. String. (CSV format)
         repository -- Name of the repository. String.
         parameters -- Full parameters payload dictionary. Not required if using other keywords.
 
@@ -127,7 +128,7 @@ class NGSIEM(ServiceClass):
                         else:
                             returned = Result(status_code=raw.status_code,
                                               headers=raw.headers,
-                                              body=raw.json()
+                                              body=json_loads(raw.content)
                                               ).full_return
                     else:
                         returned = raw
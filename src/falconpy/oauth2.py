@@ -38,7 +38,7 @@ For more information, please refer to <https://unlicense.org>
 # pylint: disable=R0902,R0913
 from logging import Logger
 from typing import Dict, Optional, Union
-from ._auth_object import FalconInterface
+from ._auth_object import FalconInterface, ResponseCache, RetryPolicy
 from ._error import CannotRevokeToken
 from ._util import (
     confirm_base_url,
@@ -67,7 +67,7 @@ class OAuth2(FalconInterface):
     This means the OAuth2 class does not maintain an auth_object, as it is one.
     """
 
-    def __init__(self,
+    def __init__(self,  # pylint: disable=R0914,R0917
                  access_token: Optional[Union[str, bool]] = False,
                  base_url: Optional[str] = "https://api.crowdstrike.com",
                  ssl_verify: Optional[bool] = True,
@@ -83,7 +83,16 @@ class OAuth2(FalconInterface):
                  debug_record_count: Optional[int] = None,
                  sanitize_log: Optional[bool] = None,
                  pythonic: Optional[bool] = None,
-                 environment: Optional[Dict[str, str]] = None
+                 environment: Optional[Dict[str, str]] = None,
+                 pool_connections: Optional[int] = 10,
+                 pool_maxsize: Optional[int] = 10,
+                 keep_alive: Optional[bool] = True,
+                 max_workers: Optional[int] = None,
+                 rate_limit: Optional[bool] = True,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 background_refresh: Optional[bool] = False,
+                 shared_token: Optional[bool] = False
                  ):
         """Construct an instance of the class.
 
@@ -114,6 +123,27 @@ class OAuth2(FalconInterface):
             Amount of time (in seconds) between now and the token expiration before
             a refresh of the token is performed. Default: 120, Max: 1200
             Values over 1200 will be reset to the maximum.
+        pool_connections : int
+            Number of connection pools (per host) to cache. Default: 10
+        pool_maxsize : int
+            Maximum number of connections to keep alive within each pool. Default: 10
+        keep_alive : bool
+            Flag specifying if persistent pooled connections should be used. [Default: True]
+        max_workers : int
+            Maximum number of worker threads used for concurrent requests. Default: pool_maxsize
+            Limits the number of requests in flight at once when using aio, map or imap.
+        rate_limit : bool
+            Flag specifying if requests should be paced using the API rate limit. [Default: True]
+        retry_policy : RetryPolicy
+            Policy used to retry requests that fail with a transient error. [Default: No retries]
+        response_cache : ResponseCache
+            Cache used for the responses of read only (GET) operations. [Default: No caching]
+        background_refresh : bool
+            Flag specifying if tokens should be renewed ahead of the renew window by a
+            background thread. [Default: False]
+        shared_token : bool
+            Flag specifying if the token should be shared with other objects created using
+            the same credentials and base URL. [Default: False]
 
         Arguments
         ----
@@ -139,7 +169,16 @@ class OAuth2(FalconInterface):
                          debug_record_count=debug_record_count,
                          sanitize_log=sanitize_log,
                          pythonic=pythonic,
-                         environment=environment
+                         environment=environment,
+                         pool_connections=pool_connections,
+                         pool_maxsize=pool_maxsize,
+                         keep_alive=keep_alive,
+                         max_workers=max_workers,
+                         rate_limit=rate_limit,
+                         retry_policy=retry_policy,
+                         response_cache=response_cache,
+                         background_refresh=background_refresh,
+                         shared_token=shared_token
                          )
 
     def logout(self) -> Union[Dict[str, Union[int, dict]], Result]:
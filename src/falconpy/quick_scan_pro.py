@@ -67,6 +67,7 @@ class QuickScanPro(ServiceClass):
 
         Keyword arguments:
         file -- Binary file to be uploaded. Max file size: 256 MB.
+        Open binary file handles and paths (pathlib.Path) are read as the request is sent.
         scan -- If true, after upload, it starts scanning immediately. Default scan mode is 'false'
         file_name -- Name of the file uploaded. Defaults to "UploadedFile".
         password -- MULTIPART ONLY - Password for encrypted archives (use for multipart/form-data uploads).
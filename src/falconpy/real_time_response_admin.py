@@ -327,6 +327,7 @@ class RealTimeResponseAdmin(ServiceClass):
                 }
         files -- File to be uploaded. List of tuples. *REQUIRED*
                  Ex: [('file', ('file.ext', open('file.ext','rb').read(), 'application/script'))]
+                 File handles and paths (pathlib.Path) are read as the request is sent.
         description -- File description. String.
         name -- File name (if different than actual file name). String.
         comments_for_audit_log -- Audit log comment. String.
@@ -398,6 +399,7 @@ class RealTimeResponseAdmin(ServiceClass):
                 }
         files -- File to be uploaded. List of tuples. *REQUIRED*
                  Ex: [('file', ('file.ext', open('file.ext','rb').read(), 'application/script'))]
+                 File handles and paths (pathlib.Path) are read as the request is sent.
         description -- File description. String.
         name -- File name (if different than actual file name). String.
         comments_for_audit_log -- Audit log comment. String.
@@ -498,6 +500,7 @@ class RealTimeResponseAdmin(ServiceClass):
                 }
         files -- File to be uploaded. List of tuples. *REQUIRED*
                  Ex: [('file', ('file.ext', open('file.ext','rb').read(), 'application/script'))]
+                 File handles and paths (pathlib.Path) are read as the request is sent.
         description -- File description. String.
         name -- File name (if different than actual file name). String.
         comments_for_audit_log -- Audit log comment. String.
@@ -576,6 +579,7 @@ class RealTimeResponseAdmin(ServiceClass):
                 }
         files -- File to be uploaded. List of tuples. *REQUIRED*
                  Ex: [('file', ('file.ext', open('file.ext','rb').read(), 'application/script'))]
+                 File handles and paths (pathlib.Path) are read as the request is sent.
         description -- File description. String.
         name -- File name (if different than actual file name). String.
         comments_for_audit_log -- Audit log comment. String.
@@ -629,6 +633,7 @@ class RealTimeResponseAdmin(ServiceClass):
                 }
         files -- File to be uploaded. List of tuples. *REQUIRED*
                  Ex: [('file', ('file.ext', open('file.ext','rb').read(), 'application/script'))]
+                 File handles and paths (pathlib.Path) are read as the request is sent.
         description -- File description. String.
         id -- Script ID to be updated. String.
         name -- File name (if different than actual file name). String.
@@ -683,6 +688,7 @@ class RealTimeResponseAdmin(ServiceClass):
                 }
         files -- File to be uploaded. List of tuples. *REQUIRED*
                  Ex: [('file', ('file.ext', open('file.ext','rb').read(), 'application/script'))]
+                 File handles and paths (pathlib.Path) are read as the request is sent.
         description -- File description. String.
         id -- Script ID to be updated. String.
         name -- File name (if different than actual file name). String.
@@ -214,6 +214,7 @@ class SampleUploads(ServiceClass):
         Keyword arguments:
         comment -- A descriptive comment to identify the file for other users. String.
         file_data -- Content of the uploaded archive in binary format.
+                     Open binary file handles and paths (pathlib.Path) are read as the request is sent.
                      'archive' and 'file' are also accepted as this parameter.
         name -- Name of the archive. String. Required.
         file_type -- Archive file format. String. "zip", "7zip". Defaults to "zip".
@@ -430,6 +431,7 @@ class SampleUploads(ServiceClass):
         Keyword arguments:
         comment -- A descriptive comment to identify the file for other users. String.
         file_data -- Content of the uploaded sample in binary format. Max file size is 256 MB.
+                     Open binary file handles and paths (pathlib.Path) are read as the request is sent.
                      'sample' and 'upfile' are also accepted as this parameter.
 
                      Accepted File Formats:
@@ -38,9 +38,10 @@ For more information, please refer to <https://unlicense.org>
 import os
 from typing import Dict, Union
 from requests import Response
-from ._util import generate_ok_result, force_default
+from ._util import generate_ok_result, generate_error_result, force_default
 from ._util import handle_single_argument, process_service_request
 from ._result import Result
+from ._error import APIError
 from ._service_class import ServiceClass
 from ._endpoint._sensor_download import _sensor_download_endpoints as Endpoints
 
@@ -153,21 +154,32 @@ class SensorDownload(ServiceClass):
         Swagger URL
         https://assets.falcon.crowdstrike.com/support/api/swagger.html#/sensor-download/DownloadSensorInstallerById
         """
-        returned = process_service_request(
-                        calling_object=self,
-                        endpoints=Endpoints,
-                        operation_id="DownloadSensorInstallerById",
-                        keywords=kwargs,
-                        params=handle_single_argument(args, parameters, "ids"),
-                        stream=kwargs.get("stream", False)
-                        )
-        if file_name and download_path and isinstance(returned, bytes):
-            os.makedirs(download_path, exist_ok=True)
-            # write the newly downloaded sensor into the
-            # aforementioned directory with provided file name
-            with open(os.path.join(download_path, file_name), "wb") as sensor:
-                sensor.write(returned)
-            returned = generate_ok_result(message="Download successful")
+        if file_name and download_path and not kwargs.get("stream", False):
+            # Write the installer into the aforementioned directory with the provided
+            # file name as it is received, the installer is never held in memory.
+            download = self.download_file(self.download_sensor_installer,
+                                          os.path.join(download_path, file_name),
+                                          parameters=handle_single_argument(args, parameters, "ids"),
+                                          **kwargs
+                                          )
+            if download.ok:
+                returned = generate_ok_result(message="Download successful")
+            elif kwargs.get("pythonic", self.pythonic):
+                raise APIError(code=download.status_code if download.status_code >= 400 else 500,
+                               message=download.error,
+                               headers=download.headers
+                               )
+            else:
+                returned = download.result if download.result else generate_error_result(message=download.error, caller=self)
+        else:
+            returned = process_service_request(
+                            calling_object=self,
+                            endpoints=Endpoints,
+                            operation_id="DownloadSensorInstallerById",
+                            keywords=kwargs,
+                            params=handle_single_argument(args, parameters, "ids"),
+                            stream=kwargs.get("stream", False)
+                            )
 
         return returned
 
@@ -200,21 +212,32 @@ class SensorDownload(ServiceClass):
         Swagger URL
         https://assets.falcon.crowdstrike.com/support/api/swagger.html#/sensor-download/DownloadSensorInstallerByIdV2
         """
-        returned = process_service_request(
-                        calling_object=self,
-                        endpoints=Endpoints,
-                        operation_id="DownloadSensorInstallerByIdV2",
-                        keywords=kwargs,
-                        params=handle_single_argument(args, parameters, "ids"),
-                        stream=kwargs.get("stream", False)
-                        )
-        if file_name and download_path and isinstance(returned, bytes):
-            os.makedirs(download_path, exist_ok=True)
-            # write the newly downloaded sensor into the
-            # aforementioned directory with provided file name
-            with open(os.path.join(download_path, file_name), "wb") as sensor:
-                sensor.write(returned)
-            returned = generate_ok_result(message="Download successful")
+        if file_name and download_path and not kwargs.get("stream", False):
+            # Write the installer into the aforementioned directory with the provided
+            # file name as it is received, the installer is never held in memory.
+            download = self.download_file(self.download_sensor_installer_v2,
+                                          os.path.join(download_path, file_name),
+                                          parameters=handle_single_argument(args, parameters, "ids"),
+                                          **kwargs
+                                          )
+            if download.ok:
+                returned = generate_ok_result(message="Download successful")
+            elif kwargs.get("pythonic", self.pythonic):
+                raise APIError(code=download.status_code if download.status_code >= 400 else 500,
+                               message=download.error,
+                               headers=download.headers
+                               )
+            else:
+                returned = download.result if download.result else generate_error_result(message=download.error, caller=self)
+        else:
+            returned = process_service_request(
+                            calling_object=self,
+                            endpoints=Endpoints,
+                            operation_id="DownloadSensorInstallerByIdV2",
+                            keywords=kwargs,
+                            params=handle_single_argument(args, parameters, "ids"),
+                            stream=kwargs.get("stream", False)
+                            )
 
         return returned
 
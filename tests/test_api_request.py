@@ -1,10 +1,13 @@
 """
 test_api_request.py -  This class tests the APIRequest class
 """
+import io
+import json
 import os
 import sys
 import logging
 import pytest
+import requests
 
 # Authentication via the test_authorization.py
 from tests import test_authorization as Authorization
@@ -17,9 +20,12 @@ from falconpy import (
     APIError,
     RequestValidator,
     FalconInterface,
-    InterfaceConfiguration
+    InterfaceConfiguration,
+    JSONCodec
     )
 from falconpy._result._base_dictionary import UnsupportedPythonVersion
+from falconpy._util import MultipartEncoder
+from falconpy._util._response import calc_content_return
 from falconpy._util._functions import (
     log_api_activity,
     log_api_payloads,
@@ -241,3 +247,51 @@ class TestPerformRequestLogCoverage:
         )
         logger.removeHandler(handler)
         assert result is not None
+
+    def test_json_codec(self):
+        """Confirm every installed JSON library decodes from bytes and encodes to bytes."""
+        payload = {"resources": ["a", "é"], "meta": {"query_time": 0.5, "pagination": None}, "errors": []}
+        for name in ["orjson", "ujson", "simplejson", "json"]:
+            try:
+                codec = JSONCodec(name)
+            except ImportError:
+                continue
+            encoded = codec.dumps(payload)
+            assert isinstance(encoded, bytes)
+            assert codec.loads(encoded) == payload
+            with pytest.raises(json.JSONDecodeError):
+                codec.loads(b"not json")
+        with pytest.raises(ValueError):
+            JSONCodec("not_a_library")
+
+    def test_json_body_not_utf8(self):
+        """Confirm bodies that are not UTF-8 are decoded using the character set detected by requests."""
+        for content, content_type in [('{"resources": ["café"]}'.encode("latin-1"), "application/json; charset=latin-1"),
+                                      ('{"resources": ["café"]}'.encode("utf-16"), "application/json")
+                                      ]:
+            response = requests.Response()
+            response.status_code = 200
+            response.headers["Content-Type"] = content_type
+            response._content = content
+            for method in ["GET", "HEAD"]:
+                returned, _ = calc_content_return(response, False, False, None, False, method)
+                assert returned["body"]["resources"] == ["café"]
+
+    def test_multipart_encoder(self, tmp_path):
+        """Confirm streamed multipart bodies match the bodies built in memory by requests."""
+        upload = tmp_path / "sample.bin"
+        upload.write_bytes(os.urandom(300000))
+        data = {"file_name": "sample.bin", "comment": "Streamed", "is_confidential": True}
+        expected = requests.Request("POST", "https://localhost", data=data,
+                                    files=[("sample", ("sample.bin", upload.read_bytes(), "application/octet-stream"))]
+                                    ).prepare()
+        boundary = expected.headers["Content-Type"].split("boundary=")[1]
+        for content in [upload, io.BytesIO(upload.read_bytes())]:
+            encoder = MultipartEncoder([("sample", ("sample.bin", content, "application/octet-stream"))],
+                                       data, boundary=boundary, chunk_size=65536
+                                       )
+            assert encoder.len == len(expected.body)
+            assert encoder.content_type == expected.headers["Content-Type"]
+            assert b"".join(encoder) == expected.body
+            encoder.rewind()
+            assert encoder.read() == expected.body
@@ -0,0 +1,78 @@
+# test_async.py
+# This class tests the asynchronous request path using a mocked transport
+
+import asyncio
+import json
+import os
+import sys
+import time
+import pytest
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import APIHarnessV2, Hosts
+from falconpy._auth_object import ConnectionPool
+
+httpx = pytest.importorskip("httpx")
+
+
+def mocked_client(handler):
+    """Return a replacement for ConnectionPool._create_async_client using the provided handler."""
+    def create(self, proxy, verify):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return create
+
+
+async def echo_ids(request):
+    """Return a resource for each ID requested, after a short delay."""
+    await asyncio.sleep(0.2)
+    ids = request.url.params.get_list("ids")
+    if not ids and request.content:
+        ids = json.loads(request.content).get("ids", [])
+    body = {"meta": {"query_time": 0.01}, "resources": [{"id": item} for item in ids], "errors": []}
+    return httpx.Response(200, json=body, headers={"X-CS-TraceID": "abc"})
+
+
+class TestAsync:
+    def test_acommand_native_transport(self, monkeypatch):
+        monkeypatch.setattr(ConnectionPool, "_create_async_client", mocked_client(echo_ids))
+        falcon = APIHarnessV2(access_token="not-a-real-token", max_workers=2)
+
+        async def fan_out():
+            return await asyncio.gather(*[falcon.acommand("GetDeviceDetailsV2", ids=[str(item)]) for item in range(50)])
+
+        start = time.monotonic()
+        results = asyncio.run(fan_out())
+        # Fifty delayed requests with two workers would take at least five seconds.
+        assert time.monotonic() - start < 2
+        assert [result["body"]["resources"][0]["id"] for result in results] == [str(item) for item in range(50)]
+        # Header case is preserved, as it is by requests.
+        assert results[0]["headers"]["X-CS-TraceID"] == "abc"
+        # No worker threads are required.
+        assert falcon.connection_pool._executor is None
+
+    def test_service_class_command_chunks(self, monkeypatch):
+        monkeypatch.setattr(ConnectionPool, "_create_async_client", mocked_client(echo_ids))
+        hosts = Hosts(access_token="not-a-real-token", pythonic=True)
+        result = asyncio.run(hosts.aio.command("GetDeviceDetailsV2", ids=[str(item) for item in range(250)]))
+        assert result.status_code == 200
+        assert len(result.data) == 250
+
+    def test_connection_errors_raised_as_requests_errors(self, monkeypatch):
+        def refused(request):
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        monkeypatch.setattr(ConnectionPool, "_create_async_client", mocked_client(refused))
+        falcon = APIHarnessV2(access_token="not-a-real-token")
+        result = asyncio.run(falcon.acommand("GetDeviceDetailsV2", ids=["1"]))
+        assert result["status_code"] == 500
+        assert "Connection refused" in result["body"]["errors"][0]["message"]
+
+    def test_worker_fallback_without_httpx(self, monkeypatch):
+        monkeypatch.setattr(ConnectionPool, "get_async_client", lambda *args, **kwargs: None)
+        falcon = APIHarnessV2(access_token="not-a-real-token", base_url="http://127.0.0.1:9")
+        result = asyncio.run(falcon.acommand("GetDeviceDetailsV2", ids=["1"]))
+        # The request was performed by a worker thread using requests.
+        assert result["status_code"] == 500
+        assert falcon.connection_pool._executor is not None
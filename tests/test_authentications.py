@@ -6,6 +6,8 @@ import sys
 import pytest
 import warnings
 import importlib
+import threading
+import time
 import unittest.mock as mock
 # Authentication via the test_authorization.py
 from tests import test_authorization as Authorization
@@ -20,6 +22,8 @@ from falconpy import (
     version,
     InvalidCredentialFormat,
     Hosts,
+    TokenRefresher,
+    TOKEN_REGISTRY,
     )
 from falconpy._util import confirm_base_region, confirm_base_url
 from falconpy import (
@@ -467,9 +471,9 @@ class TestUtilFunctionsCoverage:
         assert result["status_code"] in [200, 400, 401, 403, 429]
 
     def test_simplejson_fallback_functions(self):
-        """Cover the simplejson import fallback in _functions.py."""
+        """Cover the simplejson import fallback in _response.py."""
         with mock.patch.dict(sys.modules, {"simplejson": None}):
-            mod = importlib.import_module("falconpy._util._functions")
+            mod = importlib.import_module("falconpy._util._response")
             importlib.reload(mod)
             assert mod.SimplejsonJSONDecodeError is None
 
@@ -586,6 +590,7 @@ class TestFalconInterfaceCoverage:
                 return {"access_token": "child_token", "expires_in": 1799}
 
         monkeypatch.setattr(_funcs.requests, "request", lambda *a, **kw: _FakeResp())
+        monkeypatch.setattr(_funcs.requests.Session, "request", lambda *a, **kw: _FakeResp())
         oauth = OAuth2(
             client_id="fake_id",
             client_secret="fake_secret"
@@ -635,3 +640,69 @@ class TestFalconInterfaceCoverage:
         result = oauth.logout()
         assert isinstance(result, dict)
         assert result.get("status_code") is not None
+
+    def test_single_flight_token_refresh(self):
+        """Confirm concurrent requests for a stale token perform a single login and share the result."""
+        oauth = OAuth2(client_id="single", client_secret="flight", debug=_DEBUG)
+        calls = []
+
+        def token_request(**kwargs):
+            calls.append(kwargs["endpoint"])
+            time.sleep(0.1)
+            return {"status_code": 201, "headers": {}, "body": {"access_token": f"token{len(calls)}", "expires_in": 1799}}
+
+        barrier = threading.Barrier(8)
+        headers = []
+
+        def worker():
+            barrier.wait()
+            headers.append(oauth.auth_headers["Authorization"])
+
+        with mock.patch("falconpy._auth_object._falcon_interface.perform_request", side_effect=token_request):
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert len(calls) == 1
+        assert headers == ["Bearer token1"] * 8
+
+    def test_background_token_refresh(self):
+        """Confirm the background refresher renews tokens ahead of the renew window."""
+        oauth = OAuth2(client_id="background", client_secret="refresh", debug=_DEBUG, background_refresh=True)
+        refresher = oauth.token_refresher
+        assert isinstance(refresher, TokenRefresher) and refresher.running
+        assert refresher.next_refresh(oauth) is None
+        with mock.patch("falconpy._auth_object._falcon_interface.perform_request",
+                        return_value={"status_code": 201, "headers": {},
+                                      "body": {"access_token": "renewed", "expires_in": 1799}}
+                        ):
+            oauth.login()
+            assert 0 < refresher.next_refresh(oauth) <= 1799 - oauth.renew_window - refresher.lead
+        refresher.stop()
+        refresher._thread.join(1)
+        assert not refresher.running
+        assert OAuth2(client_id="background", client_secret="refresh").token_refresher is None
+
+    def test_shared_token_registry(self):
+        """Confirm objects created with the same credentials can share one lazily generated token."""
+        token_result = {"status_code": 201, "headers": {}, "body": {"access_token": "shared", "expires_in": 1799}}
+        revoke_result = {"status_code": 200, "headers": {}, "body": {"errors": [], "resources": []}}
+        with mock.patch("falconpy._auth_object._falcon_interface.perform_request",
+                        side_effect=[token_result, revoke_result]
+                        ) as token_request:
+            first = Hosts(client_id="shared", client_secret="registry", debug=_DEBUG, shared_token=True)
+            second = Hosts(client_id="shared", client_secret="registry", debug=_DEBUG, shared_token=True)
+            # Service Classes sharing a token do not login when they are created.
+            assert token_request.call_count == 0 and not first.token_status
+            entry = TOKEN_REGISTRY.get(first.auth_object.token_entry.key)
+            assert entry is second.auth_object.token_entry and entry.references == 2
+            assert first.headers == second.headers == {"Authorization": "Bearer shared"}
+            assert Hosts(client_id="shared", client_secret="other",
+                         shared_token=True).auth_object.token_entry is not entry
+            assert not OAuth2(client_id="shared", client_secret="registry").token_entry.shared
+            # The token is only revoked by the last object to logout.
+            assert first.logout()["status_code"] == 200 and token_request.call_count == 1
+            assert second.logout()["status_code"] == 200 and token_request.call_count == 2
+        assert TOKEN_REGISTRY.get(entry.key) is None
+
@@ -0,0 +1,47 @@
+# test_bulk.py
+# This class tests the bulk host actions of the Hosts Service Class using mocked methods
+
+import os
+import sys
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Hosts
+
+
+def action_result(resources):
+    """Return a host action response containing the provided resources."""
+    return {"status_code": 200, "headers": {}, "body": {"resources": resources, "errors": []}}
+
+
+class TestHostsBulk:
+    def test_perform_action_bulk(self):
+        falcon = Hosts(access_token="not-a-real-token")
+        batches = []
+
+        def perform_action(action_name=None, ids=None, **kwargs):
+            batches.append(len(ids))
+            # Hosts already in the requested state are not updated, this is not a failure.
+            return action_result([{"id": item, "path": "", "updated": False} for item in ids])
+
+        falcon.perform_action = perform_action
+        result = falcon.perform_action_bulk("unhide_host", [str(item) for item in range(250)], max_workers=1)
+        assert len(result.succeeded) == 250 and not result.failed
+        # The batch size defaults to the maxItems limit of the operation.
+        assert sorted(batches) == [50, 100, 100]
+
+    def test_update_device_tags_bulk(self):
+        falcon = Hosts(access_token="not-a-real-token")
+        calls = []
+
+        def update_device_tags(action_name=None, ids=None, tags=None):
+            calls.append(list(ids))
+            return action_result([{"device_id": item, "code": 500 if item == "1" and len(calls) == 1 else 200,
+                                   "error": "Internal error" if item == "1" and len(calls) == 1 else None,
+                                   "updated": False} for item in ids])
+
+        falcon.update_device_tags = update_device_tags
+        result = falcon.update_device_tags_bulk("add", ["1", "2", "3"], "FalconGroupingTags/Testing", max_workers=1)
+        assert len(result.succeeded) == 3 and not result.failed and result.retries == 1
+        assert calls == [["1", "2", "3"], ["1"]]
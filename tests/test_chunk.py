@@ -0,0 +1,92 @@
+# test_chunk.py
+# This class tests splitting oversized ID lists into chunks using mocked responses
+
+import os
+import sys
+import pytest
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import APIHarnessV2, Result
+from falconpy._endpoint import api_operations
+from falconpy._error import APIError
+from falconpy._util import ids_chunk_size, chunk_requests, merge_chunk_results, chunked_request
+
+
+def response(status_code, ids, errors=None):
+    """Return a result in the format returned for a single chunk."""
+    return {"status_code": status_code,
+            "headers": {"X-CS-TraceID": str(status_code)},
+            "body": {"meta": {"query_time": 0.5}, "resources": [{"id": item} for item in ids], "errors": errors or []}
+            }
+
+
+def lookup(ids=None, **kwargs):
+    """Mock a device lookup that rejects chunks containing the ID 'bad'."""
+    requested = (kwargs.get("params") or {}).get("ids", ids) or []
+    if "bad" in requested:
+        return response(400, [], [{"code": 400, "message": "bad id"}])
+    return response(200, requested)
+
+
+def pythonic_lookup(**kwargs):
+    """Mock a pythonic device lookup, which raises on failure."""
+    returned = lookup(**kwargs)
+    if returned["status_code"] >= 400:
+        raise APIError(code=returned["status_code"], message="bad id", headers=returned["headers"])
+    return Result(full=returned)
+
+
+class TestChunk:
+    def test_read_operations_only(self):
+        assert ids_chunk_size(api_operations["GetDeviceDetailsV2"]) == 100
+        # POST lookups documenting their limit are listed within IDS_MAX_ITEMS.
+        assert ids_chunk_size(api_operations["PostDeviceDetailsV2"]) == 5000
+        # Delete (and write) operations are never split.
+        delete = api_operations["entities_policy_delete_v2"]
+        assert delete.parameters["ids"].max_items == 100 and ids_chunk_size(delete) is None
+        assert chunk_requests({"params": {"ids": [str(item) for item in range(250)]}}, delete) is None
+        # Operations without a documented limit are not split.
+        assert ids_chunk_size(api_operations["GetDeviceDetailsV1"]) is None
+
+    def test_chunk_requests(self):
+        ids = [str(item) for item in range(250)] + ["0"]
+        chunks = chunk_requests({"params": {"ids": ids}}, api_operations["GetDeviceDetailsV2"])
+        assert [len(chunk["params"]["ids"]) for chunk in chunks] == [100, 100, 50]
+        chunks = chunk_requests({"body": {"ids": ids * 30}}, api_operations["PostDeviceDetailsV2"])
+        assert chunks is None
+        assert chunk_requests({"params": {"ids": ids[:100]}}, api_operations["GetDeviceDetailsV2"]) is None
+
+    def test_partial_failure(self):
+        ids = [str(item) for item in range(250)]
+        ids[150] = "bad"
+        keywords = {"params": {"ids": ids}}
+        merged = chunked_request(lookup, keywords, api_operations["GetDeviceDetailsV2"])
+        # The successful chunks decide the status, failures are listed within errors.
+        assert merged["status_code"] == 200
+        assert len(merged["body"]["resources"]) == 150
+        assert merged["body"]["errors"] == [{"code": 400, "message": "bad id"}]
+        assert merged["body"]["meta"]["query_time"] == 1.5
+        assert merged["headers"]["X-CS-TraceID"] == "200"
+        merged = chunked_request(pythonic_lookup, keywords, api_operations["GetDeviceDetailsV2"])
+        assert isinstance(merged, Result) and merged.status_code == 200 and len(merged.data) == 150
+        assert merged.errors[0]["code"] == 400
+
+    def test_complete_failure(self):
+        results = [response(400, [], [{"code": 400, "message": "bad id"}]),
+                   response(404, [], [{"code": 404, "message": "missing"}])
+                   ]
+        merged = merge_chunk_results(results)
+        assert merged["status_code"] == 404 and len(merged["body"]["errors"]) == 2
+        with pytest.raises(APIError):
+            merge_chunk_results([APIError(code=400, message="bad id"), APIError(code=404, message="missing")])
+
+    def test_executor_created_when_split(self, monkeypatch):
+        monkeypatch.setattr("falconpy.api_complete._advanced.perform_request", lookup)
+        falcon = APIHarnessV2(access_token="not-a-real-token")
+        assert falcon.command("GetDeviceDetailsV2", ids=["1", "2"])["status_code"] == 200
+        assert falcon.connection_pool._executor is None
+        result = falcon.command("GetDeviceDetailsV2", ids=[str(item) for item in range(150)])
+        assert len(result["body"]["resources"]) == 150
+        assert falcon.connection_pool._executor is not None
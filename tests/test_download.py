@@ -0,0 +1,105 @@
+# test_download.py
+# This class tests streaming file downloads using mocked responses
+
+import io
+import os
+import sys
+import pytest
+from requests import Response
+from requests.exceptions import ConnectionError as RequestConnectionError
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import FileDownloader
+
+CONTENT = os.urandom(5000)
+
+
+class Interrupted(io.BytesIO):
+    """Body that drops the connection after the provided number of bytes."""
+
+    def __init__(self, content: bytes, after: int):
+        super().__init__(content)
+        self.after = after
+
+    def read(self, size=-1):
+        if self.tell() >= self.after:
+            raise RequestConnectionError("Connection reset")
+        return super().read(min(size, self.after - self.tell()))
+
+
+class Pipe(io.RawIOBase):
+    """Destination that cannot be rewound."""
+
+    def __init__(self):
+        super().__init__()
+        self.received = b""
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.received += bytes(data)
+        return len(data)
+
+
+def served(headers, interrupt_after=None):
+    """Return a response for the requested range of CONTENT."""
+    first = int(headers["Range"][6:-1]) if "Range" in headers else 0
+    response = Response()
+    response.status_code = 206 if first else 200
+    response.headers["Accept-Ranges"] = "bytes"
+    response.headers["Content-Length"] = str(len(CONTENT) - first)
+    if first:
+        response.headers["Content-Range"] = f"bytes {first}-{len(CONTENT) - 1}/{len(CONTENT)}"
+    body = CONTENT[first:]
+    response.raw = Interrupted(body, interrupt_after) if interrupt_after else io.BytesIO(body)
+    return response
+
+
+class TestFileDownloader:
+    def test_not_seekable(self):
+        destination = Pipe()
+        result = FileDownloader(served, chunk_size=512).download(destination)
+        assert result.ok and result.attempts == 1 and destination.received == CONTENT
+
+    def test_resumed(self):
+        calls = []
+
+        def request(headers):
+            calls.append(headers)
+            return served(headers, interrupt_after=2000 if len(calls) == 1 else None)
+
+        destination = io.BytesIO()
+        result = FileDownloader(request, chunk_size=512).download(destination)
+        assert result.ok and result.resumed == 1 and destination.getvalue() == CONTENT
+        assert calls[1] == {"Range": "bytes=2000-"}
+
+    @pytest.mark.parametrize("pythonic", [False, True])
+    def test_failed_reconnect(self, pythonic):
+        calls = []
+
+        def request(headers):
+            calls.append(headers)
+            if len(calls) == 2:
+                if pythonic:
+                    raise RequestConnectionError("Connection refused")
+                return {"status_code": 500, "headers": {}, "body": {"errors": [{"message": "refused"}]}}
+            return served(headers, interrupt_after=2000 if len(calls) == 1 else None)
+
+        destination = io.BytesIO()
+        result = FileDownloader(request, chunk_size=512, pythonic=pythonic).download(destination)
+        # The failed reconnect counts as an interrupted attempt and the transfer is resumed.
+        assert result.ok and result.attempts == 3 and result.result is None and destination.getvalue() == CONTENT
+
+    def test_first_request_failed(self):
+        failed = {"status_code": 500, "headers": {}, "body": {"errors": [{"message": "refused"}]}}
+        result = FileDownloader(lambda headers: failed).download(io.BytesIO())
+        assert not result.ok and result.attempts == 1 and result.result is failed
+
+        def refused(headers):
+            raise RequestConnectionError("Connection refused")
+
+        with pytest.raises(RequestConnectionError):
+            FileDownloader(refused, pythonic=True).download(io.BytesIO())
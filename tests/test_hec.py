@@ -18,7 +18,8 @@ from falconpy import (
     IngestFormat,
     IngestConfig,
     IngestPayload,
-    SessionManager
+    SessionManager,
+    RetryPolicy
     )
 from datetime import datetime, timezone
 from requests import Session
@@ -136,6 +137,13 @@ class TestHTTPEventCollector:
             error_check += 1
         assert error_check > 2
 
+    def test_retry_policy(self):
+        retry_hec = HTTPEventCollector(api_key=random_string(8), api_url_key="127", retry_count=2)
+        assert retry_hec.retry_policy.max_attempts == 2 and retry_hec.retry_policy.unsafe
+        retry_hec.ingest_base_url = "0.0.1:1"
+        retry_hec.retry_policy = RetryPolicy(backoff_factor=0.01, unsafe=True, errors=retry_hec.retry_policy.errors)
+        assert retry_hec.send_event(simple_payload) == 500
+
     def test_subclasses(self):
         config = IngestConfig(ingest_key=random_string(8), ingest_url_key=random_string(10), ingest_format="banana", ingest_timeout=0)
         config.ingest_base_url = "us1"
@@ -19,6 +19,13 @@ from falconpy import (
     InvalidRoute,
     InvalidServiceCollection
     )
+from falconpy._endpoint import (
+    api_endpoints,
+    api_operations,
+    get_operation,
+    operation_registry
+    )
+from falconpy._endpoint._hosts import _hosts_endpoints
 
 auth = Authorization.TestAuthorization()
 config = auth.getConfigObject()
@@ -65,3 +72,30 @@ class TestHelper:
             error_checks = True
 
         assert error_checks
+
+    def test_operation_registry(self):
+        registry = operation_registry(_hosts_endpoints)
+        operation = registry["QueryDevicesByFilter"]
+        assert operation.method == "GET" and operation.route == "/devices/queries/devices/v1"
+        assert operation.parameters["limit"].type == "integer"
+        assert "UnknownOperation" not in registry
+        assert operation_registry(_hosts_endpoints) is registry
+        # The first occurrence of a duplicated operation ID is retained
+        first = [ep for ep in api_endpoints if ep[0] == "GetCSPMAzureAccount"][0]
+        assert get_operation(api_endpoints, "GetCSPMAzureAccount").endpoint is first
+        assert api_operations["GetCSPMAzureAccount"].endpoint is first
+        assert operation_registry(api_operations) is api_operations
+
+    def test_operation_registry_changes(self):
+        assert api_operations is operation_registry(api_endpoints)
+        assert len(api_operations.records) == len(api_endpoints)
+        # Identical parameter definitions share a record
+        assert api_operations["QueryDevicesByFilter"].parameters["limit"] is operation_registry(
+            _hosts_endpoints)["QueryDevicesByFilter"].parameters["limit"]
+        # Replacing a definition in place creates a new index
+        endpoints = list(_hosts_endpoints)
+        registry = operation_registry(endpoints)
+        position = [ep[0] for ep in endpoints].index("QueryDevicesByFilter")
+        endpoints[position] = [*endpoints[position][:5], [{"name": "custom", "type": "string", "in": "query"}]]
+        assert "custom" in operation_registry(endpoints)["QueryDevicesByFilter"].parameters
+        assert operation_registry(endpoints) is not registry
@@ -206,6 +206,35 @@ class TestHosts:
             falcon.GetDeviceDetails(found_id)["status_code"] in AllowedResponses
         ) is True
 
+    def test_get_device_details_chunked(self):
+        """Tests ID lists larger than the operation maxItems are split and merged into one result."""
+        id_lookup = falcon.QueryDevicesByFilter(parameters={"limit": 5})
+        found_ids = ["1234567890"]
+        if id_lookup["status_code"] != 429:
+            if id_lookup["body"]["resources"]:
+                found_ids = id_lookup["body"]["resources"]
+        padding = [f"{pos:032x}" for pos in range(150)]
+        result = falcon.get_device_details_v2(ids=found_ids + padding + found_ids)
+        assert result["status_code"] in AllowedResponses
+        found = [device["device_id"] for device in result["body"]["resources"]]
+        assert len(found) == len(set(found)) and set(found) <= set(found_ids)
+
+    def test_inventory(self):
+        """Tests streaming host details while scrolling for host IDs."""
+        inventory = falcon.inventory(batch_size=2, max_workers=2, max_pages=2, sort="hostname.asc")
+        for device in inventory:
+            assert "device_id" in device
+        assert inventory.count + inventory.failed <= 4 and inventory.batches <= 2
+
+    def test_perform_action_bulk(self):
+        """Tests sharding a host action across concurrent requests."""
+        progress = []
+        result = falcon.perform_action_bulk("unhide_host", ["1234567890", "0987654321", "1234567890"],
+                                            batch_size=1, max_workers=2,
+                                            progress=lambda outcome: progress.append(outcome.processed)
+                                            )
+        assert result.processed == 2 and result.requests >= 2 and progress[-1] == 2
+
     def test_get_device_login_history(self):
         """Pytest harness hook"""
         id_lookup = falcon.QueryDevicesByFilter(parameters={"limit": 1})
@@ -0,0 +1,56 @@
+# test_import.py
+# This class tests the cost of importing the SDK
+
+import json
+import os
+import subprocess
+import sys
+import pytest
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+import falconpy
+
+# Measure the import within a fresh interpreter so previously loaded modules are not counted.
+_MEASURE = """
+import json, sys, time, tracemalloc
+sys.path.insert(0, "src")
+tracemalloc.start()
+start = time.perf_counter()
+import falconpy
+elapsed = time.perf_counter() - start
+peak = tracemalloc.get_traced_memory()[1]
+loaded = sorted(mod for mod in sys.modules if mod.startswith("falconpy._endpoint."))
+from falconpy import Hosts
+hosts_loaded = sorted(mod for mod in sys.modules if mod.startswith("falconpy._endpoint."))
+print(json.dumps({"elapsed": elapsed, "peak": peak, "loaded": loaded, "hosts_loaded": hosts_loaded}))
+"""
+# Generous bounds, the complete SDK (every Service Class and endpoint module) exceeds both.
+MAX_IMPORT_SECONDS = 1.5
+MAX_IMPORT_BYTES = 16 * 1024 * 1024
+
+
+def measure_import() -> dict:
+    result = subprocess.run([sys.executable, "-c", _MEASURE], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+class TestImport:
+    def test_import_time_and_memory(self):
+        measured = measure_import()
+        assert measured["elapsed"] < MAX_IMPORT_SECONDS
+        assert measured["peak"] < MAX_IMPORT_BYTES
+
+    def test_endpoints_loaded_on_demand(self):
+        measured = measure_import()
+        assert "falconpy._endpoint._hosts" not in measured["loaded"]
+        assert "falconpy._endpoint._hosts" in measured["hosts_loaded"]
+        assert "falconpy._endpoint._alerts" not in measured["hosts_loaded"]
+
+    def test_lazy_public_names(self):
+        assert falconpy.Hosts.__name__ == "Hosts"
+        assert all(hasattr(falconpy, name) for name in falconpy.__all__)
+        assert "Hosts" in dir(falconpy)
+        with pytest.raises(AttributeError):
+            _ = falconpy.NotAServiceClass
@@ -83,3 +83,13 @@ class TestIOC:
 
     def test_all_functionality(self):
         assert self.ioc_run_all_tests() is True
+
+    def test_bulk_indicators(self):
+        progress = []
+        invalid = ({"type": "not_a_type", "value": f"unit-test-{pos}", "action": "detect"} for pos in range(3))
+        result = falcon.indicator_create_bulk(invalid, batch_size=2, comment="Unit testing",
+                                              progress=lambda summary: progress.append(summary.processed)
+                                              )
+        assert result.processed == 3 and not result.succeeded and len(progress) == result.requests
+        result = falcon.indicator_delete_bulk(["12345678", "12345678"], batch_size=1, max_attempts=1)
+        assert result.processed == 1 and result.requests == 2
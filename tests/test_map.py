@@ -0,0 +1,82 @@
+# test_map.py
+# This class tests calling Service Class methods concurrently with map and imap using mocked methods
+
+import os
+import sys
+import threading
+import time
+import pytest
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Hosts
+from falconpy._error import APIError
+
+
+class Lookup:
+    """Mock a lookup method, tracking the calls made and the peak number in flight."""
+
+    def __init__(self, delays=None):
+        self.calls = []
+        self.delays = delays or {}
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, ids=None, **kwargs):
+        with self.lock:
+            self.calls.append(ids)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delays.get(ids, 0.02))
+            if ids == "bad":
+                raise APIError(code=400, message="bad id")
+            return {"status_code": 200, "headers": {}, "body": {"resources": [ids], "parameters": kwargs}}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+falcon = Hosts(access_token="not-a-real-token")
+
+
+class TestMap:
+    def test_map(self):
+        lookup = Lookup()
+        falcon.get_device_details = lookup
+        results = falcon.map("get_device_details", ["1", {"ids": "2", "fields": "hostname"}, "3"])
+        # Results are returned in the order provided, dictionaries are provided as keywords.
+        assert [result["body"]["resources"][0] for result in results] == ["1", "2", "3"]
+        assert results[1]["body"]["parameters"] == {"fields": "hostname"}
+        assert sorted(lookup.calls) == ["1", "2", "3"]
+
+    def test_max_workers(self):
+        lookup = Lookup()
+        results = falcon.map(lookup, [str(item) for item in range(8)], max_workers=2)
+        assert len(results) == 8
+        # Only max_workers calls are in flight at the same time.
+        assert lookup.peak == 2
+
+    def test_unordered(self):
+        lookup = Lookup(delays={"slow": 0.3})
+        results = [result["body"]["resources"][0] for result in falcon.imap(lookup, ["slow", "1", "2"], ordered=False)]
+        assert sorted(results) == ["1", "2", "slow"]
+        assert results[-1] == "slow"
+
+    def test_errors_raised_in_order(self):
+        lookup = Lookup()
+        results = falcon.imap(lookup, ["1", "bad", "3"], max_workers=1)
+        assert next(results)["status_code"] == 200
+        with pytest.raises(APIError):
+            next(results)
+
+    def test_consumed_lazily(self):
+        lookup = Lookup()
+        results = falcon.imap(lookup, (str(item) for item in range(100)), max_workers=2)
+        next(results)
+        results.close()
+        time.sleep(0.1)
+        # Items are read as calls are made, abandoned calls are cancelled.
+        assert len(lookup.calls) <= 3
@@ -0,0 +1,172 @@
+# test_paginator.py
+# This class tests the Paginator and ParallelPaginator using mocked pages
+
+import os
+import sys
+import threading
+import time
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Hosts, Paginator, ParallelPaginator
+from falconpy._endpoint import operation_registry
+from falconpy._endpoint._hosts import _hosts_endpoints
+from falconpy._error import APIError
+
+RECORDS = [f"id-{item}" for item in range(23)]
+hosts_operations = operation_registry(_hosts_endpoints)
+
+
+def page(resources, **pagination):
+    """Return a page in the format returned by a Service Class method."""
+    body = {"meta": {"pagination": pagination}, "resources": resources, "errors": []}
+    return {"status_code": 200, "headers": {}, "body": body}
+
+
+class OffsetSource:
+    """Return pages of RECORDS using an integer offset, refusing offsets past max_window."""
+
+    def __init__(self, delay: float = 0, max_window: int = None, pythonic_errors: bool = False):
+        self.calls = []
+        self.delay = delay
+        self.max_window = max_window
+        self.pythonic_errors = pythonic_errors
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, offset=0, limit=5, **kwargs):
+        with self.lock:
+            self.calls.append(offset)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if self.max_window is not None and offset + limit > self.max_window:
+                if self.pythonic_errors:
+                    raise APIError(code=400, message="Result window is too large")
+                return {"status_code": 400, "headers": {}, "body": {"errors": [{"message": "window"}]}}
+            return page(RECORDS[offset:offset + limit], offset=offset, limit=limit, total=len(RECORDS))
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def token_source(style: str):
+    """Return a method that pages through RECORDS using a cursor token of the provided style."""
+    calls = []
+
+    def method(**kwargs):
+        calls.append(kwargs)
+        position = int(kwargs.get("offset" if style == "scroll" else style, None) or 0)
+        token = str(position + 5) if position + 5 < len(RECORDS) else None
+        pagination = {"total": len(RECORDS)}
+        if style == "scroll":
+            pagination.update({"offset": token or str(position), "expires_at": 1})
+        else:
+            pagination[style] = token
+        return page(RECORDS[position:position + 5], **pagination)
+
+    method.calls = calls
+    return method
+
+
+class TestPaginator:
+    def test_detect_style(self):
+        assert Paginator.detect_style(hosts_operations["QueryDevicesByFilter"]) == "offset"
+        assert Paginator.detect_style(hosts_operations["QueryDevicesByFilterScroll"]) == "scroll"
+        assert Paginator.detect_style(hosts_operations["GetDeviceDetailsV2"]) == "none"
+        assert Paginator.detect_style(None) is None
+        assert Paginator.detect_page_style({"after": "abc"}) == "after"
+        assert Paginator.detect_page_style({"next_token": "abc"}) == "next_token"
+        assert Paginator.detect_page_style({"offset": "abc", "expires_at": 1}) == "scroll"
+        assert Paginator.detect_page_style({"offset": 0, "total": 10}) == "offset"
+        assert Paginator.detect_page_style({}) == "none"
+
+    def test_service_class_operation(self):
+        paginator = Hosts(access_token="not-a-real-token").paginate("query_devices_by_filter_scroll")
+        assert paginator.operation.operation_id == "QueryDevicesByFilterScroll"
+        assert paginator.style == "scroll"
+
+    def test_offset_pages(self):
+        source = OffsetSource()
+        paginator = Paginator(source, operation=hosts_operations["QueryDevicesByFilter"], limit=5)
+        assert list(paginator) == RECORDS
+        assert source.calls == [0, 5, 10, 15, 20]
+        assert paginator.page_count == 5 and paginator.count == paginator.total == len(RECORDS)
+
+    def test_token_styles_detected_from_pages(self):
+        for style in ("after", "next_token", "scroll"):
+            method = token_source(style)
+            paginator = Paginator(method, prefetch=False)
+            assert list(paginator) == RECORDS
+            assert paginator.style == style
+            assert len(method.calls) == 5
+
+    def test_max_pages_and_failures(self):
+        source = OffsetSource()
+        assert list(Paginator(source, limit=5, max_pages=2)) == RECORDS[:10]
+        assert source.calls == [0, 5]
+        failing = OffsetSource(max_window=5)
+        paginator = Paginator(failing, limit=5)
+        assert list(paginator) == RECORDS[:5]
+        # Pagination stops on the failed page, which remains available to the caller.
+        assert paginator.result["status_code"] == 400 and failing.calls == [0, 5]
+
+    def test_prefetch(self):
+        source = OffsetSource()
+        pages = Paginator(source, limit=5).pages()
+        next(pages)
+        # The next page is requested in the background while the caller processes the first.
+        deadline = time.monotonic() + 2
+        while len(source.calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert source.calls == [0, 5]
+        pages.close()
+
+        source = OffsetSource()
+        pages = Paginator(source, limit=5, prefetch=False).pages()
+        next(pages)
+        time.sleep(0.1)
+        assert source.calls == [0]
+        pages.close()
+
+
+class TestParallelPaginator:
+    def test_fan_out(self):
+        source = OffsetSource(delay=0.05)
+        paginator = ParallelPaginator(source, operation=hosts_operations["QueryDevicesByFilter"],
+                                      max_workers=2, limit=5
+                                      )
+        assert list(paginator) == RECORDS
+        assert sorted(source.calls) == [0, 5, 10, 15, 20]
+        # Only max_workers windows are requested at the same time.
+        assert source.peak == 2
+        assert paginator.page_count == 5 and not paginator.capped
+
+    def test_unordered(self):
+        source = OffsetSource()
+        paginator = ParallelPaginator(source, max_workers=4, ordered=False, limit=5)
+        assert sorted(paginator) == sorted(RECORDS)
+
+    def test_window_caps(self):
+        source = OffsetSource()
+        assert list(ParallelPaginator(source, max_offset=12, limit=5)) == RECORDS[:12]
+        # The final window is reduced to end at max_offset.
+        assert sorted(source.calls) == [0, 5, 10]
+        source = OffsetSource()
+        assert list(ParallelPaginator(source, max_pages=3, limit=5)) == RECORDS[:15]
+        for pythonic in (False, True):
+            source = OffsetSource(max_window=10, pythonic_errors=pythonic)
+            paginator = ParallelPaginator(source, max_workers=1, limit=5)
+            # Pagination stops at the last page returned before the offset was refused.
+            assert list(paginator) == RECORDS[:10]
+            assert paginator.capped
+
+    def test_not_fanned_out(self):
+        method = token_source("after")
+        paginator = ParallelPaginator(method, max_workers=4)
+        # Cursor operations are paginated one page at a time.
+        assert list(paginator) == RECORDS
+        assert paginator.style == "after"
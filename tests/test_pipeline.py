@@ -0,0 +1,38 @@
+# test_pipeline.py
+# This class tests the query to details pipeline using mocked methods
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import DetailsPipeline, Paginator
+from falconpy._error import APIError
+
+
+def query(offset=0, limit=10, **kwargs):
+    """Return a page of 25 IDs by offset."""
+    resources = [f"id-{item}" for item in range(offset, min(offset + limit, 25))]
+    meta = {"pagination": {"offset": offset, "limit": limit, "total": 25}}
+    return {"status_code": 200, "headers": {}, "body": {"meta": meta, "resources": resources, "errors": []}}
+
+
+def details(ids=None):
+    """Return the details of every ID, raising like pythonic mode for the second batch."""
+    if "id-10" in ids:
+        raise APIError(code=500, message="Internal server error")
+    return {"status_code": 200, "headers": {}, "body": {"resources": [{"device_id": item} for item in ids]}}
+
+
+class TestDetailsPipeline:
+    def test_failed_batch(self):
+        with ThreadPoolExecutor(2) as pool:
+            for executor in (None, pool):
+                pipeline = DetailsPipeline(Paginator(query, limit=10, prefetch=False), details, executor=executor)
+                records = sorted(record["device_id"] for record in pipeline)
+                # The batch that raised is counted as failed, the remaining batches are still returned.
+                assert records == sorted(f"id-{item}" for item in [*range(10), *range(20, 25)])
+                assert pipeline.batches == 3 and pipeline.count == 15 and pipeline.failed == 10
+                assert pipeline.errors == [{"message": "Internal server error", "code": 500}]
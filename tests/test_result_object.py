@@ -1,6 +1,7 @@
 """
 test_results.py -  This class tests the Results class
 """
+import io
 import os
 import sys
 import pytest
@@ -30,10 +31,12 @@ from falconpy import (
     UnnecessaryEncodingUsed,
     DeprecatedOperation,
     DeprecatedClass,
-    SDKDeprecationWarning
+    SDKDeprecationWarning,
+    StreamedResult
     )
 from falconpy._result._base_dictionary import UnsupportedPythonVersion
 from falconpy._result._result import BaseResult
+from requests import Response
 
 auth = Authorization.TestAuthorization()
 config = auth.getConfigObject()
@@ -827,3 +830,61 @@ class TestResultNextCoverage:
         )
         val = next(r)
         assert val == "item1"
+
+
+class TestResultLazyParsing:
+    """Cover lazily created Result components."""
+
+    def test_components_created_on_first_access(self):
+        """Test the body is wrapped once and the legacy form is a view of the received body."""
+        resources = [{"id": "item1"}]
+        r = Result(
+            status_code=200,
+            headers={"Content-Type": "application/json"},
+            body={"meta": {"trace_id": "abc"}, "resources": resources, "errors": []}
+        )
+        full = r.full_return
+        assert full["body"]["resources"] is resources and full["headers"] == {"Content-Type": "application/json"}
+        assert r.meta.trace_id == "abc" and r.resources.data == resources
+        assert r.full_return == full and r.content_type == "application/json"
+
+    def test_legacy_form_matches_components(self):
+        """Test the view of the received body matches the form created by the components."""
+        headers = {"Content-Type": "application/json"}
+        for body in ({"resources": "abc", "meta": {}, "errors": []}, {"resources": 0, "meta": {"a": 1}}):
+            view = Result(status_code=200, headers=headers, body=body).full_return
+            parsed = Result(status_code=200, headers=headers, body=body)
+            assert parsed.data == [] and view == parsed.full_return
+        with pytest.raises(ValueError):
+            _ = Result(full={"status_code": 200, "headers": headers, "body": "not json"}).full_return
+        assert Result(full={"status_code": 200, "headers": headers, "body": " "}).full_return["body"] == {}
+
+
+class TestStreamedResult:
+    """Cover incremental decoding of streamed responses."""
+
+    @staticmethod
+    def streamed(content: bytes, content_type: str = "application/json") -> Response:
+        """Create a streamed response containing the provided body."""
+        response = Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = content_type
+        response.raw = io.BytesIO(content)
+        return response
+
+    def test_streamed_json_document(self):
+        """Test records are decoded across chunk boundaries and the remaining keys are retained."""
+        body = b'{"meta": {"pagination": {"total": 3}}, "resources": [12.5e3, {"id": "\xc3\xa9"}, [1]], "errors": []}'
+        with StreamedResult(self.streamed(body), chunk_size=1) as result:
+            assert list(result) == [12500.0, {"id": "\u00e9"}, [1]]
+        assert result.meta.total == 3 and result.errors.data == [] and result.count == 3
+
+    def test_streamed_ndjson(self):
+        """Test newline delimited JSON is decoded one line at a time."""
+        result = StreamedResult(self.streamed(b'{"a": 1}\n\n{"a": 2}\n', "application/x-ndjson"))
+        assert list(result) == [{"a": 1}, {"a": 2}] and result.ndjson
+
+    def test_streamed_truncated(self):
+        """Test a truncated body raises a decoding error."""
+        with pytest.raises(ValueError):
+            list(StreamedResult(self.streamed(b'{"resources": [1, 2'), chunk_size=4))
@@ -126,6 +126,19 @@ class TestSensorDownload():
         else:
             return False
 
+    def _download_sensor_stream(self):
+        sha_id = self._get_multiple_shas()[0]
+        received = []
+        result = sensor_download_client.download_file("DownloadSensorInstallerByIdV2",
+                                                 "sensor_stream.rpm",
+                                                 expected_sha256=sha_id,
+                                                 progress=lambda size, total: received.append(size),
+                                                 id=sha_id
+                                                 )
+        if os.path.exists("sensor_stream.rpm"):
+            os.remove("sensor_stream.rpm")
+        return bool(result.ok and result.sha256 == sha_id.lower() and received[-1] == result.size)
+
     def test_download_windows_sensor(self):
         assert self._download_sensor(style="v1") is True
 
@@ -173,3 +186,6 @@ class TestSensorDownload():
 
     def test_download_sensor_v3(self):
         assert self._download_sensor_v3() is True
+
+    def test_download_sensor_stream(self):
+        assert self._download_sensor_stream() is True
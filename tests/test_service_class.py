@@ -3,6 +3,7 @@ test_results.py -  This class tests Service Class functionality
 """
 import os
 import sys
+import asyncio
 import pytest
 from json import loads
 from time import time
@@ -16,6 +17,7 @@ sys.path.append(os.path.abspath('src'))
 # Classes to test - manually imported from sibling folder
 from falconpy import (
     Hosts,
+    RateLimiter,
     OAuth2,
     BaseServiceClass,
     FunctionalityNotImplemented,
@@ -28,7 +30,12 @@ from falconpy import (
     InvalidBaseURL,
     Workflows,
     CloudConnectAWS,
-    DeprecatedClass
+    DeprecatedClass,
+    RetryPolicy,
+    ResponseCache,
+    Paginator,
+    ParallelPaginator,
+    PageSizeTuner
     )
 
 auth = Authorization.TestAuthorization()
@@ -531,3 +538,146 @@ class TestServiceClass:
 
         assert test_hosts.pythonic == True
         assert test_hosts.auth_object.pythonic == False
+
+    @rate_limited
+    @not_supported
+    def test_shared_connection_pool(self):
+        """Test Service Classes sharing an auth_object reuse the same connection pool."""
+        auth_obj = OAuth2(creds=config.creds, debug=_DEBUG, pool_maxsize=4)
+        with Hosts(auth_object=auth_obj) as test_hosts:
+            assert test_hosts.query_devices_by_filter(limit=1)["status_code"] in AllowedResponses
+            shared = Hosts(auth_object=auth_obj)
+            assert shared.auth_object.connection_pool is test_hosts.auth_object.connection_pool
+            assert test_hosts.auth_object.connection_pool.sessions == 1
+            assert test_hosts.auth_object.connection_pool.pool_maxsize == 4
+        # A provided auth_object may be in use elsewhere, its pool is left open.
+        assert auth_obj.connection_pool.sessions == 1
+        with Hosts(creds=config.creds, debug=_DEBUG, pool_maxsize=4) as owned_hosts:
+            assert owned_hosts.query_devices_by_filter(limit=1)["status_code"] in AllowedResponses
+        assert owned_hosts.auth_object.connection_pool.sessions == 0
+
+    def test_credential_rate_limiter(self):
+        """Test Service Classes sharing a token created with the same credentials share a rate limiter."""
+        test_hosts = Hosts(creds=config.creds, debug=_DEBUG, shared_token=True)
+        separate = Hosts(creds=config.creds, debug=_DEBUG, shared_token=True)
+        assert separate.auth_object is not test_hosts.auth_object
+        assert separate.auth_object.rate_limiter is test_hosts.auth_object.rate_limiter
+        unshared = Hosts(creds=config.creds, debug=_DEBUG)
+        assert unshared.auth_object.rate_limiter is not test_hosts.auth_object.rate_limiter
+
+    def test_shared_rate_limiter(self):
+        """Test Service Classes sharing an auth_object track and pace against the same rate limit."""
+        auth_obj = OAuth2(creds=config.creds, debug=_DEBUG)
+        test_hosts = Hosts(auth_object=auth_obj)
+        shared = Hosts(auth_object=auth_obj)
+        assert shared.auth_object.rate_limiter is test_hosts.auth_object.rate_limiter
+        result = test_hosts.query_devices_by_filter(limit=1)
+        assert result["status_code"] in AllowedResponses
+        limiter = auth_obj.rate_limiter
+        if "X-RateLimit-Limit" in result["headers"]:
+            assert limiter.limit == int(result["headers"]["X-RateLimit-Limit"])
+        assert limiter.in_flight == 0
+        limiter.update({"X-RateLimit-Limit": "120", "X-RateLimit-Remaining": "0", "Retry-After": "1"}, 429)
+        assert limiter.headroom == 0 and 0 < limiter.retry_after <= 1
+        assert limiter.reserve_slot() > 0
+        limiter.release()
+
+    def test_rate_limiter_headroom(self):
+        """Test every remaining request is sent immediately before pacing starts."""
+        limiter = RateLimiter()
+        limiter.update({"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "2"}, 200)
+        assert [limiter.reserve_slot() for _ in range(2)] == [0.0, 0.0]
+        assert limiter.reserve_slot() > 0 and limiter.in_flight == 3
+
+    def test_retry_policy(self):
+        """Test retry policies can be provided per auth_object, Service Class and request."""
+        policy = RetryPolicy(max_attempts=2, backoff_factor=0)
+        auth_obj = OAuth2(creds=config.creds, debug=_DEBUG, pythonic=True, retry_policy=policy)
+        test_hosts = Hosts(auth_object=auth_obj)
+        assert test_hosts.retry_policy is policy
+        assert not policy.allowed("POST") and RetryPolicy(unsafe=True).allowed("POST")
+        no_retry = RetryPolicy(max_attempts=1)
+        assert Hosts(auth_object=auth_obj, retry_policy=no_retry).retry_policy is no_retry
+        result = test_hosts.query_devices_by_filter(limit=1, retry_policy=no_retry)
+        assert result.status_code in AllowedResponses and result.retries == 0
+        result = test_hosts.query_devices_by_filter(limit=1)
+        assert result.status_code in AllowedResponses and result.retries in [0, 1]
+
+    def test_response_cache(self):
+        """Test read only operation responses are cached per credential, and writes never are."""
+        cache = ResponseCache(ttl=60, ttls={"QueryDevicesByFilterScroll": 0}, max_entries=2)
+        auth_obj = OAuth2(creds=config.creds, debug=_DEBUG, response_cache=cache)
+        test_hosts = Hosts(auth_object=auth_obj)
+        first = test_hosts.query_devices_by_filter(limit=1, sort="hostname.asc")
+        second = test_hosts.query_devices_by_filter(sort="hostname.asc", limit=1)
+        assert first["status_code"] in AllowedResponses
+        if first["status_code"] == 200:
+            assert cache.hits == 1 and first["body"] == second["body"]
+        assert not cache.cacheable("POST", "GetDeviceDetailsV2")
+        assert not cache.cacheable("GET", "QueryDevicesByFilterScroll")
+        assert cache.key("Op", "url", {"a": 1, "b": None}) == cache.key("Op", "url", {"a": "1"})
+        assert cache.key("Op", "url", scope="one") != cache.key("Op", "url", scope="two")
+        cache.clear()
+        assert cache.entries == 0 and cache.size == 0
+
+    def test_paginate(self):
+        """Test paginated operations are detected from the endpoint definition and iterated lazily."""
+        test_hosts = Hosts(creds=config.creds, debug=_DEBUG)
+        scroll = test_hosts.paginate("query_devices_by_filter_scroll", limit=2, max_pages=2)
+        assert scroll.style == "scroll" and scroll.operation.operation_id == "QueryDevicesByFilterScroll"
+        device_ids = list(scroll)
+        assert len(device_ids) == scroll.count <= 4 and scroll.page_count <= 2
+        offset = test_hosts.paginate(test_hosts.query_devices_by_filter, limit=1, max_pages=1, prefetch=False)
+        assert offset.style == "offset"
+        for page in offset.pages():
+            assert page["status_code"] in AllowedResponses
+        assert Paginator.detect_style(None) is None
+        assert Paginator.page_content({"status_code": 200, "body": {"resources": ["a"]}}) == (200, {}, ["a"])
+
+    def test_parallel_paginate(self):
+        """Test the remaining offset windows are requested concurrently once the total is known."""
+        test_hosts = Hosts(creds=config.creds, debug=_DEBUG)
+        sequential = list(test_hosts.paginate("query_devices_by_filter", limit=1, max_pages=3, sort="device_id.asc"))
+        parallel = test_hosts.paginate("query_devices_by_filter", parallel=True, limit=1, max_pages=3, sort="device_id.asc")
+        assert isinstance(parallel, ParallelPaginator) and parallel.max_workers == 4 and parallel.ordered
+        assert list(parallel) == sequential and not parallel.capped
+        unordered = test_hosts.paginate("query_devices_by_filter", parallel=True, ordered=False, limit=1, max_offset=2)
+        assert len(list(unordered)) <= 2 and unordered.max_offset == 2
+
+    def test_adaptive_paginate(self):
+        """Test the page size is tuned within the declared range and byte budget."""
+        test_hosts = Hosts(creds=config.creds, debug=_DEBUG)
+        adaptive = test_hosts.paginate("query_devices_by_filter_scroll", adaptive=True, max_bytes=4096, limit=1, max_pages=3)
+        assert isinstance(adaptive.tuner, PageSizeTuner) and adaptive.tuner.max_bytes == 4096
+        assert len(list(adaptive)) == adaptive.count and adaptive.tuner.minimum <= adaptive.tuner.limit <= adaptive.tuner.maximum
+        tuner = PageSizeTuner(limit=100, target_latency=1.0)
+        assert tuner.observe(100, 0.1) == 200 and tuner.shrink() and tuner.limit == 100
+
+    def test_map(self):
+        """Test one operation is called concurrently for every argument set provided."""
+        test_hosts = Hosts(creds=config.creds, debug=_DEBUG, pythonic=True)
+        results = test_hosts.map("query_devices_by_filter", [{"limit": 1, "offset": offset} for offset in range(3)])
+        assert len(results) == 3 and all(isinstance(result, Result) for result in results)
+        streamed = test_hosts.imap(test_hosts.query_devices_by_filter, [{"limit": 1}, {"limit": 2}], max_workers=2, ordered=False)
+        assert sorted(result.meta.pagination["limit"] for result in streamed) == [1, 2]
+
+    def test_stream(self):
+        """Test records of a streamed response are yielded as they are decoded."""
+        test_hosts = Hosts(creds=config.creds, debug=_DEBUG)
+        with test_hosts.stream("query_devices_by_filter_combined", limit=2) as results:
+            devices = list(results)
+        assert results.status_code in AllowedResponses and len(devices) == results.count <= 2
+        assert results.meta.pagination.get("limit", 2) == 2
+
+    @rate_limited
+    @not_supported
+    def test_async_service_class(self):
+        """Test awaitable Service Class methods run concurrently within a single event loop."""
+        test_hosts = Hosts(creds=config.creds, debug=_DEBUG)
+
+        async def fan_out():
+            return await asyncio.gather(*[test_hosts.aio.query_devices_by_filter(limit=1) for _ in range(3)])
+
+        results = asyncio.run(fan_out())
+        assert len(results) == 3
+        assert all(result["status_code"] in AllowedResponses for result in results)
@@ -4,10 +4,11 @@
 import os
 import sys
 import pytest
+from itertools import islice
 # Authentication via the test_authorization.py
 from tests import test_authorization as Authorization
 # Classes to test - manually imported from sibling folder
-from falconpy import SpotlightVulnerabilities
+from falconpy import SpotlightVulnerabilities, ShardedScan
 # Import our sibling src folder into the path
 sys.path.append(os.path.abspath('src'))
 
@@ -92,6 +93,14 @@ class TestSpotlight:
     def test_queryVulnerabilities_combined(self):
         assert self.spotlight_query_vulnerabilities_combined() is True
 
+    def test_scan_vulnerabilities_combined(self):
+        scan = falcon.scan("query_vulnerabilities_combined", "created_timestamp",
+                           "2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z",
+                           shards=2, shard_size=5, limit=5
+                           )
+        assert len(list(islice(scan, 10))) <= 10 and scan.max_workers == 2
+        assert ShardedScan.split((0, 10), 3) == [(0, 3), (3, 7), (7, 10)]
+
     def test_queryInstalledPatches_combined(self):
         assert self.spotlight_query_installed_patches_combined() is True
 
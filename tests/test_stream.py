@@ -0,0 +1,104 @@
+# test_stream.py
+# This class tests incremental decoding of streamed responses using mocked responses
+
+import io
+import json
+import os
+import sys
+import pytest
+from requests import Response
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Hosts, Result, StreamedResult
+
+RECORDS = [{"id": f"id-{item}", "name": "café", "score": item * 1.5} for item in range(200)]
+
+
+def streamed(content: bytes, content_type: str = "application/json") -> Response:
+    """Create a streamed response containing the provided body."""
+    response = Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = content_type
+    response.raw = io.BytesIO(content)
+    return response
+
+
+def document(**keys) -> bytes:
+    """Return a Falcon API response body containing RECORDS."""
+    body = {"meta": {"pagination": {"total": len(RECORDS)}}, "resources": RECORDS, **keys}
+    return json.dumps(body).encode("utf-8")
+
+
+class TestStreamedResult:
+    def test_json_document(self):
+        for chunk_size in (1, 7, 65536):
+            result = StreamedResult(streamed(document(errors=[])), chunk_size=chunk_size)
+            assert not result.ndjson
+            assert list(result) == RECORDS
+            assert result.count == len(RECORDS)
+            assert result.meta.total == len(RECORDS) and result.errors.data == []
+
+    def test_keys_surrounding_resources(self):
+        body = document(errors=[{"code": 500, "message": "partial"}])
+        result = StreamedResult(streamed(body), chunk_size=16)
+        first = next(result)
+        # Keys preceding the resources are available with the first record, those following it once complete.
+        assert first == RECORDS[0] and result.meta.total == len(RECORDS)
+        assert result.errors.data == []
+        assert len(list(result)) == len(RECORDS) - 1
+        assert result.errors.data == [{"code": 500, "message": "partial"}]
+        assert "resources" not in result.body
+
+    def test_records_decoded_incrementally(self):
+        response = streamed(document(errors=[]))
+        result = StreamedResult(response, chunk_size=64)
+        next(result)
+        # Only the portion of the body required for the first record has been read.
+        assert response.raw.tell() < len(response.raw.getvalue()) / 10
+
+    def test_values_split_across_chunks(self):
+        body = json.dumps([12345678, -0.5e10, "é中", True, None, {"a": [1, 2]}]).encode("utf-8")
+        assert list(StreamedResult(streamed(body), chunk_size=1)) == [12345678, -0.5e10, "é中", True, None, {"a": [1, 2]}]
+
+    def test_ndjson(self):
+        body = b"".join(json.dumps(record).encode("utf-8") + b"\n\n" for record in RECORDS[:5])
+        result = StreamedResult(streamed(body, "application/x-ndjson"), chunk_size=3)
+        assert list(result) == RECORDS[:5] and result.ndjson
+        # Bodies that are not described as JSON documents are decoded one line at a time.
+        assert StreamedResult(streamed(b'{"a": 1}\n{"a": 2}', "text/plain")).ndjson
+        assert not StreamedResult(streamed(b'{"a": 1}\n{"a": 2}', "text/plain"), ndjson=False).ndjson
+
+    def test_truncated(self):
+        with pytest.raises(ValueError):
+            list(StreamedResult(streamed(b'{"resources": [{"id": 1}, {"id": 2'), chunk_size=4))
+        with pytest.raises(ValueError):
+            list(StreamedResult(streamed(b'{"meta": {}, "resources": [1, 2]'), chunk_size=4))
+
+    def test_closed(self):
+        response = streamed(document())
+        with StreamedResult(response) as result:
+            next(result)
+        assert response.raw.closed
+        response = streamed(document())
+        list(StreamedResult(response))
+        assert response.raw.closed
+
+    def test_not_streamed(self):
+        failed = {"status_code": 400, "headers": {}, "body": {"errors": [{"message": "bad"}], "resources": []}}
+        result = StreamedResult(failed)
+        assert list(result) == [] and result.status_code == 400 and result.errors.data == [{"message": "bad"}]
+        returned = Result(full={"status_code": 200, "headers": {"X-Test": "1"}, "body": {"resources": [1, 2]}})
+        assert list(StreamedResult(returned)) == [1, 2]
+
+    def test_service_class_stream(self):
+        calls = []
+
+        def method(**kwargs):
+            calls.append(kwargs)
+            return streamed(document())
+
+        with Hosts(access_token="not-a-real-token").stream(method, ids=["1"]) as results:
+            assert list(results) == RECORDS
+        assert calls == [{"stream": True, "ids": ["1"]}]
@@ -0,0 +1,102 @@
+# test_tuner.py
+# This class tests adaptive page sizes using mocked pages
+
+import os
+import sys
+import pytest
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Hosts, Paginator, PageSizeTuner
+from falconpy._endpoint import operation_registry
+from falconpy._service_class._tuner import SMOOTHING_FACTOR
+
+ENDPOINTS = [
+    ["DeclaredLimit", "GET", "/declared/v1", "Declares the limit range.", "testing",
+     [{"name": "limit", "type": "integer", "in": "query", "minimum": 10, "maximum": 500}]
+     ],
+    ["UndeclaredLimit", "GET", "/undeclared/v1", "Does not declare a limit range.", "testing",
+     [{"name": "limit", "type": "integer", "in": "query"}]
+     ]
+    ]
+operations = operation_registry(ENDPOINTS)
+
+
+def source(total=2000, max_limit=None, calls=None):
+    """Return a method paging through total records by offset, refusing limits over max_limit."""
+    def method(offset=0, limit=100, **kwargs):
+        if calls is not None:
+            calls.append({"offset": offset, "limit": limit, **kwargs})
+        if max_limit and limit > max_limit:
+            return {"status_code": 400, "headers": {}, "body": {"errors": [{"message": "limit"}], "resources": []}}
+        resources = list(range(offset, min(offset + limit, total)))
+        meta = {"pagination": {"offset": offset, "limit": limit, "total": total}}
+        return {"status_code": 200, "headers": {}, "body": {"meta": meta, "resources": resources, "errors": []}}
+
+    return method
+
+
+class TestPageSizeTuner:
+    def test_growth_and_shrink(self):
+        tuner = PageSizeTuner(operations["DeclaredLimit"], limit=100, target_latency=1.0)
+        # Fast pages double the limit, and never exceed the declared maximum.
+        assert tuner.observe(100, 0.01) == 200
+        assert tuner.observe(200, 0.01) == 400
+        assert tuner.observe(400, 0.01) == 500
+        # Slow pages halve the limit.
+        assert tuner.observe(500, 10.0) == 250
+        assert tuner.shrink() and tuner.limit == 125
+        for _ in range(5):
+            tuner.shrink()
+        # The limit stays within the declared minimum.
+        assert tuner.limit == 10 and not tuner.shrink()
+
+    def test_average(self):
+        assert PageSizeTuner.average(None, 4.0) == 4.0
+        assert PageSizeTuner.average(2.0, 4.0) == 2.0 + SMOOTHING_FACTOR * 2.0
+
+    def test_refused_limit(self):
+        tuner = PageSizeTuner(operations["UndeclaredLimit"], limit=100)
+        assert not tuner.refused()
+        tuner.observe(100, 0.001)
+        assert tuner.limit == 200
+        # The grown limit was refused, return to the last limit that succeeded and stop growing.
+        assert tuner.refused() and tuner.limit == 100 and tuner.maximum == 100
+        assert tuner.observe(100, 0.001) == 100
+        declared = PageSizeTuner(operations["DeclaredLimit"], limit=100)
+        declared.observe(100, 0.001)
+        assert not declared.refused()
+
+    def test_max_bytes(self):
+        tuner = PageSizeTuner(operations["DeclaredLimit"], limit=400, max_bytes=10000)
+        # The first page is requested using the minimum until the size of a record is known.
+        assert tuner.limit == 10
+        assert tuner.observe(10, 0.001, size=1000) == 100
+        assert tuner.bytes_per_record == 100
+
+
+class TestAdaptivePagination:
+    def test_refused_limit_recovered(self):
+        calls = []
+        tuner = PageSizeTuner(operations["UndeclaredLimit"], limit=100)
+        paginator = Paginator(source(max_limit=300, calls=calls), tuner=tuner, prefetch=False)
+        assert list(paginator) == list(range(2000))
+        assert tuner.maximum == 200
+        assert max(call["limit"] for call in calls if call["limit"] <= 300) == 200
+
+    def test_target_latency_not_provided(self):
+        falcon = Hosts(access_token="not-a-real-token")
+        for parallel in (False, True):
+            calls = []
+            paginator = falcon.paginate(source(total=50, calls=calls), parallel=parallel, target_latency=0.5, limit=10)
+            assert list(paginator) == list(range(50))
+            assert calls and all("target_latency" not in call for call in calls)
+
+    @pytest.mark.parametrize("max_bytes", [5000, None])
+    def test_first_page(self, max_bytes):
+        calls = []
+        falcon = Hosts(access_token="not-a-real-token")
+        paginator = falcon.paginate(source(total=50, calls=calls), adaptive=True, max_bytes=max_bytes, limit=20)
+        assert list(paginator) == list(range(50))
+        assert calls[0]["limit"] == (1 if max_bytes else 20)
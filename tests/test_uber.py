@@ -1,6 +1,7 @@
 # test_uber_api_complete.py
 # This class tests the uber class
 
+import asyncio
 import json
 import os
 import sys
@@ -54,6 +55,14 @@ class TestUber:
                 _success = True
         assert _success
 
+    def test_uber_async_command(self):
+        async def fan_out():
+            return await asyncio.gather(falcon.acommand("QueryDevicesByFilterScroll", parameters={"limit": 1}),
+                                        falcon.acommand(api_operation="QueryDevicesByFilter", parameters={"limit": 1})
+                                        )
+        results = asyncio.run(fan_out())
+        assert all(result["status_code"] in AllowedResponses for result in results)
+
     def test_uber_context_with_pythonic_error(self):
         _success = False
         test_uber = APIHarnessV2(client_id=config["falcon_client_id"],
@@ -395,6 +404,19 @@ class TestUber:
 
         assert bool(temp_falcon.debug)
 
+    def test_uber_custom_commands(self):
+        # Operations added to the list of commands are available to the command method
+        temp_falcon = APIHarnessV2(access_token="not_a_token", base_url=config["falcon_base_url"])
+        assert temp_falcon.operations.get("CustomQueryDevices", None) is None
+        custom = list(temp_falcon.operations.get("QueryDevicesByFilter").endpoint)
+        custom[0] = "CustomQueryDevices"
+        temp_falcon.commands.append(custom)
+        try:
+            assert temp_falcon.operations.get("CustomQueryDevices").route == "/devices/queries/devices/v1"
+        finally:
+            temp_falcon.commands.remove(custom)
+        assert temp_falcon.operations.get("CustomQueryDevices", None) is None
+
     def test_uber_token_generate(self):
         assert(bool(falcon.command("oauth2AccessToken")["status_code"] == 201))
 
@@ -419,6 +441,20 @@ class TestUber:
             _success = True
         assert _success
 
+    def test_uber_batch(self):
+        new_falcon = APIHarnessV2(access_token=falcon.token_value,
+                            base_url=config["falcon_base_url"],
+                            debug=_DEBUG,
+                            pythonic=True
+                            )
+        results = new_falcon.batch(["QueryDevicesByFilter",
+                                    ("GetDeviceDetails", {"ids": "12345678"}),
+                                    {"api_operation": "QueryDevicesByFilter"},
+                                    "NotARealOperation"
+                                    ])
+        assert len(results) == 4 and results[0] is results[2]
+        assert results[1].status_code >= 400 and results[3].status_code == 418
+
 
 _auth = Authorization.TestAuthorization()
 _auth.getConfig()
@@ -492,7 +528,7 @@ class _FakeResponse:
         self.status_code = status_code
         self.headers = headers or {"Content-Type": "application/json"}
         self._body = body or {"meta": {"trace_id": "abc"}, "resources": [], "errors": []}
-        self.content = content or b'{"resources":[]}'
+        self.content = content or json.dumps(self._body).encode("utf-8")
 
     def json(self):
         return self._body
@@ -509,6 +545,7 @@ class TestPerformRequestMockedCoverage:
             _FakeResponse(200, {"meta": {"trace_id": "abc"}, "resources": [], "errors": []}),
         ])
         monkeypatch.setattr(_funcs.requests, "request", lambda *a, **kw: next(responses))
+        monkeypatch.setattr(_funcs.requests.Session, "request", lambda *a, **kw: next(responses))
         uber = APIHarnessV2(
             client_id="fake_id",
             client_secret="fake_secret",
@@ -527,6 +564,7 @@ class TestPerformRequestMockedCoverage:
                           content=b"streaming data"),
         ])
         monkeypatch.setattr(_funcs.requests, "request", lambda *a, **kw: next(responses))
+        monkeypatch.setattr(_funcs.requests.Session, "request", lambda *a, **kw: next(responses))
         uber = APIHarnessV2(
             client_id="fake_id",
             client_secret="fake_secret",
@@ -477,7 +477,7 @@ class _FakeResponse:
         self.status_code = status_code
         self.headers = headers or {"Content-Type": "application/json"}
         self._body = body or {"meta": {"trace_id": "abc"}, "resources": [], "errors": []}
-        self.content = content or b'{"resources":[]}'
+        self.content = content or json.dumps(self._body).encode("utf-8")
 
     def json(self):
         return self._body
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Compare the JSON codecs supported by FalconPy.
+
+Encodes and decodes representative API payloads with every supported JSON
+library that is installed (orjson, ujson, simplejson and the standard library)
+and reports the average time per operation. Decoding is performed directly
+from bytes, the same way response bodies are decoded by the SDK.
+
+Must be executed from the repository root, or provide the source location:
+    python3 util/json_codec_benchmark.py -s src -n 20
+"""
+import sys
+from argparse import ArgumentParser, RawTextHelpFormatter
+from timeit import timeit
+
+
+def device_record(position: int) -> dict:
+    """Return a record resembling a host returned by a combined devices operation."""
+    return {
+        "device_id": f"{position:032x}",
+        "cid": "0123456789abcdef0123456789abcdef",
+        "hostname": f"HOST-{position:06d}",
+        "platform_name": "Windows",
+        "os_version": "Windows 11",
+        "agent_version": "7.10.17706.0",
+        "first_seen": "2024-01-01T00:00:00Z",
+        "last_seen": "2024-06-01T12:34:56Z",
+        "local_ip": f"10.0.{position % 256}.{position % 200}",
+        "mac_address": "00-11-22-33-44-55",
+        "status": "normal",
+        "tags": ["FalconGroupingTags/Production", "SensorGroupingTags/Servers"],
+        "policies": [{"policy_type": "prevention", "policy_id": f"{position:032x}", "applied": True,
+                      "settings_hash": "a1b2c3d4", "assigned_date": "2024-01-01T00:00:00.123456Z"}],
+        "device_policies": {"prevention": {"applied": True, "rule_groups": []},
+                            "sensor_update": {"applied": True, "uninstall_protection": "ENABLED"}},
+        "meta": {"version": str(position), "version_string": f"{position}:123456"},
+        "chassis_type_desc": "Laptop",
+        "connection_ip": f"10.0.{position % 256}.1",
+        "reduced_functionality_mode": "no",
+        "kernel_version": "10.0.22631.3447",
+        "cpu_signature": 591594,
+        "system_manufacturer": "Dell Inc.",
+    }
+
+
+def payloads() -> dict:
+    """Return the payloads used for the comparison."""
+    combined = {"meta": {"query_time": 0.123, "pagination": {"offset": "abc", "limit": 5000, "total": 98000},
+                         "powered_by": "device-api", "trace_id": "00000000-0000-0000-0000-000000000000"},
+                "resources": [device_record(pos) for pos in range(5000)],
+                "errors": []
+                }
+    query = {"meta": {"query_time": 0.01, "pagination": {"offset": 0, "limit": 5000, "total": 98000}},
+             "resources": [f"{pos:032x}" for pos in range(5000)],
+             "errors": []
+             }
+    events = [{"event": {"message": f"Event number {pos}", "severity": pos % 5, "timestamp": 1700000000 + pos,
+                         "attributes": {"user": f"user{pos}", "action": "login", "success": bool(pos % 2)}},
+               "fields": {"source": "benchmark"}} for pos in range(1000)]
+    small = {"meta": {"query_time": 0.001}, "resources": [device_record(0)], "errors": []}
+
+    return {"Combined page (5,000 hosts)": combined,
+            "Query page (5,000 IDs)": query,
+            "Ingest batch (1,000 events)": events,
+            "Single entity": small
+            }
+
+
+def benchmark(source: str, iterations: int):
+    """Time every installed JSON codec against the representative payloads."""
+    sys.path.insert(0, source)
+    from falconpy import JSONCodec  # pylint: disable=C0415
+    from falconpy._util._codec import JSON_CODECS  # pylint: disable=C0415
+    codecs = []
+    for name in JSON_CODECS:
+        try:
+            codecs.append(JSONCodec(name))
+        except ImportError:
+            print(f"{name} is not installed, skipping.")
+    print(f"{'Payload':<30}{'Codec':<12}{'Size (KB)':>12}{'Decode (ms)':>14}{'Encode (ms)':>14}")
+    for label, payload in payloads().items():
+        for codec in codecs:
+            encoded = codec.dumps(payload)
+            decode = timeit(lambda codec=codec, encoded=encoded: codec.loads(encoded), number=iterations)
+            encode = timeit(lambda codec=codec, payload=payload: codec.dumps(payload), number=iterations)
+            print(f"{label:<30}{codec.name:<12}{len(encoded) / 1024:>12,.1f}"
+                  f"{decode / iterations * 1000:>14,.3f}{encode / iterations * 1000:>14,.3f}"
+                  )
+
+
+parser = ArgumentParser(description=__doc__, formatter_class=RawTextHelpFormatter)
+parser.add_argument("-s", "--source", help="Location of the package source folder", default="src", required=False)
+parser.add_argument("-n", "--iterations", help="Number of iterations per measurement", default=20, type=int)
+args = parser.parse_args()
+benchmark(args.source, args.iterations)